@@ -0,0 +1,287 @@
+"""
+Render throughput benchmarks for tablebuilder.
+
+    python benchmarks/bench_render.py --quick
+    python benchmarks/bench_render.py --output bench_output.json --baseline benchmarks/baseline.json
+    python benchmarks/bench_render.py --update-baseline
+
+Every case renders a generated table into a null writer. The rows per second of the median of `--repeat` runs,
+the peak traced memory of one extra run and a score (rows per second times the median time of a fixed reference
+workload, measured alongside, so it holds across machines and load) are written to `--output` as JSON. Cases of
+fewer than 1000 rows are timed for longer, a single call is too short to measure. If a baseline file exists the
+run fails (exit code 1) when a case scores lower, or uses more memory, than its baseline by more than
+`--tolerance`.
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tablebuilder import Table, TableSeparator, TableStats, resolve_column_widths_and_borders, wrap_line  # noqa
+
+timer = getattr(time, "perf_counter", time.time)
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore et dolore "
+    "magna aliqua ut enim ad minim veniam quis nostrud exercitation ullamco laboris nisi aliquip ex ea commodo"
+).split(" ")
+
+SIZES = [10, 1000, 100000, 1000000]
+QUICK_SIZES = [10, 1000, 10000]
+
+# name: (columns, words per cell, column width spec, unicode borders, largest size)
+SHAPES = {
+    "narrow-exact": (3, (1, 3), 0, False, 1000000),
+    "narrow-none": (3, (1, 3), None, False, 100000),
+    "narrow-int": (3, (1, 3), 12, False, 100000),
+    "narrow-float": (3, (1, 3), 30.0, False, 100000),
+    "narrow-unicode": (3, (1, 3), 0, True, 100000),
+    "wide-exact": (20, (1, 2), 0, False, 100000),
+    "wide-none": (20, (1, 2), None, False, 100000),
+    "wrap-heavy": (3, (20, 60), None, False, 100000),
+}
+
+
+class NullWriter(object):
+    def __init__(self):
+        self.size = 0
+
+    def write(self, string):
+        self.size += len(string)
+
+
+def build_rows(count, columns, words, seed=0):
+    generator = random.Random(seed)
+    rows = []
+    for index in range(count):
+        if index and index % 1000 == 0:
+            rows.append(TableSeparator())
+        rows.append([
+            " ".join(generator.choice(WORDS) for word in range(generator.randint(*words)))
+            for column in range(columns)
+        ])
+    return rows
+
+
+def build_table(shape, count):
+    columns, words, width, unicode_borders, largest = SHAPES[shape]
+    table = Table(terminal_width=160, column_widths=[width] * columns)
+    table.headers = ["Column %d" % index for index in range(columns)]
+    table.rows = build_rows(count, columns, words)
+    if unicode_borders:
+        table.borders.horizontal_char = u'━'
+        table.borders.vertical_char = u'┃'
+        table.borders.crossing_char = u'╋'
+    return table
+
+
+def measure(function, repeat, min_time=0.1):
+    """
+    Median per-call wall time of `repeat` runs, each calling `function` often enough to take at least `min_time`,
+    with the garbage collector off, the peak traced memory of one more call and the median time of `reference`
+    measured alongside
+    :rtype: tuple[float, int, float]
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        elapsed, loops = calibrate(function, min_time)
+        baseline, baseline_loops = calibrate(reference, min_time / 4)
+        times, baselines = [elapsed], [baseline]
+        for i in range(repeat - 1):
+            start = timer()
+            for j in range(loops):
+                function()
+            times.append((timer() - start) / loops)
+            start = timer()
+            for j in range(baseline_loops):
+                reference()
+            baselines.append((timer() - start) / baseline_loops)
+    finally:
+        gc.enable()
+
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return median(times), peak, median(baselines)
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def settings(count, repeat):
+    """
+    Runs and minimum time per run of a case: small cases run for longer, the largest ones at most 3 times
+    :rtype: tuple[int, float]
+    """
+    if count < 1000:
+        return repeat, 1.0
+    if count >= 100000:
+        return min(repeat, 3), 0.1
+    return repeat, 0.1
+
+
+def reference():
+    """
+    A fixed amount of plain string work, timed next to every case so results can be compared across machines
+    and load
+    """
+    for word in WORDS * 50:
+        "| {0:<20} |".format(word.upper()).split(" ")
+
+
+def calibrate(function, min_time):
+    """
+    Finds how many calls take at least `min_time`
+    :rtype: tuple[float, int]
+    """
+    loops = 1
+    while True:
+        start = timer()
+        for i in range(loops):
+            function()
+        elapsed = timer() - start
+        if elapsed >= min_time:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+    return elapsed / loops, loops
+
+
+def render_cases(sizes, repeat):
+    for shape in sorted(SHAPES):
+        for count in sizes:
+            if count > SHAPES[shape][4]:
+                continue
+            table = build_table(shape, count)
+            writer = NullWriter()
+
+            def render():
+                writer.size = 0
+                table.render_to(writer)
+
+            elapsed, peak, unit = measure(render, *settings(count, repeat))
+            yield "render/%s/%d" % (shape, count), count, elapsed, peak, unit, writer.size
+
+
+def helper_cases(sizes, repeat):
+    for count in sizes:
+        rows = build_rows(count, 5, (1, 8))
+
+        def stats():
+            TableStats(rows)
+
+        elapsed, peak, unit = measure(stats, *settings(count, repeat))
+        yield "stats/%d" % count, count, elapsed, peak, unit, 0
+
+        table_stats = TableStats(rows)
+
+        def resolve():
+            resolve_column_widths_and_borders(
+                column_widths=[0, None, 20, 25.0, None],
+                headers=[],
+                rows=rows,
+                padding=1,
+                padding_char=" ",
+                border_char="|",
+                terminal_width=120,
+                stats=table_stats
+            )
+
+        elapsed, peak, unit = measure(resolve, *settings(count, repeat))
+        yield "resolve/%d" % count, count, elapsed, peak, unit, 0
+
+    text = " ".join(WORDS * 200)
+
+    def wrap():
+        wrap_line(text, 37)
+
+    elapsed, peak, unit = measure(wrap, *settings(1, repeat))
+    yield "wrap_line/%d" % len(text), 1, elapsed, peak, unit, 0
+
+
+def compare(results, baseline, tolerance):
+    """
+    :rtype: list[str]
+    """
+    failures = []
+    for name, result in sorted(results.items()):
+        if name not in baseline:
+            continue
+        expected = baseline[name]
+        if result["score"] < expected["score"] * (1 - tolerance):
+            failures.append("%s: %.0f rows/s (score %.1f), baseline %.0f rows/s (score %.1f)" % (
+                name, result["rows_per_second"], result["score"], expected["rows_per_second"], expected["score"]))
+        if result["peak_bytes"] > expected["peak_bytes"] * (1 + tolerance):
+            failures.append("%s: peak %d bytes, baseline %d bytes" % (
+                name, result["peak_bytes"], expected["peak_bytes"]))
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="tablebuilder render benchmarks")
+    parser.add_argument("--quick", action="store_true", help="only small row counts")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case, the median is kept")
+    parser.add_argument("--output", default="bench_output.json", help="where to write the results")
+    parser.add_argument("--baseline", default=os.path.join(os.path.dirname(__file__), "baseline.json"))
+    parser.add_argument("--tolerance", type=float, default=0.3, help="allowed regression, 0.3 = 30%%")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    args = parser.parse_args(argv)
+
+    sizes = QUICK_SIZES if args.quick else SIZES
+    results = {}
+    for case in [render_cases, helper_cases]:
+        for name, rows, elapsed, peak, unit, size in case(sizes, args.repeat):
+            if args.filter not in name:
+                continue
+            results[name] = {
+                "rows": rows,
+                "seconds": elapsed,
+                "rows_per_second": rows / elapsed,
+                "score": rows * unit / elapsed,
+                "peak_bytes": peak,
+                "output_chars": size,
+            }
+            sys.stdout.write("%-34s %12.0f rows/s %12d peak bytes\n" % (name, results[name]["rows_per_second"], peak))
+
+    with open(args.output, "w") as fp:
+        json.dump(results, fp, indent=2, sort_keys=True)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as fp:
+                baseline = json.load(fp)
+        for name, result in results.items():
+            baseline[name] = {
+                "rows_per_second": result["rows_per_second"],
+                "score": result["score"],
+                "peak_bytes": result["peak_bytes"]
+            }
+        with open(args.baseline, "w") as fp:
+            json.dump(baseline, fp, indent=2, sort_keys=True)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        return 0
+    with open(args.baseline) as fp:
+        failures = compare(results, json.load(fp), args.tolerance)
+    for failure in failures:
+        sys.stderr.write("REGRESSION " + failure + "\n")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,33 @@
+import sys
+from array import array
+from bisect import bisect_right
+from collections import deque
+from copy import copy
+from heapq import heapify, heappop, heappush, nlargest, nsmallest
 from enum import Enum
+from itertools import chain, islice
 from math import floor, ceil
+from operator import itemgetter
+from timeit import default_timer as timer
 
-import click
+from tablebuilder.display import display_width, is_plain, strip_ansi, wrap_display_line
+from tablebuilder.terminal import terminal_size
+
+try:
+    from itertools import zip_longest
+except ImportError:
+    from itertools import izip_longest as zip_longest
+
+try:
+    string_types = basestring
+except NameError:
+    string_types = str
+
+try:
+    # python 2: lines are native str, which io.StringIO refuses
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
 
 
 class TableStyle(Enum):
@@ -16,12 +42,251 @@ class TableSeparator(object):
         return 0
 
 
+class HeadTailMarker(object):
+    def __init__(self, marker):
+        """
+        Stands in for the rows left out of `Table.head_tail_lines`
+        :param str marker: text put in every column
+        """
+        self.marker = marker
+
+
 class TableBorder(object):
     crossing_char = "+"
     horizontal_char = "="
     vertical_char = "|"
 
 
+class TableCell(object):
+    __slots__ = ("_value", "col_span", "row_span", "align", "_length", "_longest_word")
+
+    def __init__(self, value, col_span=1, row_span=1, align=None):
+        """
+        A cell with options: spanning several columns or rows, or aligned apart from its column. Plain strings stay
+        on the fast path, only use a TableCell where one is needed.
+        :param str value: text of the cell
+        :param int col_span: number of columns the cell takes up
+        :param int row_span: number of rows the cell takes up, the rows below keep a `None` in every column it covers
+        :param str align: "<", ">" or "^", the alignment of the column if not set
+        """
+        self.value = value
+        self.col_span = max(int(col_span), 1)
+        self.row_span = max(int(row_span), 1)
+        self.align = align
+
+    @property
+    def value(self):
+        """
+        Text of the cell
+        :rtype: str
+        """
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        self._length = None
+        self._longest_word = None
+
+    @property
+    def length(self):
+        """
+        Display width of the text, measured once
+        :rtype: int
+        """
+        if self._length is None:
+            self._length = display_width(str(self))
+        return self._length
+
+    @property
+    def longest_word(self):
+        """
+        Display width of the longest word of the text, measured once
+        :rtype: int
+        """
+        if self._longest_word is None:
+            self._longest_word = longest_word(str(self))
+        return self._longest_word
+
+    def __str__(self):
+        if self._value is None:
+            return ""
+        return cell_text(self._value)
+
+    def __repr__(self):
+        return "TableCell(%r, col_span=%d, row_span=%d)" % (self._value, self.col_span, self.row_span)
+
+
+class ColumnFormat(object):
+    NUMERIC_TYPES = "bcdoxXneEfFgG%"
+
+    def __init__(self, spec=None, align=None, none="", date_format=None):
+        """
+        How the typed values (numbers, dates, ...) of a column are turned into text. Compiled into a single
+        function once, then applied to whole columns.
+        :param str spec: `format` spec for numbers and anything else with `__format__`, e.g. ",.2f" or "08d". Values
+            the spec doesn't fit are turned into text as they are.
+        :param str align: "<", ">" or "^". If not set, columns with a numeric `spec` are right aligned.
+        :param str none: placeholder for `None`
+        :param str date_format: `strftime` format for dates, times and datetimes
+        """
+        self.spec = spec
+        self.none = none
+        self.date_format = date_format
+        self.align = align
+        if align is None and spec and (spec[-1] in self.NUMERIC_TYPES or spec[-1] in ",_"):
+            self.align = ">"
+        self.formatter = self.compile()
+
+    def compile(self):
+        """
+        Builds the formatting function, with only the steps this format needs
+        :rtype: callable
+        """
+        none = self.none
+        date_format = self.date_format
+        spec_format = None if not self.spec else ("{0:" + self.spec + "}").format
+
+        def format_value(value):
+            if value is None:
+                return none
+            if isinstance(value, (string_types, TableCell)):
+                return value
+            return str(value)
+
+        if spec_format is not None:
+            def format_value(value, format_value=format_value):
+                if value is None or isinstance(value, (string_types, TableCell)):
+                    return format_value(value)
+                try:
+                    return spec_format(value)
+                except (TypeError, ValueError):
+                    # e.g. "d" given a float, the value is still shown
+                    return str(value)
+
+        if date_format is not None:
+            def format_value(value, format_value=format_value):
+                if hasattr(value, "strftime"):
+                    return value.strftime(date_format)
+                return format_value(value)
+
+        return format_value
+
+    def __call__(self, value):
+        return self.formatter(value)
+
+    def format_column(self, values):
+        """
+        Formats a whole column
+        :param collections.Iterable values:
+        :rtype: list[str]
+        """
+        return list(map(self.formatter, values))
+
+
+def format_rows(rows, formatters):
+    """
+    Applies a formatter per column to every row, TableSeparators pass through. Cells past the last formatter
+    are kept as they are.
+    :param collections.Iterable rows: rows, or a `TableColumns` whose original values are formatted
+    :param list[callable] formatters: one formatting function per column
+    :rtype: collections.Iterator[list|TableSeparator]
+    """
+    if isinstance(rows, TableColumns):
+        rows = rows.raw_rows()
+    for row in rows:
+        yield format_row(row, formatters)
+
+
+def format_row(row, formatters):
+    """
+    Applies a formatter per column to a single row, see `format_rows`
+    :param list|TableSeparator row:
+    :param list[callable] formatters: one formatting function per column
+    :rtype: list|TableSeparator
+    """
+    if isinstance(row, TableSeparator):
+        return row
+    if len(row) > len(formatters):
+        return [formatter(value) for formatter, value in zip(formatters, row)] + list(row[len(formatters):])
+    return [formatter(value) for formatter, value in zip(formatters, row)]
+
+
+def format_stats(rows, formatters):
+    """
+    Statistics of the formatted rows. Column oriented tables are formatted and measured a column at a time.
+    :param collections.Iterable rows:
+    :param list[callable] formatters: one formatting function per column
+    :rtype: TableStats
+    """
+    if not isinstance(rows, TableColumns):
+        return TableStats(format_rows(rows, formatters))
+
+    stats = TableStats()
+    stats.row_shapes = None
+    for index, column in enumerate(rows.columns):
+        if index < len(formatters):
+            stats.columns.append(ColumnStats(map(formatters[index], column)))
+        else:
+            stats.columns.append(rows.stats.column(index))
+    stats.column_count = len(rows.columns)
+    return stats
+
+
+def has_cells(row):
+    """
+    Whether a row holds anything but strings and `None`: TableCells or typed values (numbers, dates, ...)
+    :param list row:
+    :rtype: bool
+    """
+    for value in row:
+        if value is not None and not isinstance(value, string_types):
+            return True
+    return False
+
+
+def row_span_extent(row):
+    """
+    How many rows, counting this one, the cells of a row reach down to
+    :param list row:
+    :rtype: int
+    """
+    extent = 1
+    for value in row:
+        if isinstance(value, TableCell) and value.row_span > extent:
+            extent = value.row_span
+    return extent
+
+
+def measure_row(row):
+    """
+    The measurements a row is counted with in `TableStats`: its length in columns, how many of its cells span
+    rows, and the display width and longest word of every cell, keyed by its column or, for a cell spanning several
+    columns, by its first column and span. `None` for a TableSeparator.
+    :param list|TableSeparator row:
+    :rtype: tuple[int, int, list[tuple[int|tuple[int, int], int, int]]]|None
+    """
+    if isinstance(row, TableSeparator):
+        return None
+    cells = []
+    row_spans = 0
+    position = 0
+    for value in row:
+        if not isinstance(value, TableCell):
+            if value is not None:
+                value = cell_text(value)
+                cells.append((position, display_width(value), longest_word(value)))
+            position += 1
+            continue
+
+        if value.row_span > 1:
+            row_spans += 1
+        key = position if value.col_span == 1 else (position, value.col_span)
+        cells.append((key, value.length, value.longest_word))
+        position += value.col_span
+    return position, row_spans, cells
+
+
 def truncate_line(string, width):
     """
     Takes in a string and tries to break it on spaces. If there aren't sufficient spaces, breaks on character count
@@ -32,15 +297,39 @@ def truncate_line(string, width):
     if len(string) <= width:
         return string, None
 
-    pieces = string.split(" ")
-    if len(pieces[0]) > width:
+    position = string.rfind(" ", 0, width + 1)
+    if position == -1:
         return string[0:width], string[width:]
+    return string[0:position], string[position + 1:]
 
-    for i in range(len(pieces)):
-        if len(" ".join(pieces[0:i + 1])) > width:
-            if i <= 1:
-                return pieces[0], " ".join(pieces[1:])
-            return " ".join(pieces[0:i]), " ".join(pieces[i:])
+
+def wrap_line(string, width, max_lines=None, ellipsis="..."):
+    """
+    Breaks a string into all of its wrapped lines in a single pass. Lines are broken the same way as
+    `truncate_line`: on the last space that fits, or on character count if the first word is too long.
+    :param str string: string to wrap
+    :param int width: max width of every line
+    :param int max_lines: if set, the string is cut to this many lines and the last one ends with `ellipsis`
+    :param str ellipsis: marker for a cut string
+    :rtype: list[str]
+    """
+    width = max(width, 1)
+    length = len(string)
+    lines = []
+    start = 0
+    while length - start > width:
+        if max_lines is not None and len(lines) == max_lines - 1:
+            lines.append(string[start:start + max(width - len(ellipsis), 0)] + ellipsis[0:width])
+            return lines
+        position = string.rfind(" ", start, start + width + 1)
+        if position == -1:
+            lines.append(string[start:start + width])
+            start += width
+        else:
+            lines.append(string[start:position])
+            start = position + 1
+    lines.append(string[start:])
+    return lines
 
 
 def resolve_max_width(index_position, headers, rows):
@@ -59,15 +348,12 @@ def resolve_max_width(index_position, headers, rows):
     if header_value is None:
         header_value = ""
 
-    row_values = []
-    for i in range(len(rows[0:20])):
-        try:
-            if not isinstance(rows[i], TableSeparator) and rows[i][index_position] is not None:
-                row_values.append(len(rows[i][index_position]))
-        except IndexError:
-            row_values.append(0)
+    row_values = [0]
+    for row in rows:
+        if len(row) > index_position and row[index_position] is not None:
+            row_values.append(display_width(cell_text(row[index_position])))
     return max(
-        len(header_value),
+        display_width(header_value),
         *row_values
     )
 
@@ -81,229 +367,2564 @@ def resolve_min_width(index_position, headers, rows):
     :rtype: int
     """
     header_max = 0
-    if headers[index_position] is not None:
-        header_max = max([len(x) for x in headers[index_position].split(" ")])
+    if index_position < len(headers) and headers[index_position] is not None:
+        header_max = longest_word(headers[index_position])
 
-    row_max = 0
-    if len(rows):
-        row_max = max([max(len(word) for word in x[index_position].split(' ')) for x in rows if len(x) > index_position])
+    row_max = max([0] + [
+        longest_word(cell_text(x[index_position]))
+        for x in rows if len(x) > index_position and x[index_position] is not None
+    ])
     return max([row_max, header_max])
 
 
-def reduce_by_list(current_width, reduction_amount, column_widths, index_list, min_width):
+def longest_word(string):
     """
-    Reduces a list of column widths to the correct width
-    :param int current_width: the current width of the columns
-    :param int reduction_amount: intended reduction amount
-    :param list[int] column_widths: current column width list
-    :param list[int] index_list: a lists of indexes that can be reduced.
-    :param int min_width: minimum with a column can be
+    Display width of the longest space separated word in a string
+    :param str string:
     :rtype: int
     """
-    if len(index_list):
-        intended_reduction = int(ceil(reduction_amount / len(index_list)))
-        for index in index_list:
-            if column_widths[index] - intended_reduction >= min_width:
-                column_widths[index] -= intended_reduction
-                current_width -= intended_reduction
-    return current_width
+    if not is_plain(string):
+        return max([display_width(word) for word in strip_ansi(string).split(" ")])
+    if " " not in string:
+        return len(string)
+    return max([len(word) for word in string.split(" ")])
 
 
-def generate_border_columns(num_data_cols, padding_width=1, padding_char=" ", border_char="|"):
-    """
-    Creates the padding/border columns for the number of columns provided.
-    :param int num_data_cols: total number of data columns
-    :param int padding_width: width of the padding between the data columns
-    :param str padding_char: actual character to print.
-    :param str border_char: character to be used as the border
-    :rtype: list[str]
-    """
+class ColumnStats(object):
+    def __init__(self, values=None):
+        """
+        Length statistics of a single column: histograms of the cell display widths, of the longest word in each
+        cell, and of both together (the shapes, used to estimate how cells wrap).
+        Cells can be added and removed in any order and the maximums stay exact.
+        :param collections.Iterable[str] values: initial cells of the column, `None` cells are skipped
+        """
+        self.lengths = {}
+        self.words = {}
+        self.shapes = {}
+        self.max_length = 0
+        self.longest_word = 0
+        for value in values or []:
+            if value is not None:
+                self.add(value)
 
-    if len(border_char) > 1:
-        border_char = border_char[0]
+    def add(self, value):
+        """
+        Counts a single cell
+        :param str value:
+        :return:
+        """
+        self.add_measure(display_width(value), longest_word(value))
 
-    border_columns = []
-    for i in range(num_data_cols + 1):
-        if len(border_char):
-            border = ""
-            if i != 0:
-                border += padding_char * padding_width
-            border += border_char
-            if i != num_data_cols:
-                border += padding_char * padding_width
+    def add_measure(self, length, word):
+        """
+        Counts a single, already measured, cell
+        :param int length: display width of the cell
+        :param int word: display width of its longest word
+        :return:
+        """
+        self.lengths[length] = self.lengths.get(length, 0) + 1
+        if length > self.max_length:
+            self.max_length = length
 
-            border_columns.append(border)
-        else:
-            border_columns.append(padding_char * padding_width)
-    return border_columns
+        self.words[word] = self.words.get(word, 0) + 1
+        if word > self.longest_word:
+            self.longest_word = word
 
+        shape = (length, word)
+        self.shapes[shape] = self.shapes.get(shape, 0) + 1
 
-def resolve_column_widths_and_borders(column_widths, headers, rows, padding, padding_char, border_char, terminal_width):
-    """
-    Reduces the column widths and returns the correct width
-    :param list[int] column_widths: the known column widths
-    :param list[str] headers: list of headers
-    :param list[list[str]] rows: list of all the data rows
-    :param int padding: how many padding characters to add to either side of a border
-    :param str padding_char: the character to be used for padding
-    :param str border_char: the character to be used as a horizontal border
-    :param int terminal_width: how wide the characters should be before trimming
-    :rtype: tuple[list[int], list[str]]
-    """
-    # setting all the missing columns to exact width
-    for i in range(len(headers) - len(column_widths)):
-        column_widths.append(0)
-    for i in range(max(*[len(x) for x in rows]) - len(column_widths)):
-        column_widths.append(0)
+    def remove(self, value):
+        """
+        Removes a single, previously added, cell
+        :param str value:
+        :return:
+        """
+        self.remove_measure(display_width(value), longest_word(value))
 
-    borders = generate_border_columns(len(column_widths), padding, padding_char, border_char)
-    border_length = sum([len(x) for x in borders])
-    terminal_width_after_borders = terminal_width - border_length
+    def remove_measure(self, length, word):
+        """
+        Removes a single, previously added, measured cell
+        :param int length: display width of the cell
+        :param int word: display width of its longest word
+        :return:
+        """
+        self.lengths[length] -= 1
+        if self.lengths[length] == 0:
+            del self.lengths[length]
+            if length == self.max_length:
+                self.max_length = max([0] + list(self.lengths))
 
-    zeros = []
-    nones = []
-    floats = []
-    ints = []
-    for key, value in enumerate(column_widths):
-        if value == 0:
-            zeros.append(key)
-        elif value is None:
-            nones.append(key)
-        elif isinstance(value, float):
-            floats.append(key)
-        elif isinstance(value, int):
-            ints.append(key)
-        else:
-            raise ValueError("'Table.column_widths' cannot be of type '" + str(type(value)) + "'. Only int, float, None are supported.")
+        self.words[word] -= 1
+        if self.words[word] == 0:
+            del self.words[word]
+            if word == self.longest_word:
+                self.longest_word = max([0] + list(self.words))
 
-    for index in zeros:
-        column_widths[index] = resolve_max_width(index, headers, rows)
+        shape = (length, word)
+        self.shapes[shape] -= 1
+        if self.shapes[shape] == 0:
+            del self.shapes[shape]
 
-    for index in floats:
-        column_widths[index] = int(floor(terminal_width_after_borders * (column_widths[index] / 100)))
+    def update(self, other):
+        """
+        Adds the counts of another column's statistics to this one
+        :param ColumnStats other:
+        :return:
+        """
+        for length, count in other.lengths.items():
+            self.lengths[length] = self.lengths.get(length, 0) + count
+        for word, count in other.words.items():
+            self.words[word] = self.words.get(word, 0) + count
+        for shape, count in other.shapes.items():
+            self.shapes[shape] = self.shapes.get(shape, 0) + count
+        self.max_length = max(self.max_length, other.max_length)
+        self.longest_word = max(self.longest_word, other.longest_word)
 
-    if len(nones) > 0:
-        remaining_width_for_nones = terminal_width_after_borders - sum([x for x in column_widths if x is not None])
-        if remaining_width_for_nones <= 0:
-            for index in nones:
-                column_widths[index] = resolve_min_width(index, headers, rows)
-        else:
-            per_none_allotment = int(floor(remaining_width_for_nones / len(nones)))
-            if per_none_allotment < len(nones):
-                for index in nones:
-                    column_widths[index] = resolve_min_width(index, headers, rows)
-            else:
-                for index in nones:
-                    column_widths[index] = per_none_allotment
+    def with_header(self, headers, index_position):
+        """
+        A copy of the statistics that also counts the header of the column
+        :param list[str|None] headers: A list of the Table headers
+        :param int index_position: index of the column
+        :rtype: ColumnStats
+        """
+        stats = ColumnStats()
+        stats.lengths = dict(self.lengths)
+        stats.words = dict(self.words)
+        stats.shapes = dict(self.shapes)
+        stats.max_length = self.max_length
+        stats.longest_word = self.longest_word
+        if index_position < len(headers) and headers[index_position] is not None:
+            stats.add(headers[index_position])
+        return stats
 
-    current_width = border_length + sum(column_widths)
-    for target_list in [nones, floats, zeros, range(len(column_widths))]:
-        if current_width > terminal_width and len(target_list):
-            current_width = reduce_by_list(
-                current_width=current_width,
-                reduction_amount=current_width - terminal_width,
-                column_widths=column_widths,
-                index_list=target_list,
-                min_width=7
-            )
-    return column_widths, borders
+    @property
+    def count(self):
+        """
+        Number of cells counted
+        :rtype: int
+        """
+        return sum(self.lengths.values())
 
 
-class Table(object):
-    def __init__(self, rows=None, column_widths=None, headers=None, style=None, padding_char=None, padding=None, borders=None, terminal_width=None):
+class TableStats(object):
+    # how many different row shapes are kept before giving up on them
+    max_row_shapes = 256
+
+    def __init__(self, rows=None):
         """
-        Largest container for handling a single table of data
-        :param list[list[str]] rows: List of a list of objects that represent the data for the Table
-        :param list[int|float] column_widths: All the intended widths of columns
-        :param list[str] headers: Headers to be applied to the table
-        :param TableStyle|dict style: all the options to be passed into the renderer for displaying a table.
-        :param str padding_char: Character to be used as padding around borders and string padding
-        :param int padding: The width of padding around the borders
-        :param TableBorder borders: a table border object that contains information about how borders should be rendered.
-        :param int terminal_width: the maximum width of the terminal
+        Per column length statistics of a set of rows, used to resolve column widths without rescanning the rows.
+        `row_shapes` counts the rows by the display width and longest word of each of their cells, to estimate how
+        many lines they print; it is `None` once the rows have more than `max_row_shapes` different shapes, or for
+        column oriented rows.
+        :param collections.Iterable[list[str]|TableSeparator] rows: initial rows
         """
-        self.rows = rows or []
-        self.column_widths = column_widths or []
-        self.headers = headers or []
-        self.style = style or {}
-        self.padding = padding or 1
-        self.padding_char = padding_char or " "
-        self.borders = borders or TableBorder()
-        self.terminal_width = terminal_width or click.get_terminal_size()[0]
+        self.columns = []
+        self.row_lengths = {}
+        self.column_count = 0
+        self.spans = {}
+        self.row_spans = 0
+        self.row_shapes = {}
+        for row in rows or []:
+            self.add(row)
 
-    def render(self):
+    def add(self, row):
         """
-        Renders the table with the current settings
+        Counts every cell of a row
+        :param list[str]|TableSeparator row:
         :return:
         """
-        column_widths, column_borders = resolve_column_widths_and_borders(
-            column_widths=self.column_widths,
-            headers=self.headers,
-            rows=self.rows,
-            padding=self.padding,
-            padding_char=self.padding_char,
-            border_char=self.borders.vertical_char,
-            terminal_width=self.terminal_width
-        )
-
-        # Print headers and breaking row
-        if len(self.headers):
-            if len(self.borders.horizontal_char) > 0:
-                self.print_row(TableSeparator(), widths=column_widths, borders=column_borders)
-            self.print_row(self.headers, widths=column_widths, borders=column_borders)
-            if len(self.borders.horizontal_char) > 0:
-                self.print_row(TableSeparator(), widths=column_widths, borders=column_borders)
-
-        # print rows
-        for row in self.rows:
-            self.print_row(row, widths=column_widths, borders=column_borders)
+        if isinstance(row, TableSeparator):
+            return
+        if has_cells(row):
+            self.count_cells(row, 1)
+            return
 
-        if len(self.borders.horizontal_char) > 0:
-            self.print_row(TableSeparator(), widths=column_widths, borders=column_borders)
+        self.add_length(len(row))
+        shape = []
+        for index, value in enumerate(row):
+            if value is not None:
+                length, word = display_width(value), longest_word(value)
+                self.columns[index].add_measure(length, word)
+                shape.append((index, length, word))
+        if self.row_shapes is not None:
+            self.count_shape(tuple(shape), 1)
 
-    def print_row(self, row, widths, borders):
+    def remove(self, row):
         """
-        Prints a single row to the console
+        Removes every cell of a previously added row
         :param list[str]|TableSeparator row:
-        :param list[int] widths: column width printing (just for text)
-        :param list[str] borders: border pieces to be stitched into thing
         :return:
         """
-        output_string = ""
-        overwidth = []
         if isinstance(row, TableSeparator):
-            for i in range(len(widths) + len(borders)):
-                index = int(i / 2)
-                if i % 2 == 0:
-                    for char in borders[index]:
-                        if char == self.borders.vertical_char:
-                            output_string += self.borders.crossing_char
-                        else:
-                            output_string += self.borders.horizontal_char
-                else:
-                    output_string += self.borders.horizontal_char * int(widths[index])
+            return
+        if has_cells(row):
+            self.count_cells(row, -1)
+            return
+
+        self.remove_length(len(row))
+        shape = []
+        for index, value in enumerate(row):
+            if value is not None:
+                length, word = display_width(value), longest_word(value)
+                self.columns[index].remove_measure(length, word)
+                shape.append((index, length, word))
+        self.count_shape(tuple(shape), -1)
+
+    def add_length(self, length):
+        """
+        Counts a row of `length` columns
+        :param int length:
+        :return:
+        """
+        self.row_lengths[length] = self.row_lengths.get(length, 0) + 1
+        if length > self.column_count:
+            self.column_count = length
+            for i in range(length - len(self.columns)):
+                self.columns.append(ColumnStats())
+
+    def remove_length(self, length):
+        """
+        Removes a previously counted row of `length` columns
+        :param int length:
+        :return:
+        """
+        self.row_lengths[length] -= 1
+        if self.row_lengths[length] == 0:
+            del self.row_lengths[length]
+            if length == self.column_count:
+                self.column_count = max([0] + list(self.row_lengths))
+
+    def count_cells(self, row, amount):
+        """
+        Adds (`amount` 1) or removes (`amount` -1) a row holding TableCells or typed values. Typed values are
+        measured as text. A cell spanning several columns is counted in `spans`, under its first column and its
+        span, instead of limiting any single column.
+        :param list row:
+        :param int amount:
+        :return:
+        """
+        self.count_measured(measure_row(row), amount)
+
+    def count_measured(self, measure, amount):
+        """
+        Adds (`amount` 1) or removes (`amount` -1) a row by its measurements, see `measure_row`
+        :param tuple measure:
+        :param int amount:
+        :return:
+        """
+        if measure is None:
+            return
+        length, row_spans, cells = measure
+        if amount > 0:
+            self.add_length(length)
         else:
-            for i in range(len(widths) + len(borders)):
-                index = int(i / 2)
-                if i % 2 == 0:
-                    output_string += borders[index]
-                else:
-                    print_str = row[index] if row[index] is not None else self.padding_char
-                    (element, overflow) = truncate_line(print_str, widths[index])
-                    output_string += element.ljust(widths[index], self.padding_char)
-                    overwidth.append(overflow)
-
-        self.write_line(output_string, self.style)
-        for string in overwidth:
-            if string is not None:
-                return self.print_row(overwidth, widths, borders)
+            self.remove_length(length)
+        self.row_spans += row_spans * amount
 
-    @staticmethod
-    def write_line(message, style):
+        for key, width, word in cells:
+            if isinstance(key, tuple):
+                stats = self.spans.setdefault(key, ColumnStats())
+            else:
+                stats = self.columns[key]
+            if amount > 0:
+                stats.add_measure(width, word)
+            else:
+                stats.remove_measure(width, word)
+                if isinstance(key, tuple) and stats.count == 0:
+                    del self.spans[key]
+        self.count_shape(tuple(cells), amount)
+
+    def count_shape(self, shape, amount):
         """
-        Bypass to allow monkey patching for testing
-        :param str message:
-        :param dict[str, str] style:
+        Adds (`amount` 1) or removes (`amount` -1) a row from `row_shapes`
+        :param tuple[tuple[int|tuple[int, int], int, int]] shape: column, display width and longest word of every cell
+        :param int amount:
         :return:
         """
-        click.secho(message, **style)
+        if self.row_shapes is None:
+            return
+        count = self.row_shapes.get(shape, 0) + amount
+        if count == 0:
+            del self.row_shapes[shape]
+        else:
+            self.row_shapes[shape] = count
+            if len(self.row_shapes) > self.max_row_shapes:
+                self.row_shapes = None
+
+    def wrapped_rows(self, widths, headers):
+        """
+        Estimates how many lines the headers and rows print at the given column widths, every row as many as its
+        most wrapped cell (see `wrapped_lines`). Cells spanning several columns aren't counted.
+        :param list[int] widths: width of every column
+        :param list[str|None] headers: A list of the Table headers
+        :rtype: int|None
+        """
+        if self.row_shapes is None:
+            return None
+        shapes = list(self.row_shapes.items())
+        if any(header is not None for header in headers):
+            header = [(index, display_width(value), longest_word(value)) for index, value in enumerate(headers) if value is not None]
+            shapes.append((tuple(header), 1))
+        # the same cell shows up in many rows, each is estimated once
+        cell_lines = {}
+        lines = 0
+        for shape, count in shapes:
+            row_lines = 1
+            for cell in shape:
+                if cell not in cell_lines:
+                    key, length, word = cell
+                    if isinstance(key, tuple) or key >= len(widths):
+                        cell_lines[cell] = 1
+                    else:
+                        cell_lines[cell] = wrapped_lines({(length, word): 1}, widths[key])
+                row_lines = max(row_lines, cell_lines[cell])
+            lines += count * row_lines
+        return lines
+
+    def update(self, other):
+        """
+        Adds the counts of another table's statistics to this one, e.g. to size several tables alike
+        :param TableStats other:
+        :return:
+        """
+        for length, count in other.row_lengths.items():
+            self.row_lengths[length] = self.row_lengths.get(length, 0) + count
+        for i in range(len(other.columns) - len(self.columns)):
+            self.columns.append(ColumnStats())
+        for index, column in enumerate(other.columns):
+            self.columns[index].update(column)
+        for key, column in other.spans.items():
+            self.spans.setdefault(key, ColumnStats()).update(column)
+        self.column_count = max(self.column_count, other.column_count)
+        self.row_spans += other.row_spans
+        if other.row_shapes is None:
+            self.row_shapes = None
+        for shape, count in (other.row_shapes or {}).items():
+            self.count_shape(shape, count)
+
+    def column(self, index_position):
+        """
+        Statistics of a single column, empty if no row reaches that far
+        :param int index_position:
+        :rtype: ColumnStats
+        """
+        if index_position < len(self.columns):
+            return self.columns[index_position]
+        return ColumnStats()
+
+    def max_width(self, index_position, headers):
+        """
+        Same as `resolve_max_width`, from the statistics
+        :param int index_position: index of the column
+        :param list[str|None] headers: A list of the Table headers
+        :rtype: int
+        """
+        header_max = 0
+        if index_position < len(headers) and headers[index_position] is not None:
+            header_max = display_width(headers[index_position])
+        return max(header_max, self.column(index_position).max_length)
+
+    def min_width(self, index_position, headers):
+        """
+        Same as `resolve_min_width`, from the statistics
+        :param int index_position: index of the column
+        :param list[str|None] headers: A list of the Table headers
+        :rtype: int
+        """
+        header_max = 0
+        if index_position < len(headers) and headers[index_position] is not None:
+            header_max = longest_word(headers[index_position])
+        return max(header_max, self.column(index_position).longest_word)
+
+
+class TableRows(list):
+    """
+    A list of rows that keeps a `TableStats` index up to date as rows are added, assigned or removed. The
+    measurements of every row are kept with it, so a row is removed with the counts it was added with. Cells changed
+    in place (`rows[0][1] = "x"`) are not seen; assign the whole row instead.
+    """
+    def __init__(self, rows=()):
+        super(TableRows, self).__init__(rows)
+        self.stats = TableStats()
+        self.measures = [self._count_row(row) for row in self]
+
+    def _count_row(self, row):
+        """
+        Measures a row and adds it to the statistics
+        :param list|TableSeparator row:
+        :rtype: tuple|None
+        """
+        measure = measure_row(row)
+        self.stats.count_measured(measure, 1)
+        return measure
+
+    def _discount_rows(self, measures):
+        """
+        Removes rows from the statistics by the measurements they were added with
+        :param list[tuple|None] measures:
+        :return:
+        """
+        for measure in measures:
+            self.stats.count_measured(measure, -1)
+
+    def append(self, row):
+        super(TableRows, self).append(row)
+        self.measures.append(self._count_row(row))
+
+    def extend(self, rows):
+        rows = list(rows)
+        super(TableRows, self).extend(rows)
+        self.measures.extend([self._count_row(row) for row in rows])
+
+    def __iadd__(self, rows):
+        self.extend(rows)
+        return self
+
+    def __imul__(self, times):
+        measures = self.measures
+        super(TableRows, self).__imul__(times)
+        for i in range(max(times, 1) - 1):
+            for measure in measures:
+                self.stats.count_measured(measure, 1)
+        if times <= 0:
+            self.stats = TableStats()
+        self.measures = measures * max(times, 0)
+        return self
+
+    def insert(self, index, row):
+        super(TableRows, self).insert(index, row)
+        self.measures.insert(index, self._count_row(row))
+
+    def pop(self, index=-1):
+        row = super(TableRows, self).pop(index)
+        self._discount_rows([self.measures.pop(index)])
+        return row
+
+    def remove(self, row):
+        del self[self.index(row)]
+
+    def clear(self):
+        del self[:]
+
+    def sort(self, key=None, reverse=False):
+        order = sorted(range(len(self)), key=lambda index: key(self[index]) if key else self[index], reverse=reverse)
+        rows, measures = list(self), self.measures
+        super(TableRows, self).__setitem__(slice(None), [rows[index] for index in order])
+        self.measures = [measures[index] for index in order]
+
+    def reverse(self):
+        super(TableRows, self).reverse()
+        self.measures.reverse()
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            removed = self.measures[index]
+            super(TableRows, self).__setitem__(index, value)
+            self._discount_rows(removed)
+            self.measures[index] = [self._count_row(row) for row in value]
+        else:
+            super(TableRows, self).__setitem__(index, value)
+            self._discount_rows([self.measures[index]])
+            self.measures[index] = self._count_row(value)
+
+    def __delitem__(self, index):
+        super(TableRows, self).__delitem__(index)
+        removed = self.measures[index]
+        del self.measures[index]
+        self._discount_rows(removed if isinstance(index, slice) else [removed])
+
+    # python 2 sends simple slices here instead of to __setitem__ and __delitem__
+    def __setslice__(self, start, stop, rows):
+        self.__setitem__(slice(start, stop), rows)
+
+    def __delslice__(self, start, stop):
+        self.__delitem__(slice(start, stop))
+
+
+def cell_text(value):
+    """
+    The text of a single cell, `None` stays `None`
+    :param value:
+    :rtype: str|None
+    """
+    if value is None or isinstance(value, string_types):
+        return value
+    return str(value)
+
+
+def numeric_array(values):
+    """
+    A numpy view of a numeric column, if it is one and numpy is already loaded. Nothing is copied.
+    :param values: column values
+    :rtype: numpy.ndarray|None
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is None:
+        return None
+    if isinstance(values, numpy.ndarray):
+        return values if values.dtype.kind in "biuf" else None
+    if isinstance(values, array):
+        try:
+            return numpy.frombuffer(values, dtype=values.typecode) if values.typecode in "bBhHiIlLqQfd" else None
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def numeric_lengths(values):
+    """
+    The `str()` length of every number in a numeric numpy array. Integers are counted by their digits, without
+    converting them to strings.
+    :param numpy.ndarray values:
+    :rtype: numpy.ndarray
+    """
+    numpy = sys.modules["numpy"]
+    kind = values.dtype.kind
+    if kind == "b":
+        return numpy.where(values, 4, 5)
+    if kind in "iu":
+        powers = numpy.array([10 ** exponent for exponent in range(1, 20)], dtype=numpy.uint64)
+        digits = numpy.searchsorted(powers, numpy.abs(values).astype(numpy.uint64), side="right") + 1
+        return digits + (values < 0) if kind == "i" else digits
+    return numpy.char.str_len(values.astype(str))
+
+
+def measure_column(values, chunk_size=65536):
+    """
+    Builds the statistics of a whole column at once. Numeric numpy arrays (and `array.array` columns, when numpy
+    is loaded) are measured with vectorized string lengths, a chunk at a time.
+    :param collections.Sequence values: column values
+    :param int chunk_size: how many numbers are converted to strings at a time
+    :rtype: ColumnStats
+    """
+    numeric = numeric_array(values)
+    if numeric is None:
+        return ColumnStats(cell_text(value) for value in values)
+
+    numpy = sys.modules["numpy"]
+    stats = ColumnStats()
+    for start in range(0, len(numeric), chunk_size):
+        counts = numpy.bincount(numeric_lengths(numeric[start:start + chunk_size]))
+        for length in numpy.flatnonzero(counts).tolist():
+            # numbers have no spaces, the longest word is the whole cell
+            stats.lengths[length] = stats.lengths.get(length, 0) + int(counts[length])
+            stats.words[length] = stats.words.get(length, 0) + int(counts[length])
+            stats.shapes[(length, length)] = stats.shapes.get((length, length), 0) + int(counts[length])
+    stats.max_length = max([0] + list(stats.lengths))
+    stats.longest_word = stats.max_length
+    return stats
+
+
+def fits_array(column, value, length):
+    """
+    Whether `value` can be appended to a column of `length` rows as it is: anything but an `array.array` takes any
+    value, an array neither takes `None` (also to pad a shorter column) nor values of another type
+    :param collections.Sequence column:
+    :param value:
+    :param int length: rows of the table before the new one
+    :rtype: bool
+    """
+    if not isinstance(column, array):
+        return True
+    if value is None or len(column) < length:
+        return False
+    try:
+        array(column.typecode, [value])
+    except (TypeError, ValueError, OverflowError):
+        return False
+    return True
+
+
+class TableColumns(object):
+    def __init__(self, columns=None):
+        """
+        Column oriented rows. Every column is kept as it was given (list, `array.array`, numpy array, ...) and
+        rows are only assembled, as lists of strings, when they are read. Indexes count data rows only,
+        TableSeparators are kept as marks between them.
+        :param list[collections.Sequence] columns: initial columns
+        """
+        self.columns = []
+        self.separators = []
+        self.stats = TableStats()
+        self.stats.row_shapes = None
+        for column in columns or []:
+            self.add_column(column)
+
+    def add_column(self, values):
+        """
+        Adds a column without copying it
+        :param collections.Sequence values:
+        :return:
+        """
+        self.columns.append(values)
+        self.stats.columns.append(measure_column(values))
+        self.stats.column_count = len(self.columns)
+
+    def add_row(self, row):
+        """
+        Appends a row to every column. Columns that can't grow (numpy arrays), or can't hold the new value (a `None`
+        or a string in an `array.array`), are turned into lists first.
+        :param list|TableSeparator row:
+        :return:
+        """
+        if isinstance(row, TableSeparator):
+            self.separators.append(len(self))
+            return
+
+        length = len(self)
+        for index in range(len(row) - len(self.columns)):
+            self.add_column([])
+        values = [row[index] if index < len(row) else None for index in range(len(self.columns))]
+        # every column is made ready before any grows, so the columns keep the same length
+        for index, column in enumerate(self.columns):
+            if not hasattr(column, "append") or not fits_array(column, values[index], length):
+                self.columns[index] = list(column)
+        for index, column in enumerate(self.columns):
+            for i in range(length - len(column)):
+                column.append(None)
+            value = values[index]
+            column.append(value)
+            if value is not None:
+                # measured as stored, typed arrays convert on append
+                self.stats.columns[index].add(cell_text(column[-1]))
+
+    def append(self, row):
+        self.add_row(row)
+
+    def column(self, index):
+        """
+        The column as it is stored
+        :param int index:
+        :rtype: collections.Sequence
+        """
+        return self.columns[index]
+
+    def row(self, index):
+        """
+        A single row as a list of strings
+        :param int index:
+        :rtype: list[str|None]
+        """
+        return [cell_text(column[index]) if index < len(column) else None for column in self.columns]
+
+    def raw_row(self, index):
+        """
+        Like `TableColumns.row`, with the original values instead of text
+        :param int index:
+        :rtype: tuple
+        """
+        return tuple(column[index] if index < len(column) else None for column in self.columns)
+
+    def __len__(self):
+        return max([0] + [len(column) for column in self.columns])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("TableColumns index out of range")
+        return self.row(index)
+
+    def __iter__(self):
+        for values in self.raw_rows():
+            if isinstance(values, TableSeparator):
+                yield values
+            else:
+                yield [cell_text(value) for value in values]
+
+    def raw_rows(self):
+        """
+        Like iterating the columns, but the rows hold the original values instead of text
+        :rtype: collections.Iterator[tuple|TableSeparator]
+        """
+        separators = iter(self.separators)
+        next_separator = next(separators, None)
+        for index, values in enumerate(zip_longest(*self.columns)):
+            while next_separator == index:
+                yield TableSeparator()
+                next_separator = next(separators, None)
+            yield values
+        while next_separator is not None:
+            yield TableSeparator()
+            next_separator = next(separators, None)
+
+
+def wrapped_lines(histogram, width):
+    """
+    Estimates how many lines a column prints at a width. Cells are broken on spaces, so a line holds `width`
+    characters plus the space it was broken on, less what is left at its end because the next word didn't fit:
+    about a third of the cell's longest word, up to a quarter of the line, where long words are cut instead.
+    :param dict[tuple[int, int], int] histogram: number of cells of each length and longest word, see
+        `ColumnStats.shapes`
+    :param int width:
+    :rtype: int
+    """
+    width = max(width, 1)
+    lines = 0
+    for (length, word), count in histogram.items():
+        if length <= width:
+            lines += count
+        else:
+            line = width + 1 - min(word / 3.0, width / 4.0)
+            lines += count * (1 + int(ceil((length - width) / line)))
+    return lines
+
+
+class LineEstimate(object):
+    def __init__(self, histogram):
+        """
+        A smooth version of `wrapped_lines` for a single column, answered in O(log n) for any width: the cells that
+        wrap are summed up once, sorted by length, and every line loses the same third of the average longest word.
+        Widening a column saves fewer lines with every character, so allocations can search for a common saving.
+        :param dict[tuple[int, int], int] histogram: number of cells of each length and longest word, see
+            `ColumnStats.shapes`
+        """
+        counts = {}
+        words = 0
+        for (length, word), count in histogram.items():
+            counts[length] = counts.get(length, 0) + count
+            words += word * count
+        self.lengths = sorted(counts)
+        self.count = sum(counts.values())
+        self.word = words / float(max(self.count, 1))
+
+        # cells, and their characters, at least as long as every length
+        self.cells = [0] * (len(self.lengths) + 1)
+        self.characters = [0] * (len(self.lengths) + 1)
+        for index in reversed(range(len(self.lengths))):
+            length = self.lengths[index]
+            self.cells[index] = self.cells[index + 1] + counts[length]
+            self.characters[index] = self.characters[index + 1] + counts[length] * length
+
+    def lines(self, width):
+        """
+        :param int width:
+        :rtype: float
+        """
+        width = max(width, 1)
+        index = bisect_right(self.lengths, width)
+        line = width + 1 - min(self.word / 3.0, width / 4.0)
+        return self.count + (self.characters[index] - width * self.cells[index]) / line
+
+    def gain(self, width):
+        """
+        How many lines one more character of width saves
+        :param int width:
+        :rtype: float
+        """
+        return self.lines(width) - self.lines(width + 1)
+
+
+def allocate_column_widths(budget, histograms, minimums, maximums):
+    """
+    Splits `budget` characters between columns so that as few lines as possible are wrapped. Every column gets
+    the width where one more character would save fewer lines than a common threshold (see `LineEstimate`); the
+    threshold is binary searched so the widths fit, and what is left goes to the columns where it saves the most.
+    :param int budget: characters available to the columns
+    :param list[dict[tuple[int, int], int]] histograms: number of cells of each length and longest word, per column
+    :param list[int] minimums: smallest width of every column
+    :param list[int] maximums: widest useful width of every column (where nothing wraps)
+    :rtype: list[int]
+    """
+    estimates = [LineEstimate(histogram) for histogram in histograms]
+
+    def width_for(column, threshold):
+        low, high = minimums[column], max(minimums[column], maximums[column])
+        while low < high:
+            middle = (low + high) // 2
+            if estimates[column].gain(middle) < threshold:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    columns = range(len(histograms))
+    widths = list(minimums)
+    if sum(widths) >= budget:
+        return widths
+
+    low, high = 0.0, max([estimates[column].gain(minimums[column]) for column in columns]) + 1.0
+    for i in range(32):
+        middle = (low + high) / 2
+        candidate = [width_for(column, middle) for column in columns]
+        if sum(candidate) > budget:
+            low = middle
+            continue
+        high = middle
+        widths = candidate
+        if budget - sum(widths) < len(widths):
+            break
+
+    heap = [(-estimates[column].gain(widths[column]), column) for column in columns if widths[column] < maximums[column]]
+    heapify(heap)
+    remaining = budget - sum(widths)
+    while remaining > 0 and len(heap):
+        saved, column = heappop(heap)
+        widths[column] += 1
+        remaining -= 1
+        if widths[column] < maximums[column]:
+            heappush(heap, (-estimates[column].gain(widths[column]), column))
+    return widths
+
+
+def reduce_by_list(current_width, reduction_amount, column_widths, index_list, min_width):
+    """
+    Reduces a list of column widths to the correct width
+    :param int current_width: the current width of the columns
+    :param int reduction_amount: intended reduction amount
+    :param list[int] column_widths: current column width list
+    :param list[int] index_list: a lists of indexes that can be reduced.
+    :param int min_width: minimum with a column can be
+    :rtype: int
+    """
+    if len(index_list):
+        intended_reduction = int(ceil(reduction_amount / len(index_list)))
+        for index in index_list:
+            if column_widths[index] - intended_reduction >= min_width:
+                column_widths[index] -= intended_reduction
+                current_width -= intended_reduction
+    return current_width
+
+
+def generate_border_columns(num_data_cols, padding_width=1, padding_char=" ", border_char="|"):
+    """
+    Creates the padding/border columns for the number of columns provided.
+    :param int num_data_cols: total number of data columns
+    :param int padding_width: width of the padding between the data columns
+    :param str padding_char: actual character to print.
+    :param str border_char: character to be used as the border
+    :rtype: list[str]
+    """
+
+    if len(border_char) > 1:
+        border_char = border_char[0]
+
+    border_columns = []
+    for i in range(num_data_cols + 1):
+        if len(border_char):
+            border = ""
+            if i != 0:
+                border += padding_char * padding_width
+            border += border_char
+            if i != num_data_cols:
+                border += padding_char * padding_width
+
+            border_columns.append(border)
+        else:
+            border_columns.append(padding_char * padding_width)
+    return border_columns
+
+
+def widen_spans(column_widths, borders, zeros, spans):
+    """
+    Widens the last exact fit column covered by every cell spanning several columns, until the cell fits
+    :param list[int] column_widths: resolved column widths, updated in place
+    :param list[str] borders: border pieces between the columns
+    :param list[int] zeros: indexes of the exact fit columns
+    :param dict[tuple[int, int], ColumnStats] spans: statistics of the spanning cells, see `TableStats.spans`
+    :return:
+    """
+    for (start, span), stats in sorted(spans.items()):
+        covered = list(range(start, min(start + span, len(column_widths))))
+        available = sum([column_widths[index] for index in covered]) + sum([len(borders[index]) for index in covered[1:]])
+        exact = [index for index in covered if index in zeros]
+        if stats.max_length > available and len(exact):
+            column_widths[exact[-1]] += stats.max_length - available
+
+
+def resolve_column_widths_and_borders(column_widths, headers, rows, padding, padding_char, border_char, terminal_width, stats=None, allocation="reduce"):
+    """
+    Reduces the column widths and returns the correct width
+    :param list[int] column_widths: the known column widths
+    :param list[str] headers: list of headers
+    :param list[list[str]] rows: list of all the data rows, only measured if `stats` isn't given
+    :param int padding: how many padding characters to add to either side of a border
+    :param str padding_char: the character to be used for padding
+    :param str border_char: the character to be used as a horizontal border
+    :param int terminal_width: how wide the characters should be before trimming
+    :param TableStats stats: precomputed statistics of `rows`
+    :param str allocation: "reduce" cuts the widest groups of columns evenly until they fit, "optimal" gives the
+        width of the `0` and `None` columns to where it saves the most wrapped lines, unless "reduce" is estimated
+        to print about as few lines
+    :rtype: tuple[list[int], list[str]]
+    """
+    if stats is None:
+        stats = TableStats(rows)
+
+    # setting all the missing columns to exact width
+    requested_widths = column_widths
+    column_widths = list(column_widths)
+    for i in range(len(headers) - len(column_widths)):
+        column_widths.append(0)
+    for i in range(stats.column_count - len(column_widths)):
+        column_widths.append(0)
+
+    borders = generate_border_columns(len(column_widths), padding, padding_char, border_char)
+    border_length = sum([len(x) for x in borders])
+    terminal_width_after_borders = terminal_width - border_length
+
+    zeros = []
+    nones = []
+    floats = []
+    ints = []
+    for key, value in enumerate(column_widths):
+        if value == 0:
+            zeros.append(key)
+        elif value is None:
+            nones.append(key)
+        elif isinstance(value, float):
+            floats.append(key)
+        elif isinstance(value, int):
+            ints.append(key)
+        else:
+            raise ValueError("'Table.column_widths' cannot be of type '" + str(type(value)) + "'. Only int, float, None are supported.")
+
+    for index in floats:
+        column_widths[index] = int(floor(terminal_width_after_borders * (column_widths[index] / 100)))
+
+    if allocation == "optimal":
+        flexible = sorted(zeros + nones)
+        budget = terminal_width_after_borders - sum([column_widths[index] for index in floats + ints])
+        maximums = [stats.max_width(index, headers) for index in flexible]
+        if sum(maximums) <= budget:
+            widths = maximums
+            if len(nones):
+                # whatever is left still goes to the None columns
+                extra = int(floor((budget - sum(maximums)) / len(nones)))
+                widths = [width + extra if index in nones else width for index, width in zip(flexible, widths)]
+        else:
+            histograms = [stats.column(index).with_header(headers, index).shapes for index in flexible]
+            widths = allocate_column_widths(
+                budget=budget,
+                histograms=histograms,
+                minimums=[min(width, 7) for width in maximums],
+                maximums=maximums
+            )
+            # the estimates are a line or two off here and there, so "reduce" is kept unless this clearly wraps less
+            reduced = resolve_column_widths_and_borders(
+                requested_widths, headers, rows, padding, padding_char, border_char, terminal_width, stats
+            )
+            optimal = list(column_widths)
+            for index, width in zip(flexible, widths):
+                optimal[index] = width
+            reduced_lines = stats.wrapped_rows(reduced[0], headers)
+            optimal_lines = stats.wrapped_rows(optimal, headers)
+            if reduced_lines is None:
+                reduced_lines = sum(map(wrapped_lines, histograms, [reduced[0][index] for index in flexible]))
+                optimal_lines = sum(map(wrapped_lines, histograms, widths))
+            if reduced_lines <= optimal_lines * 1.1:
+                return reduced
+        for index, width in zip(flexible, widths):
+            column_widths[index] = width
+        zeros = nones = []
+
+    for index in zeros:
+        column_widths[index] = stats.max_width(index, headers)
+
+    if len(nones) > 0:
+        remaining_width_for_nones = terminal_width_after_borders - sum([x for x in column_widths if x is not None])
+        if remaining_width_for_nones <= 0:
+            for index in nones:
+                column_widths[index] = stats.min_width(index, headers)
+        else:
+            per_none_allotment = int(floor(remaining_width_for_nones / len(nones)))
+            if per_none_allotment < len(nones):
+                for index in nones:
+                    column_widths[index] = stats.min_width(index, headers)
+            else:
+                for index in nones:
+                    column_widths[index] = per_none_allotment
+
+    if len(stats.spans):
+        widen_spans(column_widths, borders, zeros, stats.spans)
+
+    current_width = border_length + sum(column_widths)
+    for target_list in [nones, floats, zeros, range(len(column_widths))]:
+        if current_width > terminal_width and len(target_list):
+            current_width = reduce_by_list(
+                current_width=current_width,
+                reduction_amount=current_width - terminal_width,
+                column_widths=column_widths,
+                index_list=target_list,
+                min_width=7
+            )
+    return column_widths, borders
+
+
+class RenderStats(object):
+    def __init__(self, callback=None):
+        """
+        Collects where the time of a render goes. Set it as `Table.render_stats`; when that is `None` (the default)
+        nothing is measured. Once a render has finished, the counters start over with the next one, so they always
+        describe a single render.
+        Phases are "resolve" (width resolution and layout compilation), "wrap" (breaking long cells), "format"
+        (assembling lines) and "write" (output). `bytes_written` counts the output encoded, as UTF-8 unless the
+        file has an encoding of its own.
+        :param callable callback: called with this object when a render, stream or render_to finishes
+        """
+        self.callback = callback
+        self.reset()
+
+    def reset(self):
+        """
+        Zeroes every counter
+        :return:
+        """
+        self.phases = {}
+        self.rows = 0
+        self.lines = 0
+        self.wrapped_cells = 0
+        self.bytes_written = 0
+        self.finished = False
+
+    def start(self):
+        """
+        Zeroes the counters if the last render has finished
+        :return:
+        """
+        if self.finished:
+            self.reset()
+
+    def add_time(self, phase, seconds):
+        """
+        :param str phase: name of the phase
+        :param float seconds: wall time spent in it
+        :return:
+        """
+        self.start()
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def add_written(self, data, encoding=None):
+        """
+        Counts written output
+        :param str|bytes data: what was written
+        :param str encoding: encoding of the output, UTF-8 if not set
+        :return:
+        """
+        self.start()
+        if not isinstance(data, bytes):
+            data = data.encode(encoding or "utf-8", "replace")
+        self.bytes_written += len(data)
+
+    def finish(self):
+        """
+        Hands the statistics to the callback, the next render starts them over
+        :return:
+        """
+        if self.callback is not None:
+            self.callback(self)
+        self.finished = True
+
+
+class TableLayout(object):
+    def __init__(self, widths, borders, padding_char=" ", border=None, aligns=None, max_lines=None, ellipsis="..."):
+        """
+        A compiled layout for a set of resolved column widths. The separator line and a row template are built
+        once, so every row after that is a single `str.format` call.
+        :param list[int] widths: resolved column widths
+        :param list[str] borders: border pieces to be stitched between the columns
+        :param str padding_char: character used to pad cells to their width
+        :param TableBorder border: the characters used for separator lines
+        :param list[str] aligns: per column alignment, "<" (default) or ">"
+        :param int max_lines: maximum number of lines a single cell may wrap onto
+        :param str ellipsis: marker for a cell cut by `max_lines`
+        """
+        border = border or TableBorder()
+        self.widths = list(widths)
+        self.borders = list(borders)
+        self.padding_char = padding_char
+        self.max_lines = max_lines
+        self.ellipsis = ellipsis
+        self.aligns = list(aligns or []) + ["<"] * (len(self.widths) - len(aligns or []))
+        self.stats = None
+
+        separator = []
+        for index, piece in enumerate(self.borders):
+            for char in piece:
+                separator.append(border.crossing_char if char == border.vertical_char else border.horizontal_char)
+            if index < len(self.widths):
+                separator.append(border.horizontal_char * int(self.widths[index]))
+        self.separator = "".join(separator)
+
+        self.template = None
+        if len(padding_char) == 1 and padding_char not in "{}":
+            template = [self.borders[0].replace("{", "{{").replace("}", "}}")]
+            for index, width in enumerate(self.widths):
+                template.append("{%d:%s%s%d}" % (index, padding_char, self.aligns[index], width))
+                template.append(self.borders[index + 1].replace("{", "{{").replace("}", "}}"))
+            self.template = "".join(template)
+
+    def format_cells(self, cells):
+        """
+        Pads and stitches a list of cells, that already fit their columns, into a single line
+        :param list[str] cells: exactly one string per column
+        :rtype: str
+        """
+        if self.template is not None:
+            return self.template.format(*cells)
+
+        output = [self.borders[0]]
+        for index, cell in enumerate(cells):
+            if self.aligns[index] == ">":
+                output.append(cell.rjust(self.widths[index], self.padding_char))
+            else:
+                output.append(cell.ljust(self.widths[index], self.padding_char))
+            output.append(self.borders[index + 1])
+        return "".join(output)
+
+    def format_display_cells(self, cells):
+        """
+        `TableLayout.format_cells` for cells that aren't all plain ASCII, padded by their display width
+        :param list[str] cells: exactly one string per column
+        :rtype: str
+        """
+        output = [self.borders[0]]
+        for index, cell in enumerate(cells):
+            padding = self.padding_char * (self.widths[index] - display_width(cell))
+            output.append(padding + cell if self.aligns[index] == ">" else cell + padding)
+            output.append(self.borders[index + 1])
+        return "".join(output)
+
+    def wrap_cell(self, cell, width):
+        """
+        Wraps a single cell that is wider than its column
+        :param str cell:
+        :param int width:
+        :rtype: list[str]
+        """
+        wrap = wrap_line if is_plain(cell) else wrap_display_line
+        if self.stats is None:
+            return wrap(cell, width, self.max_lines, self.ellipsis)
+
+        start = timer()
+        lines = wrap(cell, width, self.max_lines, self.ellipsis)
+        self.stats.add_time("wrap", timer() - start)
+        self.stats.wrapped_cells += 1
+        return lines
+
+    def row_lines(self, row):
+        """
+        Generates the printed lines of a single row, wrapping cells that are wider than their column
+        :param list[str]|TableSeparator row:
+        :rtype: collections.Iterator[str]
+        """
+        if isinstance(row, (TableSeparator, RowGroup)):
+            lines = [self.separator] if isinstance(row, TableSeparator) else self.span_lines(row.rows)
+            for line in lines:
+                yield line
+            return
+
+        widths = self.widths
+        cells = [cell if cell is not None else "" for cell in row[0:len(widths)]]
+        for i in range(len(widths) - len(cells)):
+            cells.append("")
+
+        plain = True
+        wide = []
+        for index, cell in enumerate(cells):
+            if not isinstance(cell, string_types):
+                # TableCells and typed values
+                for line in self.span_lines([row]):
+                    yield line
+                return
+            if is_plain(cell):
+                if len(cell) <= widths[index]:
+                    continue
+            else:
+                plain = False
+                if display_width(cell) <= widths[index]:
+                    continue
+            wide.append(index)
+
+        format_cells = self.format_cells if plain else self.format_display_cells
+        if len(wide) == 0:
+            yield format_cells(cells)
+            return
+
+        wrapped = [[x] for x in cells]
+        for index in wide:
+            wrapped[index] = self.wrap_cell(cells[index], widths[index])
+        for line_index in range(max(len(x) for x in wrapped)):
+            yield format_cells([x[line_index] if line_index < len(x) else "" for x in wrapped])
+
+    def span_width(self, start, span):
+        """
+        Width of a cell spanning columns `start` to `start + span`, including the borders between them
+        :param int start:
+        :param int span:
+        :rtype: int
+        """
+        return sum(self.widths[start:start + span]) + sum([len(x) for x in self.borders[start + 1:start + span]])
+
+    def cell_lines(self, text, width):
+        """
+        The lines of a single cell in a span of `width`
+        :param str text:
+        :param int width:
+        :rtype: list[str]
+        """
+        if display_width(text) <= width:
+            return [text]
+        return self.wrap_cell(text, width)
+
+    def pad_cell(self, text, width, align):
+        """
+        Pads a single cell line to `width` display columns
+        :param str text:
+        :param int width:
+        :param str align: "<", ">" or "^"
+        :rtype: str
+        """
+        padding = width - display_width(text)
+        if align == ">":
+            return self.padding_char * padding + text
+        if align == "^":
+            left = padding // 2
+            return self.padding_char * left + text + self.padding_char * (padding - left)
+        return text + self.padding_char * padding
+
+    def span_lines(self, rows):
+        """
+        The printed lines of rows holding TableCells. Cells spanning several columns are padded over the columns
+        and the borders between them. A cell spanning several rows flows down through the lines of all of them,
+        the rows below keep a `None` in every column it covers.
+        :param list[list] rows: a single row, or a row with a row span and the rows it covers
+        :rtype: list[str]
+        """
+        count = len(self.widths)
+        spans = []
+        grid = []
+        for row_index, row in enumerate(rows):
+            covered = {}
+            for span in spans:
+                if span["first"] < row_index <= span["last"]:
+                    covered[span["start"]] = span
+
+            segments = []
+            cells = iter(row)
+            position = 0
+            while position < count:
+                if position in covered:
+                    span = covered[position]
+                    segments.append((position, span["col_span"], span))
+                    for i in range(span["col_span"]):
+                        next(cells, None)
+                    position += span["col_span"]
+                    continue
+
+                cell = next(cells, None)
+                col_span, row_span, align = 1, 1, self.aligns[position]
+                if isinstance(cell, TableCell):
+                    col_span = min(cell.col_span, count - position)
+                    row_span = min(cell.row_span, len(rows) - row_index)
+                    align = cell.align or align
+                width = self.span_width(position, col_span)
+                segment = {
+                    "lines": self.cell_lines("" if cell is None else cell_text(cell), width),
+                    "align": align,
+                    "width": width,
+                    "start": position,
+                    "col_span": col_span,
+                    "first": row_index,
+                    "last": row_index + row_span - 1
+                }
+                if row_span > 1:
+                    spans.append(segment)
+                segments.append((position, col_span, segment))
+                position += col_span
+            grid.append(segments)
+
+        heights = [
+            max([1] + [len(segment["lines"]) for position, col_span, segment in segments if segment["first"] == segment["last"]])
+            for segments in grid
+        ]
+        for span in spans:
+            missing = len(span["lines"]) - sum(heights[span["first"]:span["last"] + 1])
+            if missing > 0:
+                heights[span["last"]] += missing
+
+        lines = []
+        for row_index, segments in enumerate(grid):
+            for line_index in range(heights[row_index]):
+                output = [self.borders[0]]
+                for position, col_span, segment in segments:
+                    index = sum(heights[segment["first"]:row_index]) + line_index
+                    text = segment["lines"][index] if index < len(segment["lines"]) else ""
+                    output.append(self.pad_cell(text, segment["width"], segment["align"]))
+                    output.append(self.borders[position + col_span])
+                lines.append("".join(output))
+        return lines
+
+
+def row_key(key):
+    """
+    A key function for rows: column indexes pick that cell, callables are used as they are
+    :param int|callable|None key:
+    :rtype: callable|None
+    """
+    if isinstance(key, int):
+        return itemgetter(key)
+    return key
+
+
+def data_rows(rows):
+    """
+    The data rows of a row source, without TableSeparators. Column oriented tables give their original values.
+    :param collections.Iterable rows:
+    :rtype: collections.Iterator[list]
+    """
+    if isinstance(rows, TableColumns):
+        rows = rows.raw_rows()
+    for row in rows:
+        if not isinstance(row, (TableSeparator, HeadTailMarker)):
+            yield row
+
+
+class LazyRows(object):
+    def __init__(self, function):
+        """
+        Rows computed the first time they are needed, e.g. by `Table.sort_by` or `Table.top`, and kept after that
+        :param callable function: returns the rows
+        """
+        self.function = function
+        self._rows = None
+
+    @property
+    def rows(self):
+        """
+        The computed rows
+        :rtype: TableRows
+        """
+        if self._rows is None:
+            self._rows = TableRows(self.function())
+            self.function = None
+        return self._rows
+
+    @property
+    def stats(self):
+        """
+        Statistics of the computed rows
+        :rtype: TableStats
+        """
+        return self.rows.stats
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        return self.rows[index]
+
+
+class GroupedRows(object):
+    def __init__(self, source, key):
+        """
+        The rows of a source with a TableSeparator wherever the key changes from one row to the next, see
+        `Table.group_by`. Nothing is held but the previous key.
+        :param collections.Iterable source: rows to group
+        :param callable key: group of a row
+        """
+        self.source = source
+        self.key = key
+
+    @property
+    def stats(self):
+        """
+        Statistics of the source, separators don't change them. `None` if the source is streamed.
+        :rtype: TableStats|None
+        """
+        return getattr(self.source, "stats", None)
+
+    def __iter__(self):
+        key = self.key
+        previous = missing = object()
+        for row in data_rows(self.source):
+            value = key(row)
+            if previous is not missing and value != previous:
+                yield TableSeparator()
+            previous = value
+            yield row
+
+
+class RowGroup(object):
+    def __init__(self, rows):
+        """
+        A row holding a cell that spans several rows, together with the rows it covers. Rendered as one block.
+        :param list[list] rows:
+        """
+        self.rows = rows
+
+
+def group_row_spans(rows):
+    """
+    Gathers every row with a row spanning cell and the rows it covers into a `RowGroup`, other rows and
+    TableSeparators pass through. A TableSeparator ends a span early.
+    :param collections.Iterable rows:
+    :rtype: collections.Iterator
+    """
+    groups = RowSpanGroups()
+    for row in rows:
+        for item in groups.add(row):
+            yield item
+    for item in groups.flush():
+        yield item
+
+
+class RowSpanGroups(object):
+    def __init__(self):
+        """
+        `group_row_spans` for rows that come in one at a time, e.g. appended to a live table: a row with a row
+        spanning cell is held back until the rows it covers have come in.
+        """
+        self.group = None
+        self.remaining = 0
+
+    def add(self, row):
+        """
+        Takes the next row
+        :param list|TableSeparator row:
+        :return: the rows, TableSeparators and RowGroups that are complete
+        :rtype: list
+        """
+        if self.group is not None and not isinstance(row, TableSeparator):
+            self.group.append(row)
+            self.remaining = max(self.remaining - 1, row_span_extent(row) - 1)
+            if self.remaining == 0:
+                return self.flush()
+            return []
+
+        items = self.flush()
+        extent = 1 if isinstance(row, TableSeparator) else row_span_extent(row)
+        if extent > 1:
+            self.group = [row]
+            self.remaining = extent - 1
+        else:
+            items.append(row)
+        return items
+
+    def flush(self):
+        """
+        Ends the pending span early, e.g. at the end of the table
+        :return: the pending RowGroup, if there is one
+        :rtype: list[RowGroup]
+        """
+        if self.group is None:
+            return []
+        group, self.group = self.group, None
+        return [RowGroup(group)]
+
+
+def render_chunk(layout, rows):
+    """
+    Formats a chunk of rows. Module level so it can be sent to a process pool.
+    :param TableLayout layout:
+    :param list[list[str]|TableSeparator] rows:
+    :rtype: list[str]
+    """
+    lines = []
+    for row in rows:
+        lines.extend(layout.row_lines(row))
+    return lines
+
+
+class TableFrame(object):
+    def __init__(self, layout, keys, blocks, lines):
+        """
+        The last frame drawn by `Table.redraw`
+        :param TableLayout layout: layout the frame was formatted with
+        :param list[tuple|None] keys: the cells of every row, see `frame_key`
+        :param list[list[str]] blocks: the lines of every row
+        :param list[str] lines: every printed line of the frame
+        """
+        self.layout = layout
+        self.keys = keys
+        self.blocks = blocks
+        self.lines = lines
+
+
+def frame_key(row):
+    """
+    What a row of a `TableFrame` is compared by: its cells (see `cell_key`), those of every row of a RowGroup,
+    `None` for a TableSeparator
+    :param list|RowGroup|TableSeparator row:
+    :rtype: tuple|None
+    """
+    if isinstance(row, TableSeparator):
+        return None
+    if isinstance(row, RowGroup):
+        return tuple(frame_key(group_row) for group_row in row.rows)
+    return tuple(cell_key(cell) for cell in row)
+
+
+def cell_key(cell):
+    """
+    A TableCell is compared by what it shows, not by identity, so a cell changed in place is redrawn
+    :rtype: object
+    """
+    if isinstance(cell, TableCell):
+        return TableCell, cell.value, cell.col_span, cell.row_span, cell.align
+    return cell
+
+
+def redraw_lines(previous, lines, prefix="", suffix="\n"):
+    """
+    The terminal output turning the previous frame into the new one, with the cursor starting and ending on the
+    line below the frame. Unchanged lines are skipped with cursor movement, leftover lines are cleared.
+    :param list[str] previous: lines of the frame on screen
+    :param list[str] lines: lines of the new frame
+    :param str prefix: put before every written line, see `Table.style_affixes`
+    :param str suffix: put after every written line, ending with the line ending
+    :rtype: tuple[str, int]
+    :return: the output and the number of lines written
+    """
+    parts = []
+    if len(previous):
+        parts.append("\r\x1b[%dA" % len(previous))
+    skipped = 0
+    written = 0
+    for index, line in enumerate(lines):
+        if index < len(previous) and previous[index] == line:
+            skipped += 1
+            continue
+        if skipped:
+            parts.append("\x1b[%dB" % skipped)
+            skipped = 0
+        parts.append("\r" + prefix + line + "\x1b[K" + suffix)
+        written += 1
+    if skipped:
+        parts.append("\x1b[%dB" % skipped)
+    if len(lines) < len(previous):
+        parts.append("\x1b[J")
+    return "".join(parts), written
+
+
+class Table(object):
+    def __init__(self, rows=None, column_widths=None, headers=None, style=None, padding_char=None, padding=None, borders=None, terminal_width=None, max_lines=None):
+        """
+        Largest container for handling a single table of data
+        :param list[list[str]] rows: List of a list of objects that represent the data for the Table
+        :param list[int|float] column_widths: All the intended widths of columns
+        :param list[str] headers: Headers to be applied to the table
+        :param TableStyle|dict style: all the options to be passed into the renderer for displaying a table.
+        :param str padding_char: Character to be used as padding around borders and string padding
+        :param int padding: The width of padding around the borders
+        :param TableBorder borders: a table border object that contains information about how borders should be rendered.
+        :param int terminal_width: the maximum width of the terminal
+        :param int max_lines: the maximum number of lines a single cell may wrap onto, cut cells end with `ellipsis`
+        """
+        self.rows = rows if rows is not None else TableRows()
+        self.column_widths = column_widths or []
+        self.headers = headers or []
+        self.style = style or {}
+        self.padding = padding or 1
+        self.padding_char = padding_char or " "
+        self.borders = borders or TableBorder()
+        self.terminal_width = terminal_width
+        self.max_lines = max_lines
+        self.ellipsis = "..."
+        self.render_stats = None
+        self.width_allocation = "reduce"
+        self.formats = []
+        self._layout = None
+        self._formats = None
+        self._live = None
+        self._frame = None
+
+    @property
+    def rows(self):
+        """
+        The rows of the table. A list is kept as it is, not copied, and measured when the table is rendered; a
+        `TableRows` (what `Table.add_row` builds on a new table) keeps its statistics current instead. `TableColumns`
+        are used as they are, any other iterable is streamed when rendered.
+        :rtype: TableRows|TableColumns|collections.Iterable
+        """
+        return self._rows
+
+    @rows.setter
+    def rows(self, rows):
+        if isinstance(rows, tuple):
+            rows = TableRows(rows)
+        self._rows = rows
+
+    @property
+    def terminal_width(self):
+        """
+        The maximum width of the table. If it isn't set, the width of the terminal: queried once per process and
+        kept current when the terminal is resized.
+        :rtype: int
+        """
+        if self._terminal_width:
+            return self._terminal_width
+        return terminal_size()[0]
+
+    @terminal_width.setter
+    def terminal_width(self, terminal_width):
+        self._terminal_width = terminal_width
+
+    @classmethod
+    def from_columns(cls, columns, headers=None, **kwargs):
+        """
+        Builds a column oriented table without copying the columns
+        :param dict|list|numpy.ndarray columns: a dict of header to column, a numpy structured array or a list of
+            columns (lists, `array.array`, numpy arrays, ...)
+        :param list[str] headers: headers, taken from the dict keys or the field names if not given
+        :param kwargs: any other `Table` arguments
+        :rtype: Table
+        """
+        dtype = getattr(columns, "dtype", None)
+        if dtype is not None and dtype.names is not None:
+            headers = headers or list(dtype.names)
+            columns = [columns[name] for name in dtype.names]
+        elif isinstance(columns, dict):
+            headers = headers or [str(key) for key in columns.keys()]
+            columns = list(columns.values())
+        table = cls(headers=headers, **kwargs)
+        table.rows = TableColumns(columns)
+        return table
+
+    @classmethod
+    def from_csv(cls, path, delimiter=",", headers=None, encoding="utf-8", **kwargs):
+        """
+        Builds a table backed by a CSV file. The file is memory mapped and read twice, once to measure the columns
+        and once to render them, so only a single row is ever held in memory.
+        :param str path: path of the file
+        :param str delimiter: field delimiter
+        :param list[str] headers: headers, taken from the first record of the file if not given
+        :param str encoding: encoding of the file
+        :param kwargs: any other `Table` arguments
+        :rtype: Table
+        """
+        from tablebuilder.csvfile import CsvFile
+        rows = CsvFile(path, delimiter=delimiter, encoding=encoding, skip_header=headers is None)
+        table = cls(headers=headers or rows.headers, **kwargs)
+        table.rows = rows
+        return table
+
+    @classmethod
+    def from_tsv(cls, path, headers=None, encoding="utf-8", **kwargs):
+        """
+        Builds a table backed by a tab separated file, see `Table.from_csv`
+        :rtype: Table
+        """
+        return cls.from_csv(path, delimiter="\t", headers=headers, encoding=encoding, **kwargs)
+
+    def add_column(self, values, header=None, width=0):
+        """
+        Adds a column to the table. For row oriented tables the values are added to the data rows in order,
+        skipping TableSeparators. Streamed rows can't be changed, a TypeError is raised for them.
+        :param collections.Sequence values: the cells of the column
+        :param str header: header of the column
+        :param int|float|None width: width of the column, see `Table.column_widths`
+        :return:
+        """
+        if isinstance(self.rows, TableColumns):
+            index = len(self.rows.columns)
+            self.rows.add_column(values)
+        elif not isinstance(self.rows, list):
+            raise TypeError("Columns can only be added to rows kept in a list or TableColumns, not to streamed rows.")
+        else:
+            stats = self.rows.stats if isinstance(self.rows, TableRows) else TableStats(self.rows)
+            index = max(stats.column_count, len(self.headers))
+            values = iter(values)
+            for position, row in enumerate(self.rows):
+                if isinstance(row, TableSeparator):
+                    continue
+                row = list(row) + [None] * (index - len(row))
+                row.append(next(values, None))
+                self.rows[position] = row
+
+        if header is not None or len(self.headers):
+            self.headers = list(self.headers) + [None] * (index - len(self.headers)) + [header]
+        if width != 0 or len(self.column_widths) > index:
+            self.column_widths = list(self.column_widths) + [0] * (index - len(self.column_widths))
+            self.column_widths[index:index + 1] = [width]
+
+    def add_row(self, row):
+        """
+        Appends a row (or TableSeparator) to the table
+        :param list|TableSeparator row:
+        :return:
+        """
+        self.rows.append(row)
+
+    def column(self, index):
+        """
+        The cells of a single column. Column oriented tables return the column as it's stored, row oriented ones a
+        list of the cells of the data rows.
+        :param int index:
+        :rtype: collections.Sequence
+        """
+        if isinstance(self.rows, TableColumns):
+            return self.rows.column(index)
+        return [row[index] if index < len(row) else None for row in self.rows if not isinstance(row, TableSeparator)]
+
+    def derive(self, rows):
+        """
+        A copy of the table, with the same settings, and other rows. Changing the settings of the copy leaves the
+        table alone.
+        :param collections.Iterable rows:
+        :rtype: Table
+        """
+        table = copy(self)
+        table.column_widths = list(self.column_widths)
+        table.headers = list(self.headers)
+        table.formats = list(self.formats)
+        table.style = dict(self.style)
+        table.borders = copy(self.borders)
+        table._layout = None
+        table._live = None
+        table._frame = None
+        table.rows = rows
+        return table
+
+    def sort_by(self, key=None, reverse=False):
+        """
+        A copy of the table with its rows sorted, once they are first needed. TableSeparators are dropped.
+        :param int|callable key: column index or function of a row to sort by, the whole row if not set
+        :param bool reverse: sort in descending order
+        :rtype: Table
+        """
+        rows = self.rows
+        key = row_key(key)
+        return self.derive(LazyRows(lambda: sorted(data_rows(rows), key=key, reverse=reverse)))
+
+    def top(self, n, key=None, largest=True):
+        """
+        A copy of the table with only the `n` largest (or smallest) rows, in order. They are selected with a heap
+        of `n` rows in a single pass, once first needed: O(rows * log n) time and O(n) memory.
+        :param int n: number of rows to keep
+        :param int|callable key: column index or function of a row to compare by, the whole row if not set
+        :param bool largest: keep the largest rows, the smallest ones if `False`
+        :rtype: Table
+        """
+        rows = self.rows
+        key = row_key(key)
+        select = nlargest if largest else nsmallest
+        return self.derive(LazyRows(lambda: select(n, data_rows(rows), key=key)))
+
+    def group_by(self, key):
+        """
+        A copy of the table with a TableSeparator between consecutive rows of different groups. Rows aren't
+        reordered, sort them first (`table.sort_by(key).group_by(key)`) for a single block per group. The rows
+        are streamed through, only the previous key is held.
+        :param int|callable key: column index or function of a row giving its group
+        :rtype: Table
+        """
+        return self.derive(GroupedRows(self.rows, row_key(key)))
+
+    def render(self):
+        """
+        Renders the table with the current settings. If `Table.rows` is not a list (a generator or any other
+        iterable) the rows are streamed, see `Table.stream`.
+        :return:
+        """
+        self.write_lines(self.render_lines())
+
+    def stream(self, rows, sample_size=100):
+        """
+        Renders rows from any iterable, writing each row as it arrives. Only a bounded number of rows is ever held
+        in memory: if every column has a fixed width (int or float) nothing is read ahead, otherwise the widths are
+        resolved from the headers and the first `sample_size` rows.
+        :param collections.Iterable rows: Rows (or TableSeparators) to render
+        :param int sample_size: How many rows to look ahead when resolving `0` and `None` column widths
+        :return:
+        """
+        self.write_lines(self.render_lines(iter(rows), sample_size=sample_size))
+
+    def write_lines(self, lines):
+        """
+        Prints lines one by one through `Table.write_line`
+        :param collections.Iterable[str] lines:
+        :return:
+        """
+        stats = self.render_stats
+        if stats is None:
+            for line in lines:
+                self.write_line(line, self.style)
+            return
+
+        encoding = getattr(sys.stdout, "encoding", None)
+        for line in lines:
+            start = timer()
+            self.write_line(line, self.style)
+            stats.add_time("write", timer() - start)
+            stats.add_written(line + "\n", encoding)
+        stats.finish()
+
+    def render_to(self, fp, buffer_size=65536, color=None, rows=None, sample_size=100, lines=None):
+        """
+        Writes the rendered table to a file-like object, batching the lines into writes of roughly `buffer_size`
+        characters.
+        :param fp: Any object with a `write(str)` method (file, pipe, socket file, StringIO, ...)
+        :param int buffer_size: How many characters to collect before each write
+        :param bool|None color: Whether `Table.style` should be applied. `None` styles only if `fp` is a tty.
+        :param collections.Iterable rows: Rows to render instead of `Table.rows`
+        :param int sample_size: How many rows to look ahead when streaming, see `Table.stream`
+        :param collections.Iterable[str] lines: Already rendered lines to write, e.g. from `Table.window_lines`
+        :return:
+        """
+        if color is None:
+            color = hasattr(fp, "isatty") and fp.isatty()
+        prefix, suffix = self.style_affixes(color)
+        if lines is None:
+            lines = self.render_lines(rows, sample_size=sample_size)
+
+        write = fp.write
+        stats = self.render_stats
+        if stats is not None:
+            encoding = getattr(fp, "encoding", None)
+
+            def write(chunk):
+                start = timer()
+                fp.write(chunk)
+                stats.add_time("write", timer() - start)
+                stats.add_written(chunk, encoding)
+
+        buffered = []
+        buffered_size = 0
+        for line in lines:
+            line = prefix + line + suffix
+            buffered.append(line)
+            buffered_size += len(line)
+            if buffered_size >= buffer_size:
+                write("".join(buffered))
+                buffered = []
+                buffered_size = 0
+        if len(buffered):
+            write("".join(buffered))
+        if stats is not None:
+            stats.finish()
+
+    def render_async(self, writer, batch_size=1000, rows=None, sample_size=100, color=False, encoding="utf-8"):
+        """
+        Coroutine rendering the table to an `asyncio.StreamWriter` (or any async sink) in batches, awaiting
+        `drain()` between them. `rows` can be an async iterator. See `tablebuilder.aio.render_async`.
+        :rtype: collections.Awaitable
+        """
+        from tablebuilder.aio import render_async
+        return render_async(self, writer, batch_size, rows, sample_size, color, encoding)
+
+    def style_affixes(self, color):
+        """
+        The strings to put around every line so it's printed in `Table.style`, with the line ending
+        :param bool color: Whether `Table.style` should be applied.
+        :rtype: tuple[str, str]
+        """
+        if color and isinstance(self.style, dict) and len(self.style):
+            import click
+            prefix, suffix = click.style("\0", **self.style).split("\0")
+            return prefix, suffix + "\n"
+        return "", "\n"
+
+    def echo_via_pager(self, lines=None, color=None):
+        """
+        Shows the table in a pager. The lines are generated as the pager pulls them.
+        :param collections.Iterable[str] lines: Already rendered lines to show, e.g. from `Table.window_lines`
+        :param bool|None color: Whether `Table.style` should be applied. `None` lets click decide.
+        :return:
+        """
+        if lines is None:
+            lines = self.render_lines()
+        prefix, suffix = self.style_affixes(color is not False)
+        import click
+        click.echo_via_pager((prefix + line + suffix for line in lines), color=color)
+
+    def render_to_string(self, color=False, rows=None, sample_size=100):
+        """
+        Renders the table into a string, one newline terminated line per printed line.
+        :param bool color: Whether `Table.style` should be applied.
+        :param collections.Iterable rows: Rows to render instead of `Table.rows`
+        :param int sample_size: How many rows to look ahead when streaming, see `Table.stream`
+        :rtype: str
+        """
+        output = StringIO()
+        self.render_to(output, color=color, rows=rows, sample_size=sample_size)
+        return output.getvalue()
+
+    def export(self, name, fp=None, **kwargs):
+        """
+        Runs one of the `tablebuilder.export` functions. Exports skip the layout entirely, the rows are written in
+        a single pass.
+        :param str name: exporter name, e.g. "csv"
+        :param fp: file-like object to write to, if `None` the export is returned as a string
+        :rtype: str|None
+        """
+        from tablebuilder import export
+        function = getattr(export, "to_" + name)
+        if fp is None:
+            return export.export_to_string(function, self, **kwargs)
+        function(self, fp, **kwargs)
+
+    def to_csv(self, fp=None, delimiter=","):
+        """
+        Exports the headers and rows as CSV, skipping TableSeparators
+        :param fp: file-like object to write to, if `None` the CSV is returned as a string
+        :param str delimiter: field delimiter
+        :rtype: str|None
+        """
+        return self.export("csv", fp, delimiter=delimiter)
+
+    def to_tsv(self, fp=None):
+        """
+        Exports the headers and rows as tab separated values, skipping TableSeparators
+        :param fp: file-like object to write to, if `None` the TSV is returned as a string
+        :rtype: str|None
+        """
+        return self.export("csv", fp, delimiter="\t")
+
+    def to_markdown(self, fp=None):
+        """
+        Exports the headers and rows as a Markdown table, skipping TableSeparators
+        :param fp: file-like object to write to, if `None` the Markdown is returned as a string
+        :rtype: str|None
+        """
+        return self.export("markdown", fp)
+
+    def to_html(self, fp=None):
+        """
+        Exports the headers and rows as an HTML table, TableSeparators start a new `<tbody>`
+        :param fp: file-like object to write to, if `None` the HTML is returned as a string
+        :rtype: str|None
+        """
+        return self.export("html", fp)
+
+    def to_jsonl(self, fp=None):
+        """
+        Exports every row as a line of JSON, keyed by the headers if there are any
+        :param fp: file-like object to write to, if `None` the JSON lines are returned as a string
+        :rtype: str|None
+        """
+        return self.export("jsonl", fp)
+
+    def render_lines(self, rows=None, sample_size=100):
+        """
+        Generates every printed line of the table, without line endings or styling. Lists are measured in full,
+        any other iterable is streamed (see `Table.stream`).
+        :param collections.Iterable rows: Rows to render instead of `Table.rows`
+        :param int sample_size: How many rows to look ahead when streaming
+        :rtype: collections.Iterator[str]
+        """
+        layout, rows = self.source_layout(rows, sample_size)
+        return self.table_lines(layout, rows)
+
+    def parallel_lines(self, workers=None, chunk_size=10000, processes=True, rows=None, sample_size=100):
+        """
+        Generates the same lines as `Table.render_lines`, formatting chunks of rows on a pool of workers. The
+        chunks are written in order and only a few chunks per worker are in flight at a time.
+        :param int workers: size of the pool, the number of CPUs if not set
+        :param int chunk_size: rows per chunk
+        :param bool processes: use a process pool, otherwise a thread pool
+        :param collections.Iterable rows: Rows to render instead of `Table.rows`
+        :param int sample_size: How many rows to look ahead when streaming, see `Table.stream`
+        :rtype: collections.Iterator[str]
+        """
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        from multiprocessing import cpu_count
+
+        workers = workers or cpu_count()
+        layout, rows = self.source_layout(rows, sample_size)
+        for line in self.header_lines(layout):
+            yield line
+
+        # the workers format without recording, only the resolve and write phases are profiled
+        if layout.stats is not None:
+            layout = copy(layout)
+            layout.stats = None
+
+        executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        with executor_class(workers) as executor:
+            pending = deque()
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if len(chunk) == 0:
+                    break
+                pending.append(executor.submit(render_chunk, layout, chunk))
+                if len(pending) >= workers * 2:
+                    for line in pending.popleft().result():
+                        yield line
+            while len(pending):
+                for line in pending.popleft().result():
+                    yield line
+
+        for line in self.footer_lines(layout):
+            yield line
+
+    def source_layout(self, rows=None, sample_size=100):
+        """
+        Resolves the layout for a row source. Lists and sources with precomputed `stats` (e.g. `Table.from_csv`)
+        are measured in full, any other iterable is sampled and the returned iterator replays the sample.
+        :param collections.Iterable rows: Rows to render instead of `Table.rows`
+        :param int sample_size: How many rows to look ahead when streaming
+        :rtype: tuple[TableLayout, collections.Iterator]
+        """
+        stats, rows = self.measured_source(rows, sample_size)
+        return self.layout(stats=stats), self.span_rows(rows, stats)
+
+    def measured_source(self, rows=None, sample_size=100):
+        """
+        The statistics of a row source and the rows to render, with `Table.formats` applied. Lists and sources
+        with precomputed `stats` are measured in full, any other iterable from a sample that is replayed.
+        :param collections.Iterable rows: Rows to render instead of `Table.rows`
+        :param int sample_size: How many rows to look ahead when streaming
+        :rtype: tuple[TableStats, collections.Iterable]
+        """
+        if rows is None:
+            rows = self.rows
+        formatters = self.column_formatters()
+
+        # with fixed widths a source's stats (e.g. a full pass over a file) aren't needed
+        measured = not self.has_fixed_widths() and getattr(rows, "stats", None) is not None
+        if isinstance(rows, (list, tuple, TableColumns)) or measured:
+            if len(formatters):
+                return format_stats(rows, formatters), format_rows(rows, formatters)
+            return getattr(rows, "stats", None) or TableStats(rows), rows
+
+        rows = iter(rows)
+        if len(formatters):
+            rows = format_rows(rows, formatters)
+        sample = []
+        if not self.has_fixed_widths():
+            sample = list(islice(rows, sample_size))
+        return TableStats(sample), chain(sample, rows)
+
+    def column_formatters(self):
+        """
+        The compiled formatting function of every column in `Table.formats`, empty if there are none. Columns
+        without a format only get `None` replaced and non-string values turned into text.
+        :rtype: list[callable]
+        """
+        if len(self.formats) == 0:
+            return []
+        return [column_format.formatter for column_format in self.column_formats()]
+
+    def column_formats(self):
+        """
+        The `ColumnFormat` of every column in `Table.formats`, compiled once and kept until `Table.formats` changes.
+        A format spec string is short for `ColumnFormat(spec)`.
+        :rtype: list[ColumnFormat]
+        """
+        key = tuple(self.formats)
+        if self._formats is None or self._formats[0] != key:
+            column_formats = []
+            for column_format in key:
+                if column_format is None:
+                    column_format = ColumnFormat(none=None)
+                elif isinstance(column_format, string_types):
+                    column_format = ColumnFormat(column_format)
+                column_formats.append(column_format)
+            self._formats = (key, column_formats)
+        return self._formats[1]
+
+    def column_format(self, index):
+        """
+        The `ColumnFormat` of a column, see `Table.column_formats`
+        :param int index:
+        :rtype: ColumnFormat
+        """
+        if index < len(self.formats):
+            return self.column_formats()[index]
+        return ColumnFormat(none=None)
+
+    def row_slice(self, start, stop):
+        """
+        A slice of `Table.rows`. Column oriented tables give their original values if there are `Table.formats`
+        to apply to them.
+        :param int start:
+        :param int stop: end of the slice, the last row if `None`
+        :rtype: list
+        """
+        if isinstance(self.rows, TableColumns) and len(self.formats):
+            return [self.rows.raw_row(index) for index in range(*slice(start, stop).indices(len(self.rows)))]
+        return self.rows[start:stop]
+
+    @staticmethod
+    def span_rows(rows, stats):
+        """
+        Iterates the rows, grouping rows with row spanning cells if the statistics saw any (see `group_row_spans`)
+        :param collections.Iterable rows:
+        :param TableStats stats: statistics of the rows, or of the sample of streamed rows
+        :rtype: collections.Iterator
+        """
+        if stats.row_spans > 0:
+            return group_row_spans(rows)
+        return iter(rows)
+
+    def window_lines(self, offset=0, limit=None, measure_window=False):
+        """
+        Generates the lines of a slice of the rows, with the headers. Rows before `offset` aren't formatted and
+        rows after the window aren't read.
+        :param int offset: index of the first row to show
+        :param int limit: maximum number of rows to show, all the remaining rows if not set
+        :param bool measure_window: Resolve the widths from the visible rows only, instead of the statistics of all
+            of `Table.rows`. Always the case if `Table.rows` keeps no statistics (a plain list, a generator), so the
+            rows outside the window are never read.
+        :rtype: collections.Iterator[str]
+        """
+        stop = None if limit is None else offset + limit
+        if getattr(self.rows, "stats", None) is None:
+            measure_window = True
+        if not isinstance(self.rows, (list, tuple, TableColumns)):
+            if limit is None:
+                return self.render_lines(islice(self.rows, offset, None))
+            measure_window = True
+            window = list(islice(self.rows, offset, stop))
+        else:
+            window = self.row_slice(offset, stop)
+
+        stats, window = self.measured_source(window)
+        window = self.span_rows(window, stats)
+        if not measure_window:
+            stats = self.measured_source()[0]
+        return self.table_lines(self.layout(stats=stats), window)
+
+    def head_tail_lines(self, head=10, tail=10, marker="...", measure_window=False):
+        """
+        Generates the lines of the first `head` and the last `tail` rows, with a marker row in between if any
+        rows were left out. Only `head + tail` rows are ever held in memory.
+        :param int head: number of rows to show from the start
+        :param int tail: number of rows to show from the end
+        :param str marker: text put in every column of the marker row
+        :param bool measure_window: Resolve the widths from the visible rows only, instead of the statistics of all
+            of `Table.rows`. Always the case if `Table.rows` keeps no statistics (a plain list, a generator), so the
+            rows in between are never measured.
+        :rtype: collections.Iterator[str]
+        """
+        if getattr(self.rows, "stats", None) is None:
+            measure_window = True
+        if isinstance(self.rows, (list, tuple, TableColumns)):
+            head_rows = self.row_slice(0, head)
+            tail_rows = self.row_slice(max(head, len(self.rows) - tail), None)
+            hidden = len(self.rows) - len(head_rows) - len(tail_rows)
+        else:
+            measure_window = True
+            rows = iter(self.rows)
+            head_rows = list(islice(rows, head))
+            tail_rows = deque(maxlen=max(tail, 0))
+            hidden = 0
+            for row in rows:
+                if len(tail_rows) == tail:
+                    hidden += 1
+                tail_rows.append(row)
+            tail_rows = list(tail_rows)
+
+        formatters = self.column_formatters()
+        if len(formatters):
+            head_rows = list(format_rows(head_rows, formatters))
+            tail_rows = list(format_rows(tail_rows, formatters))
+        if measure_window:
+            layout = self.layout(stats=TableStats(head_rows + tail_rows))
+        else:
+            layout = self.layout(stats=self.measured_source()[0])
+        if hidden > 0:
+            rows = chain(group_row_spans(head_rows), [HeadTailMarker(marker)], group_row_spans(tail_rows))
+        else:
+            rows = group_row_spans(head_rows + tail_rows)
+        return self.table_lines(layout, rows)
+
+    def table_lines(self, layout, rows):
+        """
+        Generates the headers, the rows and the closing separator in a given layout
+        :param TableLayout layout:
+        :param collections.Iterable rows:
+        :rtype: collections.Iterator[str]
+        """
+        for line in self.header_lines(layout):
+            yield line
+
+        # print rows
+        if self.render_stats is None:
+            for row in rows:
+                if isinstance(row, HeadTailMarker):
+                    yield layout.format_cells([row.marker[0:width] for width in layout.widths])
+                    continue
+                for line in layout.row_lines(row):
+                    yield line
+        else:
+            for line in self.profiled_row_lines(layout, rows):
+                yield line
+
+        for line in self.footer_lines(layout):
+            yield line
+
+    def profiled_row_lines(self, layout, rows):
+        """
+        Same as the row loop of `Table.table_lines`, recording into `Table.render_stats`
+        :param TableLayout layout:
+        :param collections.Iterable rows:
+        :rtype: collections.Iterator[str]
+        """
+        stats = self.render_stats
+        for row in rows:
+            start = timer()
+            wrap_time = stats.phases.get("wrap", 0.0)
+            if isinstance(row, HeadTailMarker):
+                lines = [layout.format_cells([row.marker[0:width] for width in layout.widths])]
+            else:
+                lines = list(layout.row_lines(row))
+            stats.add_time("format", timer() - start - (stats.phases.get("wrap", 0.0) - wrap_time))
+            if not isinstance(row, TableSeparator):
+                stats.rows += 1
+            stats.lines += len(lines)
+            for line in lines:
+                yield line
+
+    def header_lines(self, layout):
+        """
+        The headers and their breaking rows
+        :param TableLayout layout:
+        :rtype: list[str]
+        """
+        lines = []
+        if len(self.headers):
+            if len(self.borders.horizontal_char) > 0:
+                lines.append(layout.separator)
+            lines.extend(layout.row_lines(self.headers))
+            if len(self.borders.horizontal_char) > 0:
+                lines.append(layout.separator)
+        if self.render_stats is not None:
+            self.render_stats.lines += len(lines)
+        return lines
+
+    def footer_lines(self, layout):
+        """
+        The closing separator
+        :param TableLayout layout:
+        :rtype: list[str]
+        """
+        if len(self.borders.horizontal_char) > 0:
+            if self.render_stats is not None:
+                self.render_stats.lines += 1
+            return [layout.separator]
+        return []
+
+    def open(self, fp=None):
+        """
+        Starts a live table: the layout is locked from the headers, `Table.column_widths` and any rows already
+        present, those are written, and every `Table.append` after that writes only the new row. Finish with
+        `Table.close`. Can also be used as a context manager, `with table: ...`.
+        :param fp: file-like object to write to, `Table.write_line` is used if not given
+        :return:
+        """
+        stats, rows = self.measured_source()
+        self._live = (self.layout(stats=stats), fp, self.column_formatters(), RowSpanGroups())
+        for line in self.header_lines(self._live[0]):
+            self.write_live_line(line)
+        for row in rows:
+            self.write_live_row(row)
+
+    def append(self, row):
+        """
+        Adds a row to the table, writing it immediately if the table is live (see `Table.open`)
+        :param list[str]|TableSeparator row:
+        :return:
+        """
+        self.rows.append(row)
+        if self._live is not None:
+            formatters = self._live[2]
+            self.write_live_row(format_row(row, formatters) if len(formatters) else row)
+
+    def write_live_row(self, row):
+        """
+        Writes a formatted row of a live table, a row with a row spanning cell once the rows it covers are in
+        :param list|TableSeparator row:
+        :return:
+        """
+        layout = self._live[0]
+        for item in self._live[3].add(row):
+            for line in layout.row_lines(item):
+                self.write_live_line(line)
+
+    def close(self):
+        """
+        Writes the closing separator of a live table and unlocks the layout
+        :return:
+        """
+        if self._live is None:
+            return
+        for item in self._live[3].flush():
+            for line in self._live[0].row_lines(item):
+                self.write_live_line(line)
+        for line in self.footer_lines(self._live[0]):
+            self.write_live_line(line)
+        self._live = None
+
+    def write_live_line(self, line):
+        """
+        Writes a single line of a live table, flushing the file so it's seen right away
+        :param str line:
+        :return:
+        """
+        fp = self._live[1]
+        if fp is None:
+            self.write_line(line, self.style)
+        else:
+            fp.write(line + "\n")
+            if hasattr(fp, "flush"):
+                fp.flush()
+
+    def queue(self, maxsize=1000, ordered=False, start=0, fp=None, batch_size=100):
+        """
+        A bounded, thread-safe queue that producer threads push rows into while a single renderer thread streams
+        them out through a locked layout. Use it as a context manager, the renderer runs inside the block. See
+        `tablebuilder.ingest.RowQueue`.
+        :param int maxsize: maximum number of rows waiting to be rendered, producers wait when it's reached
+        :param bool ordered: render rows by their sequence key (`put(row, sequence)`) instead of their arrival
+        :param int start: first sequence key when `ordered`
+        :param fp: file-like object to write to, `Table.write_line` is used if not given
+        :param int batch_size: maximum number of waiting rows rendered into a single write
+        :rtype: tablebuilder.ingest.RowQueue
+        """
+        from tablebuilder.ingest import RowQueue
+        return RowQueue(self, maxsize, ordered, start, fp, batch_size)
+
+    def redraw(self, fp=None, color=None, full=False):
+        """
+        Draws the table on a refreshing display, e.g. a dashboard updated every second. The first call writes the
+        whole table, every later call moves the cursor back over the previous frame and rewrites only the lines
+        that changed. While the widths stay the same the cached layout is reused and unchanged rows aren't
+        formatted again. The frame has to fit on the screen.
+        :param fp: terminal to write to, `sys.stdout` if not given
+        :param bool|None color: Whether `Table.style` should be applied. `None` styles only if `fp` is a tty.
+        :param bool full: rewrite every line, e.g. after the screen was cleared
+        :return: the number of lines written
+        :rtype: int
+        """
+        if fp is None:
+            fp = sys.stdout
+        if color is None:
+            color = hasattr(fp, "isatty") and fp.isatty()
+        prefix, suffix = self.style_affixes(color)
+
+        previous = self._frame
+        self._frame = self.frame(self.layout(stats=self.measured_source()[0]), None if full else previous)
+        previous_lines = [] if previous is None else previous.lines
+        if full:
+            previous_lines = [None] * len(previous_lines)
+        output, written = redraw_lines(previous_lines, self._frame.lines, prefix, suffix)
+        fp.write(output)
+        if hasattr(fp, "flush"):
+            fp.flush()
+        return written
+
+    def frame(self, layout, previous=None):
+        """
+        Formats every line of the table, taking the lines of the rows that didn't change from the previous frame
+        :param TableLayout layout:
+        :param TableFrame previous: frame to reuse, only if it was formatted with the same layout
+        :rtype: TableFrame
+        """
+        reuse = previous is not None and previous.layout is layout
+        formatters = self.column_formatters()
+        rows = self.rows
+        if isinstance(rows, TableColumns) and len(formatters):
+            rows = rows.raw_rows()
+        keys = []
+        blocks = []
+        for index, row in enumerate(group_row_spans(rows)):
+            key = frame_key(row)
+            if reuse and key is not None and index < len(previous.keys) and previous.keys[index] == key:
+                block = previous.blocks[index]
+            elif isinstance(row, RowGroup) and len(formatters):
+                block = list(layout.row_lines(RowGroup(list(format_rows(row.rows, formatters)))))
+            else:
+                block = list(layout.row_lines(format_row(row, formatters) if len(formatters) else row))
+            keys.append(key)
+            blocks.append(block)
+
+        lines = self.header_lines(layout)
+        for block in blocks:
+            lines.extend(block)
+        lines.extend(self.footer_lines(layout))
+        return TableFrame(layout, keys, blocks, lines)
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def layout(self, rows=None, stats=None):
+        """
+        Resolves the column widths and returns the compiled layout for them. The layout is cached on the table
+        and only rebuilt when the resolved widths, the padding or the border characters change.
+        :param list[list[str]] rows: rows to measure instead of `Table.rows`, a `TableRows` isn't rescanned
+        :param TableStats stats: statistics of `rows`, if already measured
+        :rtype: TableLayout
+        """
+        start = timer()
+        if rows is None:
+            rows = self.rows
+        if stats is None:
+            stats = getattr(rows, "stats", None)
+
+        column_widths, column_borders = resolve_column_widths_and_borders(
+            column_widths=self.column_widths,
+            headers=self.headers,
+            rows=rows,
+            padding=self.padding,
+            padding_char=self.padding_char,
+            border_char=self.borders.vertical_char,
+            terminal_width=self.terminal_width,
+            stats=stats,
+            allocation=self.width_allocation
+        )
+        layout = self.compile_layout(column_widths, column_borders)
+        layout.stats = self.render_stats
+        if self.render_stats is not None:
+            # a render starts with its layout
+            self.render_stats.add_time("resolve", timer() - start)
+        return layout
+
+    def compile_layout(self, widths, borders):
+        """
+        Returns the cached layout if it was compiled for the same widths, borders and characters
+        :param list[int] widths: resolved column widths
+        :param list[str] borders: border pieces to be stitched into thing
+        :rtype: TableLayout
+        """
+        aligns = [column_format.align or "<" for column_format in self.column_formats()]
+        key = (
+            tuple(widths),
+            tuple(borders),
+            self.padding_char,
+            self.borders.horizontal_char,
+            self.borders.vertical_char,
+            self.borders.crossing_char,
+            self.max_lines,
+            self.ellipsis,
+            tuple(aligns)
+        )
+        if self._layout is None or self._layout[0] != key:
+            self._layout = (key, TableLayout(
+                widths,
+                borders,
+                padding_char=self.padding_char,
+                border=self.borders,
+                aligns=aligns,
+                max_lines=self.max_lines,
+                ellipsis=self.ellipsis
+            ))
+        return self._layout[1]
+
+    def has_fixed_widths(self):
+        """
+        Whether the column widths can be resolved without looking at any row data.
+        :rtype: bool
+        """
+        if len(self.column_widths) == 0 or len(self.column_widths) < len(self.headers):
+            return False
+        for width in self.column_widths:
+            if width is None or width == 0:
+                return False
+        return True
+
+    def print_row(self, row, widths, borders):
+        """
+        Prints a single row to the console
+        :param list[str]|TableSeparator row:
+        :param list[int] widths: column width printing (just for text)
+        :param list[str] borders: border pieces to be stitched into thing
+        :return:
+        """
+        for line in self.compile_layout(widths, borders).row_lines(row):
+            self.write_line(line, self.style)
+
+    @staticmethod
+    def write_line(message, style):
+        """
+        Bypass to allow monkey patching for testing
+        :param str message:
+        :param dict[str, str] style:
+        :return:
+        """
+        import click
+        click.secho(message, **style)
+
+
+class TableGroup(object):
+    def __init__(self, tables=None, spacing=1):
+        """
+        Several tables rendered one after the other with the same column widths, so their columns line up. The
+        columns are measured once across every table and a single layout is built for all of them. The width
+        settings, padding, borders and style come from the first table.
+        :param list[Table] tables: member tables
+        :param int spacing: number of blank lines between two tables
+        """
+        self.tables = list(tables or [])
+        self.spacing = spacing
+
+    def add(self, table):
+        """
+        Adds a table to the group
+        :param Table table:
+        :return:
+        """
+        self.tables.append(table)
+
+    def sources(self, sample_size=100):
+        """
+        The statistics and rows of every table, see `Table.measured_source`
+        :param int sample_size: How many rows to look ahead when streaming
+        :rtype: list[tuple[TableStats, collections.Iterable]]
+        """
+        return [table.measured_source(sample_size=sample_size) for table in self.tables]
+
+    def layout(self, sources):
+        """
+        Resolves the shared layout from the merged statistics of every table and their headers
+        :param list[tuple[TableStats, collections.Iterable]] sources: see `TableGroup.sources`
+        :rtype: TableLayout
+        """
+        stats = TableStats()
+        for table, (table_stats, rows) in zip(self.tables, sources):
+            stats.update(table_stats)
+            stats.add(table.headers)
+        return self.tables[0].layout(rows=[], stats=stats)
+
+    def render_lines(self, sample_size=100):
+        """
+        Generates every printed line of every table, without line endings or styling
+        :param int sample_size: How many rows to look ahead when a table is streamed
+        :rtype: collections.Iterator[str]
+        """
+        if len(self.tables) == 0:
+            return
+        sources = self.sources(sample_size)
+        layout = self.layout(sources)
+        for index, (table, (stats, rows)) in enumerate(zip(self.tables, sources)):
+            if index > 0:
+                for i in range(self.spacing):
+                    yield ""
+            for line in table.table_lines(layout, Table.span_rows(rows, stats)):
+                yield line
+
+    def render(self):
+        """
+        Renders every table through `Table.write_line`
+        :return:
+        """
+        if len(self.tables):
+            self.tables[0].write_lines(self.render_lines())
+
+    def render_to(self, fp, buffer_size=65536, color=None, sample_size=100):
+        """
+        Writes every table to a file-like object, see `Table.render_to`
+        :return:
+        """
+        if len(self.tables):
+            self.tables[0].render_to(fp, buffer_size, color, lines=self.render_lines(sample_size))
+
+    def render_to_string(self, color=False, sample_size=100):
+        """
+        Renders every table into a string, one newline terminated line per printed line
+        :rtype: str
+        """
+        output = StringIO()
+        self.render_to(output, color=color, sample_size=sample_size)
+        return output.getvalue()
@@ -0,0 +1,133 @@
+import asyncio
+import inspect
+from timeit import default_timer as timer
+
+from tablebuilder import RowSpanGroups, format_row
+
+
+async def render_async(table, writer, batch_size=1000, rows=None, sample_size=100, color=False, encoding="utf-8"):
+    """
+    Renders a table to an asynchronous sink without blocking the event loop. Rows are formatted `batch_size` at a
+    time, each batch is written with a single write, `drain()` is awaited for backpressure and control goes back to
+    the loop before the next batch.
+    :param tablebuilder.Table table: table to render
+    :param writer: an `asyncio.StreamWriter`, or any object with a `write` method (plain or coroutine) and an
+        optional `drain` coroutine
+    :param int batch_size: rows per write
+    :param rows: rows to render instead of `Table.rows`, can be an async iterator
+    :param int sample_size: how many rows to look ahead when the widths aren't fixed, see `Table.stream`
+    :param bool color: whether `Table.style` should be applied
+    :param str|None encoding: encoding of the written bytes, `None` writes strings
+    :return:
+    """
+    if rows is None:
+        rows = table.rows
+
+    if hasattr(rows, "__aiter__"):
+        iterator = rows.__aiter__()
+        sample = []
+        if not table.has_fixed_widths():
+            sample = await take(iterator, sample_size)
+        stats, sample = table.measured_source(sample)
+        layout = table.layout(stats=stats)
+        batches = grouped_batches(async_batches(list(sample), iterator, batch_size, table.column_formatters()))
+    else:
+        layout, rows = table.source_layout(rows, sample_size)
+        batches = sync_batches(rows, batch_size)
+
+    stats = table.render_stats
+    prefix, suffix = table.style_affixes(color)
+    await write(writer, table.header_lines(layout), prefix, suffix, encoding, stats)
+    async for batch in batches:
+        if stats is None:
+            lines = []
+            for row in batch:
+                lines.extend(layout.row_lines(row))
+        else:
+            lines = list(table.profiled_row_lines(layout, batch))
+        await write(writer, lines, prefix, suffix, encoding, stats)
+        await asyncio.sleep(0)
+    await write(writer, table.footer_lines(layout), prefix, suffix, encoding, stats)
+    if stats is not None:
+        stats.finish()
+
+
+async def write(writer, lines, prefix, suffix, encoding, stats=None):
+    """
+    Writes a batch of lines and waits for the writer to drain, recording the time into `stats` if given
+    :return:
+    """
+    if len(lines) == 0:
+        return
+    start = timer()
+    data = "".join(prefix + line + suffix for line in lines)
+    if encoding is not None:
+        data = data.encode(encoding)
+    result = writer.write(data)
+    if inspect.isawaitable(result):
+        await result
+    if hasattr(writer, "drain"):
+        await writer.drain()
+    if stats is not None:
+        stats.add_time("write", timer() - start)
+        stats.add_written(data, encoding)
+
+
+async def take(iterator, count):
+    """
+    Reads up to `count` items from an async iterator
+    :rtype: list
+    """
+    items = []
+    while len(items) < count:
+        try:
+            items.append(await iterator.__anext__())
+        except StopAsyncIteration:
+            break
+    return items
+
+
+async def async_batches(sample, iterator, batch_size, formatters):
+    """
+    The sample followed by the rest of an async iterator, `batch_size` rows at a time. The rest of the rows are
+    formatted, the sample already is.
+    """
+    for start in range(0, len(sample), batch_size):
+        yield sample[start:start + batch_size]
+    while True:
+        batch = await take(iterator, batch_size)
+        if len(batch) == 0:
+            return
+        if len(formatters):
+            batch = [format_row(row, formatters) for row in batch]
+        yield batch
+
+
+async def grouped_batches(batches):
+    """
+    Batches with the rows covered by a row spanning cell gathered into RowGroups, also across batches
+    """
+    groups = RowSpanGroups()
+    async for batch in batches:
+        rows = []
+        for row in batch:
+            rows.extend(groups.add(row))
+        if len(rows):
+            yield rows
+    rows = groups.flush()
+    if len(rows):
+        yield rows
+
+
+async def sync_batches(rows, batch_size):
+    """
+    A plain iterator, `batch_size` rows at a time
+    """
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if len(batch):
+        yield batch
@@ -0,0 +1,72 @@
+import csv
+import mmap
+
+from tablebuilder import TableStats
+
+
+class CsvFile(object):
+    def __init__(self, path, delimiter=",", encoding="utf-8", skip_header=True):
+        """
+        Rows of a CSV file, read through a memory map every time they are iterated. Nothing but the current row is
+        held in memory, so a file of any size can be rendered: `stats` is one pass over the file, rendering another.
+        :param str path: path of the file
+        :param str delimiter: field delimiter
+        :param str encoding: encoding of the file
+        :param bool skip_header: whether the first record holds the headers instead of data, see `CsvFile.headers`
+        """
+        self.path = path
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.skip_header = skip_header
+        self.headers = []
+        self.offset = 0
+        self._stats = None
+
+        if skip_header:
+            with open(self.path, "rb") as fp:
+                if len(fp.read(1)):
+                    memory = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        self.headers = next(self.reader(memory), [])
+                        self.offset = memory.tell()
+                    finally:
+                        memory.close()
+
+    def reader(self, memory):
+        """
+        A `csv.reader` over the memory mapped file, from its current position
+        :param mmap.mmap memory:
+        :rtype: collections.Iterator[list[str]]
+        """
+        lines = iter(memory.readline, b"")
+        if str is bytes:
+            # the Python 2 csv module only reads byte strings, the fields are decoded instead
+            rows = csv.reader(lines, delimiter=str(self.delimiter))
+            return ([field.decode(self.encoding) for field in row] for row in rows)
+        return csv.reader((line.decode(self.encoding) for line in lines), delimiter=self.delimiter)
+
+    def __iter__(self):
+        with open(self.path, "rb") as fp:
+            if len(fp.read(1)) == 0:
+                return
+            memory = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                memory.seek(self.offset)
+                for row in self.reader(memory):
+                    if len(row):
+                        yield row
+            finally:
+                memory.close()
+
+    @property
+    def stats(self):
+        """
+        Column statistics of the whole file, measured on first use
+        :rtype: TableStats
+        """
+        if self._stats is None:
+            stats = TableStats()
+            for row in self:
+                stats.add(row)
+            self._stats = stats
+        return self._stats
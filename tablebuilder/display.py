@@ -0,0 +1,175 @@
+import re
+import unicodedata
+
+try:
+    from functools import lru_cache
+except ImportError:
+    def lru_cache(maxsize=128):
+        return lambda function: function
+
+try:
+    text_type = unicode
+except NameError:
+    text_type = str
+
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;?]*[ -/]*[@-~]")
+ANSI_RESET = "\x1b[0m"
+
+
+if hasattr(str, "isascii"):
+    def is_plain(string):
+        """
+        Whether a string is printable ASCII, so its display width is its length
+        :param str string:
+        :rtype: bool
+        """
+        return string.isascii() and "\x1b" not in string
+else:
+    def is_plain(string):
+        """
+        Whether a string is printable ASCII, so its display width is its length
+        :param str string:
+        :rtype: bool
+        """
+        try:
+            string.encode("ascii")
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            return False
+        return "\x1b" not in string
+
+
+def strip_ansi(string):
+    """
+    Removes ANSI escape sequences (colors, styles, cursor movement)
+    :param str string:
+    :rtype: str
+    """
+    return ANSI_ESCAPE.sub("", string)
+
+
+def char_width(char):
+    """
+    Columns a single character takes up in a terminal: 2 for wide east asian characters, 0 for combining and
+    formatting characters, 1 otherwise
+    :param str char:
+    :rtype: int
+    """
+    if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return 2
+    return 1
+
+
+@lru_cache(maxsize=4096)
+def text_width(string):
+    """
+    Display width of a string that isn't plain ASCII. Cached, tables repeat a lot of values.
+    :param str string:
+    :rtype: int
+    """
+    if not isinstance(string, text_type):
+        # python 2 byte strings, e.g. styled by click
+        string = string.decode("utf-8", "replace")
+    return sum([char_width(char) for char in strip_ansi(string)])
+
+
+def display_width(string):
+    """
+    Columns a string takes up in a terminal, ignoring ANSI escape sequences and counting wide characters twice.
+    Plain ASCII strings are just measured with `len`.
+    :param str string:
+    :rtype: int
+    """
+    if is_plain(string):
+        return len(string)
+    return text_width(string)
+
+
+def display_tokens(string):
+    """
+    Splits a string into characters and ANSI escape sequences, with their display widths
+    :param str string:
+    :rtype: list[tuple[str, int]]
+    """
+    tokens = []
+    position = 0
+    for match in ANSI_ESCAPE.finditer(string):
+        tokens.extend((char, char_width(char)) for char in string[position:match.start()])
+        tokens.append((match.group(0), 0))
+        position = match.end()
+    tokens.extend((char, char_width(char)) for char in string[position:])
+    return tokens
+
+
+def wrap_display_line(string, width, max_lines=None, ellipsis="..."):
+    """
+    `wrap_line` on display columns: wide characters count twice and ANSI escape sequences count for nothing. A
+    line that ends inside a color is reset, and the color is opened again on the next line.
+    :param str string: string to wrap
+    :param int width: max display width of every line
+    :param int max_lines: if set, the string is cut to this many lines and the last one ends with `ellipsis`
+    :param str ellipsis: marker for a cut string
+    :rtype: list[str]
+    """
+    if not isinstance(string, text_type):
+        lines = wrap_display_line(string.decode("utf-8", "replace"), width, max_lines, ellipsis)
+        return [line.encode("utf-8") for line in lines]
+    width = max(width, 1)
+    tokens = display_tokens(string)
+    offsets = [0]
+    for token, token_width in tokens:
+        offsets.append(offsets[-1] + token_width)
+
+    lines = []
+    active = []
+    start = 0
+    while start < len(tokens) and offsets[-1] - offsets[start] > width:
+        last_line = max_lines is not None and len(lines) == max_lines - 1
+        limit = width - display_width(ellipsis) if last_line else width
+
+        end = start
+        space = None
+        while end < len(tokens) and offsets[end + 1] - offsets[start] <= max(limit, 0):
+            if tokens[end][0] == " ":
+                space = end
+            end += 1
+        if end < len(tokens) and tokens[end][0] == " " and offsets[end] - offsets[start] <= limit:
+            space = end
+
+        if last_line:
+            lines.append(close_line("".join(active), tokens[start:end], active) + ellipsis[0:width])
+            return lines
+
+        prefix = "".join(active)
+        if space is None:
+            end = max(end, start + 1)
+            lines.append(close_line(prefix, tokens[start:end], active))
+            start = end
+        else:
+            lines.append(close_line(prefix, tokens[start:space], active))
+            start = space + 1
+    if start < len(tokens) or len(lines) == 0:
+        # a wide character forced onto its own line can use up the string
+        lines.append("".join(active) + "".join(token for token, token_width in tokens[start:]))
+    return lines
+
+
+def close_line(prefix, tokens, active):
+    """
+    Joins the tokens of a line, updating the active SGR (color) sequences and resetting them at the end
+    :param str prefix: sequences still active from the previous line
+    :param list[tuple[str, int]] tokens:
+    :param list[str] active: active sequences, updated in place
+    :rtype: str
+    """
+    for token, token_width in tokens:
+        if token.startswith("\x1b[") and token.endswith("m"):
+            if token in (ANSI_RESET, "\x1b[m"):
+                del active[:]
+            else:
+                active.append(token)
+    line = prefix + "".join(token for token, token_width in tokens)
+    if len(active):
+        line += ANSI_RESET
+    return line
@@ -0,0 +1,213 @@
+import csv
+import json
+from itertools import chain
+from math import isinf, isnan
+
+try:
+    from html import escape
+except ImportError:
+    from cgi import escape
+
+from tablebuilder import StringIO, TableCell, TableColumns, TableSeparator, cell_text, string_types
+
+
+class BufferedWriter(object):
+    def __init__(self, fp, buffer_size=65536):
+        """
+        Collects small writes into writes of roughly `buffer_size` characters
+        :param fp: file-like object to write to
+        :param int buffer_size: how many characters to collect before each write
+        """
+        self.fp = fp
+        self.buffer_size = buffer_size
+        self.buffered = []
+        self.buffered_size = 0
+
+    def write(self, string):
+        self.buffered.append(string)
+        self.buffered_size += len(string)
+        if self.buffered_size >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if len(self.buffered):
+            self.fp.write("".join(self.buffered))
+        self.buffered = []
+        self.buffered_size = 0
+
+
+def source_rows(table):
+    """
+    The rows of a table, column oriented tables give their original values instead of text
+    :param tablebuilder.Table table:
+    :rtype: collections.Iterable
+    """
+    if isinstance(table.rows, TableColumns):
+        return table.rows.raw_rows()
+    return table.rows
+
+
+def data_rows(table):
+    """
+    The rows of a table without their TableSeparators, with spanning cells spread out (see `spread_cells`)
+    :param tablebuilder.Table table:
+    :rtype: collections.Iterator[list]
+    """
+    for row in source_rows(table):
+        if not isinstance(row, TableSeparator):
+            yield spread_cells(row)
+
+
+def spread_cells(row):
+    """
+    A TableCell is replaced by its value, followed by a `None` for every further column it spans, so the cells
+    after it stay in their columns
+    :param list row:
+    :rtype: list
+    """
+    if not any(isinstance(cell, TableCell) for cell in row):
+        return row
+    cells = []
+    for cell in row:
+        if isinstance(cell, TableCell):
+            cells.append(cell.value)
+            cells.extend([None] * (cell.col_span - 1))
+        else:
+            cells.append(cell)
+    return cells
+
+
+def to_csv(table, fp, delimiter=",", buffer_size=65536):
+    """
+    Writes the headers and rows as CSV. TableSeparators are skipped.
+    :param tablebuilder.Table table:
+    :param fp: file-like object opened in text mode, with `newline=""` for files; on Python 2 a byte file, cells
+        are written as UTF-8
+    :param str delimiter: field delimiter, "\t" for TSV
+    :param int buffer_size: how many characters to collect before each write
+    :return:
+    """
+    output = BufferedWriter(fp, buffer_size)
+    writer = csv.writer(output, delimiter=delimiter, lineterminator="\n")
+    if len(table.headers):
+        writer.writerow([csv_field(header) for header in table.headers])
+    for row in data_rows(table):
+        writer.writerow([csv_field(cell) for cell in row])
+    output.flush()
+
+
+def csv_field(value):
+    text = "" if value is None else cell_text(value)
+    if str is bytes and not isinstance(text, str):
+        # the Python 2 csv module only writes byte strings
+        return text.encode("utf-8")
+    return text
+
+
+def markdown_cell(value):
+    return "" if value is None else cell_text(value).replace("|", "\\|").replace("\n", " ")
+
+
+def to_markdown(table, fp, buffer_size=65536):
+    """
+    Writes the headers and rows as a Markdown (GitHub flavored) table. TableSeparators are skipped, Markdown has
+    no equivalent. Without headers the header row is left empty, missing headers are left empty as well. The header
+    row is as wide as the headers or the first row, whichever is wider; GitHub drops the cells of later rows past it.
+    :param tablebuilder.Table table:
+    :param fp: file-like object
+    :param int buffer_size: how many characters to collect before each write
+    :return:
+    """
+    output = BufferedWriter(fp, buffer_size)
+    rows = data_rows(table)
+    first = next(rows, None)
+    headers = list(table.headers)
+    if first is not None:
+        headers.extend([None] * (len(first) - len(headers)))
+
+    output.write("| " + " | ".join(markdown_cell(header) for header in headers) + " |\n")
+    output.write("|" + "|".join("---" for header in headers) + "|\n")
+    if first is not None:
+        for row in chain([first], rows):
+            output.write("| " + " | ".join(markdown_cell(cell) for cell in row) + " |\n")
+    output.flush()
+
+
+def html_cell(value):
+    return "" if value is None else escape(cell_text(value), True)
+
+
+def html_data(cell):
+    if isinstance(cell, TableCell) and cell.col_span > 1:
+        return '<td colspan="%d">' % cell.col_span + html_cell(cell.value) + "</td>"
+    if isinstance(cell, TableCell):
+        cell = cell.value
+    return "<td>" + html_cell(cell) + "</td>"
+
+
+def to_html(table, fp, buffer_size=65536):
+    """
+    Writes the headers and rows as an HTML table. TableSeparators start a new `<tbody>`, cells spanning several
+    columns get a `colspan`.
+    :param tablebuilder.Table table:
+    :param fp: file-like object
+    :param int buffer_size: how many characters to collect before each write
+    :return:
+    """
+    output = BufferedWriter(fp, buffer_size)
+    output.write("<table>\n")
+    if len(table.headers):
+        output.write("<thead><tr>" + "".join(
+            "<th>" + html_cell(header) + "</th>" for header in table.headers
+        ) + "</tr></thead>\n")
+    output.write("<tbody>\n")
+    for row in source_rows(table):
+        if isinstance(row, TableSeparator):
+            output.write("</tbody>\n<tbody>\n")
+            continue
+        output.write("<tr>" + "".join(html_data(cell) for cell in row) + "</tr>\n")
+    output.write("</tbody>\n</table>\n")
+    output.flush()
+
+
+def json_value(value):
+    if isinstance(value, float) and (isnan(value) or isinf(value)):
+        # JSON has no NaN or Infinity
+        return None
+    if value is None or isinstance(value, (string_types, bool, int, float)):
+        return value
+    if hasattr(value, "item") and hasattr(value, "dtype"):
+        return json_value(value.item())
+    return cell_text(value)
+
+
+def to_jsonl(table, fp, buffer_size=65536):
+    """
+    Writes every row as a line of JSON: an object keyed by the headers if there are any, a list otherwise. Cells
+    past the last header are keyed by their index. TableSeparators are skipped. Strings, numbers, booleans and None
+    are kept, NaN and infinity become null and anything else is written as text.
+    :param tablebuilder.Table table:
+    :param fp: file-like object
+    :param int buffer_size: how many characters to collect before each write
+    :return:
+    """
+    output = BufferedWriter(fp, buffer_size)
+    encoder = json.JSONEncoder(ensure_ascii=False)
+    headers = [header if header is not None else str(index) for index, header in enumerate(table.headers)]
+    for row in data_rows(table):
+        values = [json_value(cell) for cell in row]
+        if len(headers):
+            keys = headers + [str(index) for index in range(len(headers), len(values))]
+            values = dict(zip(keys, values))
+        output.write(encoder.encode(values) + "\n")
+    output.flush()
+
+
+def export_to_string(function, table, **kwargs):
+    """
+    Runs an exporter into a string
+    :rtype: str
+    """
+    output = StringIO()
+    function(table, output, **kwargs)
+    return output.getvalue()
@@ -0,0 +1,206 @@
+import threading
+from heapq import heappop, heappush
+from itertools import count
+
+from tablebuilder import RowSpanGroups, format_row
+
+from timeit import default_timer as timer
+
+try:
+    from queue import Queue, Empty, Full
+except ImportError:
+    from Queue import Queue, Empty, Full
+
+CLOSED = object()
+
+
+class RowQueue(object):
+    def __init__(self, table, maxsize=1000, ordered=False, start=0, fp=None, batch_size=100):
+        """
+        A bounded, thread-safe queue of rows rendered by a single background thread. Any number of producer
+        threads `put` rows; `put` only waits while the queue is full. The layout is locked when rendering starts,
+        from the headers, `Table.column_widths` and the rows already in the table, which are written first, so give
+        it fixed widths. Queued rows are written as they arrive and aren't kept.
+        :param tablebuilder.Table table: table whose settings are used
+        :param int maxsize: maximum number of rows waiting to be rendered, producers wait when it's reached. When
+            `ordered`, a row also waits while its key is `maxsize` or more ahead of the next key to render, so at most
+            as many rows are held back for a gap in the sequence. Every producer has to put its rows in key order.
+        :param bool ordered: render rows by their sequence key instead of their arrival
+        :param int start: first sequence key when `ordered`
+        :param fp: file-like object to write to, `Table.write_line` is used if not given
+        :param int batch_size: maximum number of waiting rows rendered into a single write
+        """
+        self.table = table
+        self.queue = Queue(maxsize)
+        self.maxsize = maxsize
+        self.ordered = ordered
+        self.start_sequence = start
+        self.next_sequence = start
+        self.window = threading.Condition()
+        self.fp = fp
+        self.batch_size = batch_size
+        self.thread = None
+        self.error = None
+        self.closed = False
+
+    def put(self, row, sequence=None, timeout=None):
+        """
+        Queues a row, waiting while the queue is full
+        :param list[str]|TableSeparator row:
+        :param int sequence: position of the row, required when the queue is ordered
+        :param float timeout: how long to wait for room, forever if not set, `queue.Full` is raised when it runs out
+        :return:
+        """
+        if self.ordered and sequence is None:
+            raise ValueError("An ordered RowQueue needs the sequence key of every row.")
+        if self.ordered and self.maxsize > 0:
+            self.wait_for_window(sequence, timeout)
+        self.queue.put((sequence, row), timeout=timeout)
+
+    def wait_for_window(self, sequence, timeout=None):
+        """
+        Waits until a sequence key is less than `maxsize` ahead of the next key to render
+        :param int sequence:
+        :param float timeout: how long to wait, forever if not set
+        :return:
+        """
+        end = None if timeout is None else timer() + timeout
+        with self.window:
+            while sequence >= self.next_sequence + self.maxsize and self.error is None:
+                remaining = None if end is None else end - timer()
+                if remaining is not None and remaining <= 0:
+                    raise Full
+                self.window.wait(remaining)
+
+    def advance(self, next_sequence):
+        """
+        Moves the window of accepted sequence keys and wakes up the producers waiting on it
+        :param int next_sequence:
+        :return:
+        """
+        with self.window:
+            self.next_sequence = next_sequence
+            self.window.notify_all()
+
+    def start(self):
+        """
+        Starts the renderer thread
+        :return:
+        """
+        self.thread = threading.Thread(target=self.run, name="tablebuilder-renderer")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def close(self):
+        """
+        Tells the renderer no more rows are coming and waits for it to write the rest of the table. Errors of the
+        renderer thread are raised here.
+        :return:
+        """
+        if self.thread is None:
+            return
+        self.queue.put(CLOSED)
+        self.thread.join()
+        self.thread = None
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def batches(self):
+        """
+        Blocks until rows are waiting, then takes up to `batch_size` of them. Ends once the queue is closed.
+        :rtype: collections.Iterator[list[tuple[int, list]]]
+        """
+        while True:
+            items = [self.queue.get()]
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self.queue.get_nowait())
+                except Empty:
+                    break
+            self.closed = CLOSED in items
+            yield [item for item in items if item is not CLOSED]
+            if self.closed:
+                return
+
+    def run(self):
+        """
+        The renderer thread: streams the waiting rows through the locked layout
+        :return:
+        """
+        try:
+            table = self.table
+            layout, rows = table.source_layout()
+            formatters = table.column_formatters()
+            lines = table.header_lines(layout)
+            for row in rows:
+                lines.extend(layout.row_lines(row))
+            self.write(lines)
+            groups = RowSpanGroups()
+            pending = []
+            ties = count()
+            next_sequence = self.start_sequence
+            for batch in self.batches():
+                lines = []
+                for sequence, row in batch:
+                    if len(formatters):
+                        row = format_row(row, formatters)
+                    if not self.ordered:
+                        self.row_lines(layout, groups.add(row), lines)
+                        continue
+                    heappush(pending, (sequence, next(ties), row))
+                    while len(pending) and pending[0][0] <= next_sequence:
+                        self.row_lines(layout, groups.add(heappop(pending)[2]), lines)
+                        next_sequence += 1
+                if self.ordered:
+                    self.advance(next_sequence)
+                self.write(lines)
+            # whatever is left after a gap in the sequence
+            lines = []
+            while len(pending):
+                self.row_lines(layout, groups.add(heappop(pending)[2]), lines)
+            self.row_lines(layout, groups.flush(), lines)
+            lines.extend(table.footer_lines(layout))
+            self.write(lines)
+        except Exception as error:
+            with self.window:
+                self.error = error
+                self.window.notify_all()
+            # keep draining so producers never wait on a dead renderer
+            while not self.closed:
+                self.closed = self.queue.get() is CLOSED
+
+    @staticmethod
+    def row_lines(layout, rows, lines):
+        """
+        Formats rows, and the RowGroups of rows with a row spanning cell, into `lines`
+        :param tablebuilder.TableLayout layout:
+        :param list rows: rows that are ready, see `RowSpanGroups.add`
+        :param list[str] lines: lines to extend
+        :return:
+        """
+        for row in rows:
+            lines.extend(layout.row_lines(row))
+
+    def write(self, lines):
+        """
+        Writes a batch of lines
+        :param list[str] lines:
+        :return:
+        """
+        if len(lines) == 0:
+            return
+        if self.fp is None:
+            for line in lines:
+                self.table.write_line(line, self.table.style)
+            return
+        self.fp.write("".join(line + "\n" for line in lines))
+        if hasattr(self.fp, "flush"):
+            self.fp.flush()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,59 @@
+import signal
+
+terminal_size_cache = None
+previous_handler = None
+
+
+def query_terminal_size():
+    """
+    Asks the operating system for the size of the terminal, falling back on click for old Pythons
+    :rtype: tuple[int, int]
+    """
+    try:
+        from shutil import get_terminal_size
+    except ImportError:
+        from click import get_terminal_size
+    size = get_terminal_size()
+    return size[0], size[1]
+
+
+def terminal_size():
+    """
+    The size of the terminal, queried once per process and refreshed when the terminal is resized (SIGWINCH)
+    :rtype: tuple[int, int]
+    """
+    global terminal_size_cache
+    if terminal_size_cache is None:
+        terminal_size_cache = query_terminal_size()
+        watch_resize()
+    return terminal_size_cache
+
+
+def refresh_terminal_size(signum=None, frame=None):
+    """
+    Queries the terminal size again. Installed as the SIGWINCH handler, calling the handler it replaced.
+    :return:
+    """
+    global terminal_size_cache
+    terminal_size_cache = query_terminal_size()
+    if callable(previous_handler):
+        previous_handler(signum, frame)
+
+
+def watch_resize():
+    """
+    Refreshes the cached size on SIGWINCH. Only possible from the main thread of platforms that have the signal,
+    elsewhere the size is queried once.
+    :return:
+    """
+    global previous_handler
+    if not hasattr(signal, "SIGWINCH"):
+        return
+    try:
+        handler = signal.getsignal(signal.SIGWINCH)
+        if handler is refresh_terminal_size:
+            return
+        signal.signal(signal.SIGWINCH, refresh_terminal_size)
+    except ValueError:
+        return
+    previous_handler = handler
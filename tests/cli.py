@@ -3,7 +3,7 @@ import click
 
 @click.command()
 def main():
-    from tablebuilder import Table, TableStyle, TableSeparator
+    from tablebuilder import Table, TableStyle, TableSeparator, TableCell
 
     table = Table()
     table.headers = ['ISBN', 'Title', 'Author']
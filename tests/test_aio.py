@@ -0,0 +1,121 @@
+import asyncio
+
+from tablebuilder import RenderStats, Table, TableCell, TableSeparator
+
+
+class Writer(object):
+    def __init__(self):
+        self.data = b""
+        self.writes = 0
+        self.drains = 0
+
+    def write(self, data):
+        self.data += data
+        self.writes += 1
+
+    async def drain(self):
+        self.drains += 1
+
+
+def build_table():
+    table = Table(terminal_width=80, headers=['ISBN', 'Title'])
+    table.rows = [
+        ['99921-58-10-7', 'Divine Comedy'],
+        TableSeparator(),
+        ['9971-5-0210-0', 'A Tale of Two Cities']
+    ]
+    return table
+
+
+def test_matches_render_to_string():
+    table = build_table()
+    writer = Writer()
+    asyncio.run(table.render_async(writer, batch_size=1))
+    assert writer.data.decode("utf-8") == table.render_to_string()
+    assert writer.writes == writer.drains == 5
+
+
+def test_async_iterator_rows():
+    table = build_table()
+    rows = list(table.rows)
+
+    async def produce():
+        for row in rows:
+            await asyncio.sleep(0)
+            yield row
+
+    writer = Writer()
+    asyncio.run(table.render_async(writer, rows=produce(), sample_size=3))
+    assert writer.data.decode("utf-8") == table.render_to_string()
+
+
+def test_async_iterator_formats():
+    table = Table(terminal_width=80, headers=['Count'])
+    table.formats = [',d']
+
+    async def produce():
+        for count in [1000, 2, 3000]:
+            yield [count]
+
+    writer = Writer()
+    asyncio.run(table.render_async(writer, rows=produce(), sample_size=2))
+    assert writer.data.decode("utf-8").splitlines()[3:6] == ["| 1,000 |", "|     2 |", "| 3,000 |"]
+
+
+def test_stream_writer():
+    table = build_table()
+    table.rows = table.rows * 500
+
+    async def serve():
+        received = []
+
+        async def handle(reader, writer):
+            received.append(await reader.read())
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await table.render_async(writer, batch_size=100)
+        writer.close()
+        await writer.wait_closed()
+        while not received:
+            await asyncio.sleep(0.01)
+        server.close()
+        await server.wait_closed()
+        return received[0]
+
+    assert asyncio.run(serve()).decode("utf-8") == table.render_to_string()
+
+
+def test_async_iterator_row_span():
+    table = Table(terminal_width=80, headers=['Group', 'Item'], column_widths=[5, 4])
+    rows = [[TableCell('one two three', row_span=2), 'a'], [None, 'b'], ['x', 'y']]
+
+    async def produce():
+        for row in rows:
+            yield row
+
+    writer = Writer()
+    asyncio.run(table.render_async(writer, rows=produce(), batch_size=1))
+    table.rows = rows
+    assert writer.data.decode("utf-8") == table.render_to_string()
+
+
+def test_async_iterator_render_stats():
+    table = build_table()
+    rows = list(table.rows)
+    finished = []
+    table.render_stats = RenderStats(callback=finished.append)
+
+    async def produce():
+        for row in rows:
+            yield row
+
+    writer = Writer()
+    asyncio.run(table.render_async(writer, rows=produce()))
+    output = writer.data.decode("utf-8")
+    assert finished == [table.render_stats]
+    assert table.render_stats.rows == 2
+    assert table.render_stats.lines == len(output.splitlines())
+    assert table.render_stats.bytes_written == len(writer.data)
@@ -0,0 +1,81 @@
+import random
+
+from tablebuilder import LineEstimate, Table, TableRows, TableStats, allocate_column_widths, wrapped_lines
+
+
+def test_wrapped_lines():
+    # histograms count cells by (length, longest word)
+    assert wrapped_lines({(5, 5): 2}, 5) == 2
+    assert wrapped_lines({(12, 12): 1}, 5) == 3
+    assert wrapped_lines({(14, 4): 1}, 5) == 3
+
+
+def test_line_estimate():
+    estimate = LineEstimate({(12, 4): 2, (30, 8): 1, (5, 5): 3})
+    assert estimate.lines(30) == 6
+    assert estimate.lines(5) > estimate.lines(6) > estimate.lines(12)
+    # every character saves fewer lines than the one before, which the threshold search relies on
+    gains = [estimate.gain(width) for width in range(5, 30)]
+    assert gains == sorted(gains, reverse=True)
+
+
+def test_everything_fits():
+    assert allocate_column_widths(30, [{(5, 5): 1}, {(10, 10): 1}], [5, 7], [5, 10]) == [5, 10]
+
+
+def test_width_goes_where_it_saves_lines():
+    # one column with many long cells, one with a single long cell
+    widths = allocate_column_widths(40, [{(60, 5): 100}, {(60, 5): 1}], [7, 7], [60, 60])
+    assert sum(widths) == 40
+    assert widths[0] > widths[1]
+
+
+def test_minimums():
+    assert allocate_column_widths(10, [{(60, 5): 1}, {(60, 5): 1}], [7, 7], [60, 60]) == [7, 7]
+
+
+def test_optimal_table():
+    rows = [['a ' * 30, 'b'] for i in range(20)] + [['x', 'word ' * 20]]
+    table = Table(terminal_width=60, column_widths=[None, None], rows=rows)
+    even = table.render_to_string()
+    table.width_allocation = "optimal"
+    optimal = table.render_to_string()
+    assert max(len(line) for line in optimal.splitlines()) == 60
+    assert len(optimal.splitlines()) < len(even.splitlines())
+
+
+def test_wrapped_rows():
+    stats = TableStats([['aaaa aaaa aaaa', 'b'], ['c', 'dddd dddd']])
+    # every row prints as many lines as its most wrapped cell
+    assert stats.wrapped_rows([5, 5], []) == 5
+    assert stats.wrapped_rows([5, 5], ['h', 'hhhh hhhh hhhh']) == 8
+
+    rows = TableRows([['a', 'b'], ['c d e', 'f']])
+    rows.pop()
+    assert rows.stats.row_shapes == {((0, 1, 1), (1, 1, 1)): 1}
+
+    stats.max_row_shapes = 2
+    stats.add(['x'])
+    assert stats.row_shapes is None
+    assert stats.wrapped_rows([5, 5], []) is None
+
+
+def test_optimal_never_wraps_more_than_reduce():
+    rng = random.Random(14)
+
+    def cell():
+        length = rng.choice([4, 8, 15])
+        return ' '.join('x' * rng.randint(1, length) for i in range(rng.randint(0, rng.choice([3, 10, 30]))))
+
+    def printed_lines(rows, column_widths, terminal_width, allocation):
+        table = Table(terminal_width=terminal_width, column_widths=list(column_widths), rows=rows)
+        table.width_allocation = allocation
+        return len(table.render_to_string().splitlines())
+
+    for i in range(100):
+        columns = rng.randint(2, 5)
+        rows = [[cell() for c in range(columns)] for r in range(rng.randint(5, 40))]
+        column_widths = [rng.choice([0, None]) for c in range(columns)]
+        terminal_width = rng.randint(30, 200)
+        optimal = printed_lines(rows, column_widths, terminal_width, "optimal")
+        assert optimal <= printed_lines(rows, column_widths, terminal_width, "reduce")
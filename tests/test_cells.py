@@ -0,0 +1,154 @@
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from tablebuilder import RenderStats, Table, TableCell, TableSeparator, TableStats
+
+
+def build_table():
+    table = Table(terminal_width=80)
+    table.headers = ['ISBN', 'Title', 'Author']
+    table.rows = [
+        ['99921-58-10-7', 'Divine Comedy', 'Dante Alighieri'],
+        ['9971-5-0210-0', 'A Tale of Two Cities', 'Charles Dickens'],
+    ]
+    return table
+
+
+def test_col_span():
+    table = build_table()
+    table.add_row([TableCell('Der Things', col_span=2), 'Nobody'])
+    assert table.render_to_string().splitlines()[5] == "| Der Things                           | Nobody          |"
+
+
+def test_col_span_widens_exact_columns():
+    table = build_table()
+    table.add_row([TableCell('A really long title that spans both columns', col_span=2), 'Nobody'])
+    lines = table.render_to_string().splitlines()
+    assert lines[5] == "| A really long title that spans both columns | Nobody          |"
+    assert lines[3] == "| 99921-58-10-7 | Divine Comedy               | Dante Alighieri |"
+
+
+def test_row_span():
+    table = build_table()
+    table.rows = [
+        [TableCell('Spans two rows of text', row_span=2), 'One', 'Two'],
+        [None, 'Three', 'Four'],
+        TableSeparator(),
+        ['a', 'b', 'c'],
+    ]
+    table.column_widths = [10]
+    assert table.render_to_string().splitlines() == [
+        "+============+=======+========+",
+        "| ISBN       | Title | Author |",
+        "+============+=======+========+",
+        "| Spans two  | One   | Two    |",
+        "| rows of    | Three | Four   |",
+        "| text       |       |        |",
+        "+============+=======+========+",
+        "| a          | b     | c      |",
+        "+============+=======+========+",
+    ]
+
+
+def test_cell_align():
+    table = Table(terminal_width=80)
+    table.rows = [
+        ['left', 'abcdefgh'],
+        [TableCell('r', align='>'), TableCell('mid', align='^')],
+    ]
+    assert table.render_to_string().splitlines()[1] == "|    r |   mid    |"
+
+
+def test_plain_rows_render_unchanged():
+    table = build_table()
+    before = table.render_to_string()
+    table.rows.append([TableCell('x'), 'y', 'z'])
+    assert table.render_to_string().startswith(before[:-len(before.splitlines()[-1]) - 1])
+
+
+def test_cached_measurements():
+    cell = TableCell(u'long words here')
+    assert (cell.length, cell.longest_word) == (15, 5)
+    cell.value = 'short'
+    assert (cell.length, cell.longest_word) == (5, 5)
+    assert str(TableCell(None)) == ''
+    assert str(TableCell(42)) == '42'
+
+
+def test_span_stats():
+    row = [TableCell('spanning cell', col_span=2), TableCell('tall', row_span=3)]
+    stats = TableStats([row, ['a', 'b', None]])
+    assert stats.column_count == 3
+    assert stats.spans[(0, 2)].max_length == 13
+    assert stats.column(0).max_length == 1
+    assert stats.column(2).max_length == 4
+    assert stats.row_spans == 1
+
+    stats.remove(row)
+    assert stats.spans == {}
+    assert stats.row_spans == 0
+    assert stats.column(2).max_length == 0
+
+
+def build_spans():
+    table = Table(terminal_width=80, headers=['Group', 'Item'], column_widths=[5, 4])
+    table.rows = [
+        [TableCell('one two three', row_span=2), 'a'],
+        [None, 'b'],
+        ['x', 'y'],
+    ]
+    return table
+
+
+spans = [
+    "+=======+======+",
+    "| Group | Item |",
+    "+=======+======+",
+    "| one   | a    |",
+    "| two   | b    |",
+    "| three |      |",
+    "| x     | y    |",
+    "+=======+======+",
+]
+
+
+def test_row_span_paths():
+    assert build_spans().render_to_string().splitlines() == spans
+    assert list(build_spans().window_lines(offset=0, limit=3)) == spans
+    assert list(build_spans().head_tail_lines(head=2, tail=1)) == spans
+    table = build_spans()
+    table.redraw(StringIO())
+    assert table._frame.lines == spans
+
+
+def test_live_row_span():
+    output = StringIO()
+    table = build_spans()
+    rows, table.rows = table.rows, []
+    table.open(output)
+    table.append(rows[0])
+    assert len(output.getvalue().splitlines()) == 3
+    for row in rows[1:]:
+        table.append(row)
+    table.close()
+    assert output.getvalue().splitlines() == spans
+
+
+def test_queue_row_span():
+    output = StringIO()
+    table = build_spans()
+    rows, table.rows = table.rows, []
+    with table.queue(fp=output, ordered=True) as queue:
+        for sequence in [2, 1, 0]:
+            queue.put(rows[sequence], sequence)
+    assert output.getvalue().splitlines() == spans
+
+
+def test_cells_after_a_wrapped_cell_are_wrapped_once():
+    table = Table(terminal_width=80, column_widths=[5, 5])
+    table.rows = [['one two three', TableCell('x')]]
+    table.render_stats = RenderStats()
+    assert table.render_to_string().splitlines()[:3] == ["| one   | x     |", "| two   |       |", "| three |       |"]
+    assert table.render_stats.wrapped_cells == 1
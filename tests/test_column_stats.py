@@ -0,0 +1,87 @@
+from tablebuilder import ColumnStats, Table, TableRows, TableSeparator, TableStats
+
+rows = [
+    ['short', 'Super Long Row', 'Longer Row'],
+    TableSeparator(),
+    ['short', 'Less Long'],
+    ['short', None, 'cell'],
+    [None, 'short', 'cell'],
+    ['marker', 'short', 'cell']
+]
+
+
+def test_column_stats():
+    stats = ColumnStats(['a', 'bb bbb', None, 'cccc'])
+    assert stats.max_length == 6
+    assert stats.longest_word == 4
+    assert stats.lengths == {1: 1, 6: 1, 4: 1}
+    stats.remove('bb bbb')
+    assert stats.max_length == 4
+    stats.remove('cccc')
+    assert stats.max_length == 1
+    assert stats.longest_word == 1
+
+
+def test_table_stats():
+    stats = TableStats(rows)
+    assert stats.column_count == 3
+    assert stats.max_width(1, []) == 14
+    assert stats.max_width(0, ['This is a long header']) == 21
+    assert stats.max_width(3, []) == 0
+    assert stats.min_width(2, ['This is a long header', 'Short', None]) == 6
+
+
+def test_rows_keep_stats():
+    table_rows = TableRows(rows)
+    table_rows.append(['a much longer cell than before'])
+    assert table_rows.stats.column(0).max_length == 30
+    table_rows[-1] = ['tiny']
+    assert table_rows.stats.column(0).max_length == 6
+    del table_rows[0]
+    assert table_rows.stats.column(1).max_length == 9
+    table_rows[0:3] = [['x', 'y' * 20, 'z', 'extra']]
+    assert table_rows.stats.column_count == 4
+    table_rows.pop(0)
+    assert table_rows.stats.column_count == 3
+    assert table_rows.stats.column(1).max_length == 5
+    table_rows.clear()
+    assert table_rows.stats.column_count == 0
+
+
+def test_exact_over_all_rows():
+    table = Table(terminal_width=200)
+    table.rows = [['a']] * 100
+    table.rows.append(['the widest cell is last'])
+    assert table.layout().widths == [23]
+
+
+def test_rows_removed_by_their_measurements():
+    table_rows = TableRows([['a', 'b']])
+    table_rows[0][1] = 'longer value'
+    table_rows[0] = ['c', 'd']
+    assert table_rows.stats.column(1).lengths == {1: 1}
+    table_rows.append(['e', 'f f'])
+    table_rows.sort(key=lambda row: row[1], reverse=True)
+    assert table_rows == [['e', 'f f'], ['c', 'd']]
+    table_rows.remove(['c', 'd'])
+    assert table_rows.stats.column(1).max_length == 3
+    table_rows.pop()
+    assert table_rows.stats.column_count == 0
+
+
+def test_rows_count_is_the_list_count():
+    table_rows = TableRows([['a', 'b'], ['a', 'b']])
+    assert table_rows.count(['a', 'b']) == 2
+    assert table_rows.count(['x' * 30, 'y']) == 0
+    assert table_rows.stats.column(0).max_length == 1
+
+
+def test_rows_are_not_copied():
+    rows = []
+    table = Table(rows=rows, terminal_width=80)
+    rows.append(['a', 'b'])
+    assert table.render_to_string() == '| a | b |\n+===+===+\n'
+    table.rows[0][1] = 'longer value'
+    assert table.render_to_string() == '| a | longer value |\n+===+==============+\n'
+    table.rows[0] = ['c', 'd']
+    assert table.render_to_string() == '| c | d |\n+===+===+\n'
@@ -0,0 +1,107 @@
+from array import array
+
+from pytest import importorskip, raises
+
+from tablebuilder import Table, TableColumns, TableSeparator, measure_column
+
+
+def test_add_column_to_rows():
+    table = Table(terminal_width=80, headers=['ISBN', 'Title'])
+    table.rows = [
+        ['99921-58-10-7', 'Divine Comedy'],
+        TableSeparator(),
+        ['9971-5-0210-0', 'A Tale of Two Cities']
+    ]
+    table.add_column(['Religion', 'Fantasy'], header="Genre")
+    assert table.headers == ['ISBN', 'Title', 'Genre']
+    assert table.column(2) == ['Religion', 'Fantasy']
+    assert table.render_to_string() == (
+        "+===============+======================+==========+\n"
+        "| ISBN          | Title                | Genre    |\n"
+        "+===============+======================+==========+\n"
+        "| 99921-58-10-7 | Divine Comedy        | Religion |\n"
+        "+===============+======================+==========+\n"
+        "| 9971-5-0210-0 | A Tale of Two Cities | Fantasy  |\n"
+        "+===============+======================+==========+\n"
+    )
+
+
+def test_add_column_width():
+    table = Table(terminal_width=80, rows=[['a']])
+    table.add_column(['b'], width=5)
+    assert table.column_widths == [0, 5]
+    assert table.headers == []
+
+
+def test_add_column_to_streamed_rows():
+    table = Table(terminal_width=80, rows=iter([['a']]))
+    with raises(TypeError):
+        table.add_column(['b'])
+
+
+def test_typed_array_measured_as_stored():
+    table = Table.from_columns({'Value': array('d', [1.5])}, terminal_width=80)
+    table.add_row([12345678])
+    assert table.rows.stats.column(0).max_length == 10
+    assert table.render_to_string().splitlines()[-2] == "| 12345678.0 |"
+
+
+def test_typed_array_takes_none():
+    table = Table.from_columns({'Num': array('l', [1, 2]), 'Name': ['one', 'two']}, terminal_width=80)
+    table.add_row([None, 'three'])
+    table.add_row([4])
+    table.add_row([5, 'five', 'extra'])
+    assert [len(column) for column in table.rows.columns] == [5, 5, 5]
+    assert list(table.column(0)) == [1, 2, None, 4, 5]
+    assert table.rows.stats.column(0).max_length == 1
+    assert table.render_to_string().splitlines()[-2] == "| 5   | five  | extra |"
+
+
+def test_dict_of_columns():
+    table = Table.from_columns({'Num': array('l', [1, 22, 333]), 'Name': ['one', 'two', None]}, terminal_width=80)
+    table.add_row([4444, 'four'])
+    table.add_row(TableSeparator())
+    assert table.render_to_string() == (
+        "+======+======+\n"
+        "| Num  | Name |\n"
+        "+======+======+\n"
+        "| 1    | one  |\n"
+        "| 22   | two  |\n"
+        "| 333  |      |\n"
+        "| 4444 | four |\n"
+        "+======+======+\n"
+        "+======+======+\n"
+    )
+    assert table.rows[1] == ['22', 'two']
+    assert table.rows[-1] == ['4444', 'four']
+
+
+def test_measure_list():
+    stats = measure_column([1, 'two words', None, 12.5])
+    assert stats.max_length == 9
+    assert stats.longest_word == 5
+
+
+def test_numpy_columns():
+    numpy = importorskip("numpy")
+    values = numpy.arange(-5, 1000, dtype=numpy.int64)
+    columns = TableColumns([values, numpy.linspace(0, 1, len(values))])
+    assert columns.column(0) is values
+    assert columns.stats.column(0).max_length == 3
+    assert columns.stats.column(0).lengths[2] == 95
+    assert columns.stats.column(1).max_length == max(len(str(x)) for x in columns.column(1))
+    assert columns[0] == ['-5', '0.0']
+
+
+def test_numpy_array_module_column():
+    importorskip("numpy")
+    stats = measure_column(array('d', [1.5, -20.25]))
+    assert stats.max_length == 6
+
+
+def test_structured_array():
+    numpy = importorskip("numpy")
+    data = numpy.array([(1, 2.5), (10, 3.0)], dtype=[('id', 'i4'), ('score', 'f8')])
+    table = Table.from_columns(data, terminal_width=80)
+    assert table.headers == ['id', 'score']
+    assert list(table.render_lines())[3:5] == ["| 1  | 2.5   |", "| 10 | 3.0   |"]
@@ -0,0 +1,91 @@
+from tablebuilder import Table
+from tablebuilder.csvfile import CsvFile
+
+
+comparison = (
+    "+===============+======================+\n"
+    "| ISBN          | Title                |\n"
+    "+===============+======================+\n"
+    "| 99921-58-10-7 | Divine Comedy        |\n"
+    "| 9971-5-0210-0 | A Tale of Two Cities |\n"
+    "+===============+======================+\n"
+)
+
+
+def write_file(tmpdir, name, content):
+    path = tmpdir.join(name)
+    path.write_binary(content.encode("utf-8"))
+    return str(path)
+
+
+def test_from_csv(tmpdir):
+    path = write_file(tmpdir, "books.csv", (
+        "ISBN,Title\n"
+        "99921-58-10-7,Divine Comedy\n"
+        "\n"
+        "9971-5-0210-0,\"A Tale of Two Cities\"\n"
+    ))
+    table = Table.from_csv(path, terminal_width=80)
+    assert table.headers == ['ISBN', 'Title']
+    assert table.render_to_string() == comparison
+
+
+def test_unicode(tmpdir):
+    path = write_file(tmpdir, "names.csv", u"Name,City\nJos\xe9,K\xf8benhavn\n")
+    table = Table.from_csv(path, terminal_width=80)
+    assert table.headers == [u'Name', u'City']
+    assert u'| Jos\xe9 | K\xf8benhavn |' in table.render_to_string()
+
+
+def test_from_tsv(tmpdir):
+    path = write_file(tmpdir, "books.tsv", (
+        "ISBN\tTitle\n"
+        "99921-58-10-7\tDivine Comedy\n"
+        "9971-5-0210-0\tA Tale of Two Cities\n"
+    ))
+    assert Table.from_tsv(path, terminal_width=80).render_to_string() == comparison
+
+
+def test_given_headers(tmpdir):
+    path = write_file(tmpdir, "books.csv", (
+        "99921-58-10-7,Divine Comedy\n"
+        "9971-5-0210-0,A Tale of Two Cities\n"
+    ))
+    table = Table.from_csv(path, headers=['ISBN', 'Title'], terminal_width=80)
+    assert table.render_to_string() == comparison
+
+
+def test_measures_whole_file(tmpdir):
+    rows = ["%d,%s" % (i, "x" * (i % 7)) for i in range(500)]
+    path = write_file(tmpdir, "wide.csv", "id,value\n" + "\n".join(rows) + "\nlast,the longest value in the file\n")
+    table = Table.from_csv(path, terminal_width=80)
+    lines = table.render_to_string().splitlines()
+    assert len(lines) == 505
+    assert lines[-2] == "| last | the longest value in the file |"
+
+
+def test_fixed_widths_read_once(tmpdir, monkeypatch):
+    path = write_file(tmpdir, "books.csv", "ISBN,Title\n99921-58-10-7,Divine Comedy\n")
+    table = Table.from_csv(path, terminal_width=80)
+    table.column_widths = [13, 20]
+    passes = []
+    reader = CsvFile.reader
+    monkeypatch.setattr(CsvFile, "reader", lambda self, memory: passes.append(1) or reader(self, memory))
+    assert table.render_to_string().splitlines()[3] == "| 99921-58-10-7 | Divine Comedy        |"
+    assert len(passes) == 1
+
+
+def test_rows_are_reread(tmpdir):
+    path = write_file(tmpdir, "books.csv", "a,b\n1,\"two\nlines\"\n3,4\n")
+    rows = CsvFile(path)
+    assert rows.headers == ['a', 'b']
+    assert list(rows) == [['1', 'two\nlines'], ['3', '4']]
+    assert list(rows) == list(rows)
+    assert rows.stats.column_count == 2
+
+
+def test_empty_file(tmpdir):
+    path = write_file(tmpdir, "empty.csv", "")
+    table = Table.from_csv(path, terminal_width=80)
+    assert table.headers == []
+    assert list(table.rows) == []
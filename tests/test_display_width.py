@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import click
+
+from tablebuilder import Table, display_width, wrap_display_line, wrap_line
+
+
+def test_plain():
+    assert display_width("plain text") == 10
+
+
+def test_ansi_and_wide():
+    assert display_width(click.style("red", fg="red")) == 3
+    assert display_width(u"漢字") == 4
+    assert display_width(u"é") == 1
+
+
+def test_wrap_matches_plain_wrap():
+    string = "And Then There Were None Is A Really Long Title"
+    for width in range(1, 30):
+        assert wrap_display_line(string, width) == wrap_line(string, width)
+
+
+def test_wrap_wide():
+    assert wrap_display_line(u"漢字漢字 wide", 6) == [u"漢字漢", u"字", u"wide"]
+
+
+def test_wrap_wide_in_narrow_cell():
+    assert wrap_display_line(u"日", 1) == [u"日"]
+    assert wrap_display_line(u"日本", 1) == [u"日", u"本"]
+    assert wrap_display_line(u"", 1) == [u""]
+
+
+def test_wrap_keeps_color():
+    lines = wrap_display_line("\x1b[31mred text\x1b[0m", 4)
+    assert lines == ["\x1b[31mred\x1b[0m", "\x1b[31mtext\x1b[0m"]
+
+
+def test_colored_table():
+    table = Table(terminal_width=80, headers=['Name', 'Status'])
+    table.rows = [
+        [u'漢字', click.style('ok', fg='green')],
+        ['plain', click.style('failed badly', fg='red')],
+    ]
+    lines = [click.unstyle(line) for line in table.render_lines()]
+    assert lines == [
+        u"+=======+==============+",
+        u"| Name  | Status       |",
+        u"+=======+==============+",
+        u"| 漢字  | ok           |",
+        u"| plain | failed badly |",
+        u"+=======+==============+",
+    ]
+
+
+def test_colored_wrap():
+    table = Table(terminal_width=80, column_widths=[6])
+    table.rows = [[click.style('failed badly', fg='red')]]
+    assert [click.unstyle(line) for line in table.render_lines()] == [
+        "| failed |",
+        "| badly  |",
+        "+========+",
+    ]
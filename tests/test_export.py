@@ -0,0 +1,134 @@
+import json
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from tablebuilder import Table, TableCell, TableSeparator
+from tablebuilder.export import to_markdown
+
+
+def build_table():
+    table = Table(terminal_width=80)
+    table.headers = ['ISBN', 'Title', 'Pages']
+    table.rows = [
+        ['99921-58-10-7', 'Divine Comedy', '928'],
+        TableSeparator(),
+        ['9971-5-0210-0', 'A Tale of "Two", Cities', None],
+        ['960-425-059-0', '<The|Lord>', '1178'],
+    ]
+    return table
+
+
+def test_csv():
+    assert build_table().to_csv() == (
+        'ISBN,Title,Pages\n'
+        '99921-58-10-7,Divine Comedy,928\n'
+        '9971-5-0210-0,"A Tale of ""Two"", Cities",\n'
+        '960-425-059-0,<The|Lord>,1178\n'
+    )
+
+
+def test_csv_unicode():
+    table = Table(terminal_width=80, headers=[u'Nom'])
+    table.rows = [[u'Jos\xe9']]
+    output = table.to_csv()
+    if not isinstance(output, type(u'')):
+        output = output.decode('utf-8')
+    assert output == u'Nom\nJos\xe9\n'
+
+
+def test_tsv():
+    assert build_table().to_tsv().splitlines()[1] == '99921-58-10-7\tDivine Comedy\t928'
+
+
+def test_markdown():
+    assert build_table().to_markdown() == (
+        '| ISBN | Title | Pages |\n'
+        '|---|---|---|\n'
+        '| 99921-58-10-7 | Divine Comedy | 928 |\n'
+        '| 9971-5-0210-0 | A Tale of "Two", Cities |  |\n'
+        '| 960-425-059-0 | <The\\|Lord> | 1178 |\n'
+    )
+
+
+def test_markdown_without_headers():
+    table = Table(terminal_width=80)
+    table.rows = [['a', 'b']]
+    assert table.to_markdown() == '|  |  |\n|---|---|\n| a | b |\n'
+
+
+def test_markdown_pads_headers():
+    table = Table(terminal_width=80, headers=['a'])
+    table.rows = [['1', '2'], ['3']]
+    assert table.to_markdown() == '| a |  |\n|---|---|\n| 1 | 2 |\n| 3 |\n'
+
+
+def test_markdown_streams():
+    def rows():
+        yield ['1', '2']
+        raise AssertionError('read past the first row before writing the header')
+
+    output = StringIO()
+    table = Table(terminal_width=80, headers=['a', 'b'], rows=rows())
+    try:
+        to_markdown(table, output, buffer_size=1)
+    except AssertionError:
+        pass
+    assert output.getvalue().startswith('| a | b |\n|---|---|\n| 1 | 2 |\n')
+
+
+def test_html():
+    assert build_table().to_html() == (
+        '<table>\n'
+        '<thead><tr><th>ISBN</th><th>Title</th><th>Pages</th></tr></thead>\n'
+        '<tbody>\n'
+        '<tr><td>99921-58-10-7</td><td>Divine Comedy</td><td>928</td></tr>\n'
+        '</tbody>\n<tbody>\n'
+        '<tr><td>9971-5-0210-0</td><td>A Tale of &quot;Two&quot;, Cities</td><td></td></tr>\n'
+        '<tr><td>960-425-059-0</td><td>&lt;The|Lord&gt;</td><td>1178</td></tr>\n'
+        '</tbody>\n</table>\n'
+    )
+
+
+def test_jsonl():
+    lines = build_table().to_jsonl().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {'ISBN': '99921-58-10-7', 'Title': 'Divine Comedy', 'Pages': '928'},
+        {'ISBN': '9971-5-0210-0', 'Title': 'A Tale of "Two", Cities', 'Pages': None},
+        {'ISBN': '960-425-059-0', 'Title': '<The|Lord>', 'Pages': '1178'},
+    ]
+
+
+def test_jsonl_extra_cells_and_nan():
+    table = Table(terminal_width=80, headers=['a'])
+    table.rows = [['x', 'y', 'z']]
+    assert json.loads(table.to_jsonl()) == {'a': 'x', '1': 'y', '2': 'z'}
+    table = Table.from_columns({'a': [1.5, float('nan'), float('inf')]}, terminal_width=80)
+    assert table.to_jsonl() == '{"a": 1.5}\n{"a": null}\n{"a": null}\n'
+
+
+def test_export_streams_without_layout():
+    table = Table(terminal_width=80)
+    table.rows = ([str(i), str(i)] for i in range(5))
+    output = StringIO()
+    table.to_csv(output)
+    assert output.getvalue() == ''.join('%d,%d\n' % (i, i) for i in range(5))
+    assert table._layout is None
+
+
+def test_export_columns():
+    table = Table.from_columns({'a': [1, 2], 'b': ['x', None]}, terminal_width=80)
+    assert table.to_csv() == 'a,b\n1,x\n2,\n'
+    assert table.to_jsonl() == '{"a": 1, "b": "x"}\n{"a": 2, "b": null}\n'
+
+
+def test_spanning_cells_keep_their_columns():
+    table = Table(terminal_width=80, headers=['ISBN', 'Title', 'Pages'])
+    table.rows = [[TableCell('Der Things', col_span=2), 'Nobody'], ['1', TableCell('<b>'), '3']]
+    assert table.to_csv().splitlines()[1:] == ['Der Things,,Nobody', '1,<b>,3']
+    assert json.loads(table.to_jsonl().splitlines()[0]) == {'ISBN': 'Der Things', 'Title': None, 'Pages': 'Nobody'}
+    assert table.to_markdown().splitlines()[2] == '| Der Things |  | Nobody |'
+    assert '<tr><td colspan="2">Der Things</td><td>Nobody</td></tr>' in table.to_html()
+    assert '<tr><td>1</td><td>&lt;b&gt;</td><td>3</td></tr>' in table.to_html()
@@ -0,0 +1,140 @@
+import datetime
+from decimal import Decimal
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from tablebuilder import Table, ColumnFormat, resolve_max_width, resolve_min_width
+
+
+def build_table():
+    table = Table(terminal_width=80, headers=['Id', 'Price', 'Sold', 'Note'])
+    table.rows = [
+        [1, Decimal('1234.5'), datetime.date(2024, 1, 2), None],
+        [22, 3.25, None, 'gift wrapped'],
+    ]
+    return table
+
+
+def test_typed_values_without_formats():
+    assert build_table().render_to_string().splitlines()[3:5] == [
+        "| 1  | 1234.5 | 2024-01-02 |              |",
+        "| 22 | 3.25   |            | gift wrapped |",
+    ]
+
+
+def test_formats():
+    table = build_table()
+    table.formats = ['d', ',.2f', ColumnFormat(date_format='%d %b %Y', none='-'), ColumnFormat(none='n/a')]
+    assert table.render_to_string().splitlines()[1:5] == [
+        "| Id |    Price | Sold        | Note         |",
+        "+====+==========+=============+==============+",
+        "|  1 | 1,234.50 | 02 Jan 2024 | n/a          |",
+        "| 22 |     3.25 | -           | gift wrapped |",
+    ]
+
+
+def test_format_compiled_once():
+    column_format = ColumnFormat('.1f', none='?')
+    formatter = column_format.formatter
+    assert column_format.format_column([1, None, 2.25, 'text']) == ['1.0', '?', '2.2', 'text']
+    assert column_format.formatter is formatter
+    assert column_format.align == '>'
+    assert ColumnFormat('s').align is None
+    assert ColumnFormat(',', align='<').align == '<'
+
+
+def test_table_formats_compiled_once():
+    table = Table.from_columns([[1, 2], [0.5, 0.25]], terminal_width=80)
+    table.formats = ['d', '.1f']
+    formatters = table.column_formatters()
+    table.render_to_string()
+    assert table.column_formatters() == formatters
+    assert table.column_format(1) is table.column_format(1)
+    table.formats[1] = '.2f'
+    assert table.column_formatters()[0] is not formatters[0]
+    assert table.column_format(1).spec == '.2f'
+
+
+def test_spec_mismatch_falls_back_to_text():
+    from decimal import Decimal
+    table = Table(terminal_width=80, rows=[[1, 2.5], [Decimal('1.5'), 'x']])
+    table.formats = ['d', 'd']
+    assert table.render_to_string().splitlines()[:2] == ["|   1 | 2.5 |", "| 1.5 |   x |"]
+
+
+def test_column_formats():
+    table = Table.from_columns([[1, 2, 3], [0.5, 0.25, None]], headers=['id', 'ratio'], terminal_width=80)
+    table.formats = [None, ColumnFormat('.0%', none='')]
+    assert table.render_to_string().splitlines()[3:6] == [
+        "| 1  |   50% |",
+        "| 2  |   25% |",
+        "| 3  |       |",
+    ]
+
+
+def test_streamed_formats():
+    table = Table(terminal_width=80)
+    table.formats = ['03d']
+    lines = table.render_to_string(rows=iter([[1, 'a'], [2, 'b']])).splitlines()
+    assert lines == ["| 001 | a |", "| 002 | b |", "+=====+===+"]
+
+
+def test_resolve_typed_widths():
+    rows = [[1, 2.5], [1000, None]]
+    assert resolve_max_width(0, [], rows) == 4
+    assert resolve_min_width(1, [], rows) == 3
+
+
+def build_numbers():
+    table = Table(terminal_width=80, headers=['Count', 'Ratio'])
+    table.rows = [[1000, 3.14159], [2, 0.5]]
+    table.formats = [',d', '.2f']
+    return table
+
+
+numbers = [
+    "+=======+=======+",
+    "| Count | Ratio |",
+    "+=======+=======+",
+    "| 1,000 |  3.14 |",
+    "|     2 |  0.50 |",
+    "+=======+=======+",
+]
+
+
+def test_window_formats():
+    assert list(build_numbers().window_lines(offset=0, limit=2)) == numbers
+    assert list(build_numbers().window_lines(offset=1, limit=1, measure_window=True))[3] == "|     2 |  0.50 |"
+
+
+def test_head_tail_formats():
+    assert list(build_numbers().head_tail_lines(head=1, tail=1)) == numbers
+
+
+def test_redraw_formats():
+    table = build_numbers()
+    table.redraw(StringIO())
+    assert table._frame.lines == numbers
+
+
+def test_live_formats():
+    output = StringIO()
+    table = build_numbers()
+    table.open(output)
+    table.append([3, 1])
+    table.close()
+    assert output.getvalue().splitlines() == numbers[:5] + ["|     3 |  1.00 |", numbers[5]]
+
+
+def test_queue_formats():
+    output = StringIO()
+    table = build_numbers()
+    rows, table.rows = table.rows, []
+    table.column_widths = [5, 5]
+    with table.queue(fp=output) as queue:
+        for row in rows:
+            queue.put(row)
+    assert output.getvalue().splitlines() == numbers
@@ -0,0 +1,55 @@
+from tablebuilder import Table, TableGroup
+
+
+def build_tables():
+    web = Table(terminal_width=80, headers=['Host', 'Load'])
+    web.rows = [['web-1', '0.25'], ['web-2', '0.50']]
+    db = Table(terminal_width=80, headers=['Database', 'Load'])
+    db.rows = [['db-1', '12.75']]
+    return web, db
+
+
+def test_tables_share_widths():
+    assert TableGroup(build_tables()).render_to_string() == (
+        "+==========+=======+\n"
+        "| Host     | Load  |\n"
+        "+==========+=======+\n"
+        "| web-1    | 0.25  |\n"
+        "| web-2    | 0.50  |\n"
+        "+==========+=======+\n"
+        "\n"
+        "+==========+=======+\n"
+        "| Database | Load  |\n"
+        "+==========+=======+\n"
+        "| db-1     | 12.75 |\n"
+        "+==========+=======+\n"
+    )
+
+
+def test_streamed_members():
+    web, db = build_tables()
+    db.rows = iter([['db-1', '12.75'], ['db-2', '1.5']])
+    lines = TableGroup([web, db], spacing=0).render_to_string().splitlines()
+    assert len(lines) == 12
+    assert lines[3] == "| web-1    | 0.25  |"
+    assert lines[10] == "| db-2     | 1.5   |"
+
+
+def test_layout_is_resolved_once(monkeypatch):
+    calls = []
+    original = Table.layout
+
+    def layout(self, *args, **kwargs):
+        calls.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Table, "layout", layout)
+    group = TableGroup()
+    for table in build_tables() * 10:
+        group.add(table)
+    assert len(group.render_to_string().splitlines()) == 10 * 6 + 10 * 5 + 19
+    assert len(calls) == 1
+
+
+def test_empty_group():
+    assert TableGroup().render_to_string() == ""
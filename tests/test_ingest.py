@@ -0,0 +1,98 @@
+import random
+import threading
+
+from pytest import raises
+
+try:
+    from queue import Full
+except ImportError:
+    from Queue import Full
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from tablebuilder import Table
+
+
+def build_table():
+    return Table(headers=['Worker', 'Result'], column_widths=[8, 8])
+
+
+def test_concurrent_producers():
+    output = StringIO()
+
+    def produce(queue, worker):
+        for i in range(100):
+            queue.put(['w%d' % worker, str(i)])
+
+    with build_table().queue(maxsize=10, fp=output) as queue:
+        threads = [threading.Thread(target=produce, args=(queue, worker)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    lines = output.getvalue().splitlines()
+    assert len(lines) == 3 + 400 + 1
+    assert lines[1] == "| Worker   | Result   |"
+    assert sum(1 for line in lines if line.startswith("| w3 ")) == 100
+
+
+def test_ordered():
+    output = StringIO()
+
+    def produce(queue, worker):
+        for sequence in range(worker, 200, 4):
+            queue.put(['row', str(sequence)], sequence)
+
+    with build_table().queue(maxsize=5, ordered=True, start=0, fp=output, batch_size=7) as queue:
+        threads = [threading.Thread(target=produce, args=(queue, worker)) for worker in random.sample(range(4), 4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    results = [line.split("|")[2].strip() for line in output.getvalue().splitlines()[3:-1]]
+    assert results == [str(i) for i in range(200)]
+
+
+def test_ordered_holds_back_rows_too_far_ahead():
+    output = StringIO()
+    with build_table().queue(maxsize=5, ordered=True, start=0, fp=output) as queue:
+        queue.put(['row', '4'], 4, timeout=5)
+        with raises(Full):
+            queue.put(['row', '5'], 5, timeout=0.05)
+        for sequence in range(4):
+            queue.put(['row', str(sequence)], sequence, timeout=5)
+        queue.put(['row', '5'], 5, timeout=5)
+    results = [line.split("|")[2].strip() for line in output.getvalue().splitlines()[3:-1]]
+    assert results == [str(i) for i in range(6)]
+
+
+def test_ordered_needs_sequence():
+    queue = build_table().queue(ordered=True)
+    with raises(ValueError):
+        queue.put(['row', 'x'])
+
+
+def test_existing_rows_are_written_first():
+    table = build_table()
+    table.rows = [['first', 'row']]
+    output = StringIO()
+    with table.queue(fp=output) as queue:
+        queue.put(['second', 'row'])
+    assert output.getvalue().splitlines()[3:5] == ["| first    | row      |", "| second   | row      |"]
+
+
+def test_renderer_errors_are_raised():
+    class Broken(StringIO):
+        def write(self, s):
+            raise IOError("disk full")
+
+    queue = build_table().queue(maxsize=2, fp=Broken())
+    queue.start()
+    for i in range(10):
+        queue.put(['row', str(i)], timeout=5)
+    with raises(IOError):
+        queue.close()
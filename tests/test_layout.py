@@ -0,0 +1,39 @@
+from tablebuilder import Table, TableBorder, TableLayout, TableSeparator
+
+
+def test_separator():
+    layout = TableLayout([3, 5], ["| ", " | ", " |"])
+    assert layout.separator == "+=====+=======+"
+
+
+def test_row_lines():
+    layout = TableLayout([3, 5], ["| ", " | ", " |"], padding_char=".")
+    assert list(layout.row_lines(["ab", "cd ef gh"])) == ["| ab. | cd ef |", "| ... | gh... |"]
+    assert list(layout.row_lines(TableSeparator())) == ["+=====+=======+"]
+
+
+def test_braces():
+    border = TableBorder()
+    border.vertical_char = "}"
+    layout = TableLayout([2, 2], ["{", "}", "{"], padding_char="{", border=border)
+    assert list(layout.row_lines(["a", None])) == ["{a{}{{{"]
+
+
+def test_right_align():
+    layout = TableLayout([4, 4], ["|", "|", "|"], aligns=["<", ">"])
+    assert list(layout.row_lines(["1", "2"])) == ["|1   |   2|"]
+
+
+def test_layout_cached():
+    table = Table(terminal_width=80, headers=['ISBN', 'Title'], rows=[['1', 'One']])
+    layout = table.layout()
+    table.rows.append(['2', 'Two'])
+    assert table.layout() is layout
+    table.padding_char = "."
+    assert table.layout() is not layout
+
+
+def test_column_widths_not_resolved_in_place():
+    table = Table(terminal_width=80, column_widths=[0, None], rows=[['1', 'One']])
+    table.render_to_string()
+    assert table.column_widths == [0, None]
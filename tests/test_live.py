@@ -0,0 +1,47 @@
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from tablebuilder import Table, TableSeparator
+
+
+def test_append_writes_only_new_rows():
+    output = StringIO()
+    table = Table(terminal_width=80, headers=['Job', 'Status'], column_widths=[5, 8])
+    table.open(output)
+    assert output.getvalue() == (
+        "+=======+==========+\n"
+        "| Job   | Status   |\n"
+        "+=======+==========+\n"
+    )
+    table.append(['1', 'running'])
+    table.append(TableSeparator())
+    table.append(['2', 'finished ok'])
+    written = len(output.getvalue())
+    table.append(['3', 'queued'])
+    assert output.getvalue()[written:] == "| 3     | queued   |\n"
+    table.close()
+    assert output.getvalue().splitlines()[3:] == [
+        "| 1     | running  |",
+        "+=======+==========+",
+        "| 2     | finished |",
+        "|       | ok       |",
+        "| 3     | queued   |",
+        "+=======+==========+",
+    ]
+    assert len(table.rows) == 4
+
+
+def test_context_manager():
+    output = []
+
+    def write_line(self, message, style):
+        output.append(message)
+
+    Table.write_line = write_line
+    table = Table(terminal_width=80, headers=['Job'], column_widths=[3])
+    with table:
+        table.append(['1'])
+    table.append(['2'])
+    assert output == ["+=====+", "| Job |", "+=====+", "| 1   |", "+=====+"]
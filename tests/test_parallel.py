@@ -0,0 +1,27 @@
+from tablebuilder import Table, TableSeparator
+
+
+def build_table():
+    table = Table(terminal_width=60, headers=['#', 'Text', 'Other'], column_widths=[0, None, 0])
+    for i in range(2000):
+        if i % 100 == 0:
+            table.rows.append(TableSeparator())
+        table.rows.append([str(i), 'lorem ipsum dolor ' * (i % 7), 'x' * (i % 13)])
+    return table
+
+
+def test_threads_match_serial():
+    table = build_table()
+    assert list(table.parallel_lines(workers=3, chunk_size=64, processes=False)) == list(table.render_lines())
+
+
+def test_processes_match_serial():
+    table = build_table()
+    assert list(table.parallel_lines(workers=2, chunk_size=500)) == list(table.render_lines())
+
+
+def test_streamed_rows():
+    table = build_table()
+    rows = list(table.rows)
+    serial = list(table.render_lines(iter(rows)))
+    assert list(table.parallel_lines(workers=2, chunk_size=64, processes=False, rows=iter(rows))) == serial
@@ -0,0 +1,91 @@
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from tablebuilder import Table, TableCell, TableSeparator, redraw_lines
+
+
+def build_table():
+    table = Table(terminal_width=80)
+    table.headers = ['Host', 'Load']
+    table.rows = [
+        ['web-1', '0.25'],
+        ['web-2', '0.50'],
+        TableSeparator(),
+        ['db-1', '1.75'],
+    ]
+    return table
+
+
+def test_first_frame_writes_everything():
+    table = build_table()
+    output = StringIO()
+    assert table.redraw(output) == 8
+    assert output.getvalue().count("\x1b[K\n") == 8
+    assert "\x1b[8A" not in output.getvalue()
+
+
+def test_only_changed_lines_are_written():
+    table = build_table()
+    table.redraw(StringIO())
+
+    table.rows[1] = ['web-2', '0.75']
+    output = StringIO()
+    assert table.redraw(output) == 1
+    assert output.getvalue() == "\r\x1b[8A\x1b[4B\r| web-2 | 0.75 |\x1b[K\n\x1b[3B"
+
+
+def test_cells_changed_in_place_are_redrawn():
+    table = build_table()
+    cell = TableCell('0.25')
+    table.rows[0] = ['web-1', cell]
+    table.redraw(StringIO())
+
+    cell.value = '9.90'
+    output = StringIO()
+    assert table.redraw(output) == 1
+    assert "| web-1 | 9.90 |" in output.getvalue()
+
+
+def test_unchanged_rows_are_not_reformatted():
+    table = build_table()
+    table.redraw(StringIO())
+    blocks = table._frame.blocks
+
+    table.rows[0] = ['web-1', '0.30']
+    table.redraw(StringIO())
+    assert table._frame.blocks[0] is not blocks[0]
+    assert table._frame.blocks[1] is blocks[1]
+    assert table._frame.blocks[3] is blocks[3]
+
+
+def test_width_change_rewrites_frame():
+    table = build_table()
+    table.redraw(StringIO())
+
+    table.rows[3] = ['db-1', '12.75']
+    output = StringIO()
+    assert table.redraw(output) == 8
+
+
+def test_shorter_frame_clears_the_rest():
+    table = build_table()
+    table.redraw(StringIO())
+
+    del table.rows[3]
+    output = StringIO()
+    assert table.redraw(output) == 1
+    assert output.getvalue().endswith("\x1b[J")
+
+
+def test_full_redraw():
+    table = build_table()
+    table.redraw(StringIO())
+    assert table.redraw(StringIO()) == 0
+    assert table.redraw(StringIO(), full=True) == 8
+
+
+def test_redraw_lines():
+    assert redraw_lines([], ['a', 'b']) == ("\ra\x1b[K\n\rb\x1b[K\n", 2)
+    assert redraw_lines(['a', 'b'], ['a', 'b', 'c']) == ("\r\x1b[2A\x1b[2B\rc\x1b[K\n", 1)
@@ -0,0 +1,77 @@
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from tablebuilder import RenderStats, Table, TableSeparator
+
+
+def build_table():
+    table = Table(terminal_width=40, headers=['ISBN', 'Title'], column_widths=[0, 20])
+    table.rows = [
+        ['99921-58-10-7', 'Divine Comedy'],
+        TableSeparator(),
+        ['80-902734-1-6', 'And Then There Were None Is A Really Long Title'],
+    ]
+    return table
+
+
+def test_counts():
+    finished = []
+    table = build_table()
+    table.render_stats = RenderStats(callback=finished.append)
+    output = table.render_to_string()
+    stats = table.render_stats
+    assert finished == [stats]
+    assert stats.rows == 2
+    assert stats.lines == len(output.splitlines()) == 9
+    assert stats.wrapped_cells == 1
+    assert stats.bytes_written == len(output)
+    assert sorted(stats.phases) == ["format", "resolve", "wrap", "write"]
+
+
+def test_counts_every_render_on_its_own():
+    finished = []
+    table = build_table()
+    table.render_stats = RenderStats(callback=lambda stats: finished.append((stats.rows, stats.lines)))
+    lines = len(table.render_to_string().splitlines())
+    table.render_to_string()
+    assert finished == [(2, lines), (2, lines)]
+    assert table.render_stats.rows == 2
+
+
+def test_counts_bytes():
+    table = Table(terminal_width=40, rows=[[u'\xe9' * 10]])
+    table.render_stats = RenderStats()
+    output = table.render_to_string()
+    assert table.render_stats.bytes_written == len(output.encode('utf-8'))
+    assert table.render_stats.bytes_written == len(output) + 10
+
+
+def test_render_through_write_line():
+    output = []
+
+    def write_line(self, message, style):
+        output.append(message)
+
+    Table.write_line = write_line
+    table = build_table()
+    table.render_stats = RenderStats()
+    table.render()
+    assert table.render_stats.lines == len(output)
+    assert table.render_stats.bytes_written == len("\n".join(output)) + 1
+
+
+def test_disabled_by_default():
+    table = build_table()
+    assert table.render_stats is None
+    assert table.layout().stats is None
+
+
+def test_parallel_with_stats():
+    table = build_table()
+    table.render_stats = RenderStats()
+    serial = table.render_to_string()
+    output = StringIO()
+    table.render_to(output, lines=table.parallel_lines(workers=2, processes=False))
+    assert output.getvalue() == serial
@@ -0,0 +1,61 @@
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from tablebuilder import Table
+
+
+def build_table():
+    table = Table(terminal_width=80)
+    table.headers = ['ISBN', 'Title']
+    table.rows = [
+        ['99921-58-10-7', 'Divine Comedy'],
+        ['9971-5-0210-0', 'A Tale of Two Cities']
+    ]
+    return table
+
+
+comparison = (
+    "+===============+======================+\n"
+    "| ISBN          | Title                |\n"
+    "+===============+======================+\n"
+    "| 99921-58-10-7 | Divine Comedy        |\n"
+    "| 9971-5-0210-0 | A Tale of Two Cities |\n"
+    "+===============+======================+\n"
+)
+
+
+class CountingWriter(StringIO):
+    writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return StringIO.write(self, s)
+
+
+def test_render_lines():
+    table = build_table()
+    assert list(table.render_lines()) == comparison.splitlines()
+
+
+def test_render_to_string():
+    table = build_table()
+    assert table.render_to_string() == comparison
+
+
+def test_render_to_batches_writes():
+    table = build_table()
+    table.rows = table.rows * 100
+    output = CountingWriter()
+    table.render_to(output, buffer_size=4096)
+    assert output.writes == 3
+    assert len(output.getvalue().splitlines()) == 204
+
+
+def test_style_applied_with_color():
+    table = build_table()
+    table.style = {'fg': 'red'}
+    lines = table.render_to_string(color=True).splitlines()
+    assert lines[0] == "\x1b[31m+===============+======================+\x1b[0m"
+    assert table.render_to_string() == comparison
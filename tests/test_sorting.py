@@ -0,0 +1,91 @@
+from tablebuilder import Table, TableSeparator
+
+
+def build_table():
+    table = Table(terminal_width=80, headers=['Host', 'Region', 'Load'])
+    table.rows = [
+        ['web-1', 'eu', '0.25'],
+        ['db-1', 'us', '1.75'],
+        TableSeparator(),
+        ['web-2', 'us', '0.50'],
+        ['db-2', 'eu', '12.00'],
+    ]
+    return table
+
+
+def hosts(table):
+    return [line.split('|')[1].strip() for line in table.render_lines() if line.startswith('|')][1:]
+
+
+def test_sort_by():
+    table = build_table()
+    assert hosts(table.sort_by(0)) == ['db-1', 'db-2', 'web-1', 'web-2']
+    assert hosts(table.sort_by(lambda row: float(row[2]), reverse=True)) == ['db-2', 'db-1', 'web-2', 'web-1']
+    assert len(table.rows) == 5
+
+
+def test_top():
+    table = build_table()
+    assert hosts(table.top(2, key=lambda row: float(row[2]))) == ['db-2', 'db-1']
+    assert hosts(table.top(1, key=lambda row: float(row[2]), largest=False)) == ['web-1']
+
+
+def test_top_is_lazy_and_streams_the_source():
+    reads = []
+
+    def rows():
+        for i in range(1000):
+            reads.append(i)
+            yield ['row %d' % i, str(i * 7 % 1000)]
+
+    table = Table(terminal_width=80)
+    table.rows = rows()
+    top = table.top(3, key=lambda row: int(row[1]))
+    assert reads == []
+    assert top.render_to_string().splitlines() == [
+        "| row 857 | 999 |",
+        "| row 714 | 998 |",
+        "| row 571 | 997 |",
+        "+=========+=====+",
+    ]
+    assert len(reads) == 1000
+
+
+def test_group_by():
+    table = build_table().sort_by(1).group_by(1)
+    lines = table.render_to_string().splitlines()
+    assert lines[3:9] == [
+        "| web-1 | eu     | 0.25  |",
+        "| db-2  | eu     | 12.00 |",
+        "+=======+========+=======+",
+        "| db-1  | us     | 1.75  |",
+        "| web-2 | us     | 0.50  |",
+        "+=======+========+=======+",
+    ]
+
+
+def test_group_by_streams():
+    table = Table(terminal_width=80)
+    table.rows = iter([['a', '1'], ['a', '2'], ['b', '3']])
+    lines = table.group_by(0).render_to_string().splitlines()
+    assert lines == ["| a | 1 |", "| a | 2 |", "+===+===+", "| b | 3 |", "+===+===+"]
+
+
+def test_columns_sort_on_values():
+    table = Table.from_columns({'id': [3, 10, 2], 'name': ['c', 'j', 'b']}, terminal_width=80)
+    assert hosts(table.sort_by(0)) == ['2', '3', '10']
+
+
+def test_derived_settings_are_copied():
+    table = build_table()
+    table.column_widths = [5, 6, 5]
+    table.formats = [None]
+    sorted_table = table.sort_by(1)
+    sorted_table.column_widths.append(3)
+    sorted_table.headers[0] = 'Name'
+    sorted_table.formats.append('.1f')
+    sorted_table.borders.vertical_char = '!'
+    assert table.column_widths == [5, 6, 5]
+    assert table.headers == ['Host', 'Region', 'Load']
+    assert table.formats == [None]
+    assert table.borders.vertical_char == '|'
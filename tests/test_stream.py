@@ -0,0 +1,70 @@
+from tablebuilder import Table, TableSeparator
+
+
+def output_wrapper(output):
+    def write_line(self, message, style):
+        output.append(message)
+
+    return write_line
+
+
+def book_rows():
+    yield ['99921-58-10-7', 'Divine Comedy', 'Dante Alighieri']
+    yield ['9971-5-0210-0', 'A Tale of Two Cities', 'Charles Dickens']
+    yield TableSeparator()
+    yield ['960-425-059-0', 'The Lord of the Rings', 'J. R. R. Tolkien']
+
+
+def test_generator_rows():
+    output = []
+    Table.write_line = output_wrapper(output)
+    table = Table(terminal_width=80, headers=['ISBN', 'Title', 'Author'], rows=book_rows())
+    table.render()
+    comparison = (
+        "+===============+=======================+==================+\n"
+        "| ISBN          | Title                 | Author           |\n"
+        "+===============+=======================+==================+\n"
+        "| 99921-58-10-7 | Divine Comedy         | Dante Alighieri  |\n"
+        "| 9971-5-0210-0 | A Tale of Two Cities  | Charles Dickens  |\n"
+        "+===============+=======================+==================+\n"
+        "| 960-425-059-0 | The Lord of the Rings | J. R. R. Tolkien |\n"
+        "+===============+=======================+==================+"
+    )
+    assert comparison == "\n".join(output)
+
+
+def test_sample_size():
+    output = []
+    Table.write_line = output_wrapper(output)
+    table = Table(terminal_width=80)
+    table.stream(iter([['a', 'b'], ['longer', 'b']]), sample_size=1)
+    assert output == [
+        "| a | b |",
+        "| l | b |",
+        "| o |   |",
+        "| n |   |",
+        "| g |   |",
+        "| e |   |",
+        "| r |   |",
+        "+===+===+",
+    ]
+
+
+def test_fixed_widths_do_not_read_ahead():
+    output = []
+    consumed = []
+
+    def rows():
+        for i in range(1000):
+            consumed.append(i)
+            yield [str(i)]
+
+    def write_line(self, message, style):
+        output.append((len(consumed), message))
+
+    Table.write_line = write_line
+    table = Table(terminal_width=80, column_widths=[5], headers=['Num'])
+    table.stream(rows())
+    assert output[0] == (0, "+=======+")
+    assert output[3] == (1, "| 0     |")
+    assert len(output) == 1004
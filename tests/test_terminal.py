@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+from tablebuilder import Table, terminal
+
+
+def test_import_is_lightweight():
+    code = "import sys, tablebuilder; tablebuilder.Table(); print('click' in sys.modules)"
+    assert subprocess.check_output([sys.executable, "-c", code]).strip() == b"False"
+
+
+def test_terminal_size_is_cached(monkeypatch):
+    queries = []
+
+    def query_terminal_size():
+        queries.append(1)
+        return 100, 40
+
+    monkeypatch.setattr(terminal, "query_terminal_size", query_terminal_size)
+    monkeypatch.setattr(terminal, "terminal_size_cache", None)
+    assert Table().terminal_width == 100
+    assert Table().terminal_width == 100
+    assert len(queries) == 1
+
+
+def test_resize_refreshes_width(monkeypatch):
+    sizes = [(100, 40), (60, 40)]
+    monkeypatch.setattr(terminal, "query_terminal_size", lambda: sizes.pop(0))
+    monkeypatch.setattr(terminal, "terminal_size_cache", None)
+    table = Table()
+    assert table.terminal_width == 100
+    terminal.refresh_terminal_size()
+    assert table.terminal_width == 60
+
+
+def test_given_width_is_kept(monkeypatch):
+    monkeypatch.setattr(terminal, "terminal_size_cache", (100, 40))
+    table = Table(terminal_width=50)
+    assert table.terminal_width == 50
+    table.terminal_width = None
+    assert table.terminal_width == 100
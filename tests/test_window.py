@@ -0,0 +1,107 @@
+from tablebuilder import Table, TableRows
+
+
+def build_table():
+    table = Table(terminal_width=80, headers=['#', 'Name'])
+    table.rows = TableRows([[str(i), 'row ' * (i % 4)] for i in range(1, 101)])
+    return table
+
+
+def test_window():
+    table = build_table()
+    assert list(table.window_lines(offset=10, limit=2)) == [
+        "+=====+==============+",
+        "| #   | Name         |",
+        "+=====+==============+",
+        "| 11  | row row row  |",
+        "| 12  |              |",
+        "+=====+==============+",
+    ]
+
+
+def test_window_measured():
+    table = build_table()
+    assert list(table.window_lines(offset=10, limit=2, measure_window=True))[3:5] == [
+        "| 11 | row row row  |",
+        "| 12 |              |",
+    ]
+
+
+def test_plain_list_window():
+    table = build_table()
+    table.rows = list(table.rows)
+    assert list(table.window_lines(offset=10, limit=2))[3:5] == [
+        "| 11 | row row row  |",
+        "| 12 |              |",
+    ]
+
+
+def test_generator_window():
+    table = build_table()
+    table.rows = iter(table.rows)
+    assert list(table.window_lines(offset=98)) == [
+        "+=====+==============+",
+        "| #   | Name         |",
+        "+=====+==============+",
+        "| 99  | row row row  |",
+        "| 100 |              |",
+        "+=====+==============+",
+    ]
+
+
+def test_head_tail():
+    table = build_table()
+    table.headers = []
+    assert list(table.head_tail_lines(head=1, tail=1)) == [
+        "| 1   | row          |",
+        "| ... | ...          |",
+        "| 100 |              |",
+        "+=====+==============+",
+    ]
+
+
+def test_plain_list_head_tail():
+    table = build_table()
+    table.headers = []
+    table.rows = list(table.rows)
+    assert list(table.head_tail_lines(head=1, tail=1))[0:2] == [
+        "| 1   | row  |",
+        "| ... | ...  |",
+    ]
+
+
+def test_generator_head_tail():
+    table = build_table()
+    table.headers = []
+    table.rows = iter(table.rows)
+    assert list(table.head_tail_lines(head=1, tail=2)) == [
+        "| 1   | row          |",
+        "| ... | ...          |",
+        "| 99  | row row row  |",
+        "| 100 |              |",
+        "+=====+==============+",
+    ]
+
+
+def test_head_tail_without_hidden_rows():
+    table = build_table()
+    table.rows = table.rows[0:3]
+    assert len(list(table.head_tail_lines(head=2, tail=2))) == 7
+
+
+def test_echo_via_pager(monkeypatch):
+    pulled = []
+
+    def echo_via_pager(text_or_generator, color=None):
+        pulled.extend(text_or_generator)
+
+    monkeypatch.setattr('click.echo_via_pager', echo_via_pager)
+    table = build_table()
+    table.echo_via_pager(table.window_lines(limit=1), color=False)
+    assert pulled == [
+        "+=====+==============+\n",
+        "| #   | Name         |\n",
+        "+=====+==============+\n",
+        "| 1   | row          |\n",
+        "+=====+==============+\n",
+    ]
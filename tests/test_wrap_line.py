@@ -0,0 +1,40 @@
+from tablebuilder import Table, truncate_line, wrap_line
+
+
+def truncate_all(string, width):
+    lines = []
+    while string is not None:
+        (line, string) = truncate_line(string, width)
+        lines.append(line)
+    return lines
+
+
+def test_matches_truncate_line():
+    for string in [
+        "This is a simple string",
+        "Sometimes you have to truncate words",
+        "In Liberty we assert",
+        "And Then There Were None Is A Really Long Title",
+        "double  spaces   everywhere and averyveryverylongword in it ",
+    ]:
+        for width in range(1, 30):
+            assert wrap_line(string, width) == truncate_all(string, width)
+
+
+def test_short_string():
+    assert wrap_line("short", 10) == ["short"]
+
+
+def test_max_lines():
+    assert wrap_line("one two three four five", 5, max_lines=2) == ["one", "tw..."]
+    assert wrap_line("one two", 5, max_lines=2) == ["one", "two"]
+
+
+def test_very_long_cell():
+    table = Table(terminal_width=40, column_widths=[20], rows=[["word " * 20000]])
+    assert len(list(table.render_lines())) == 20000 // 4 + 1
+
+
+def test_table_max_lines():
+    table = Table(terminal_width=40, column_widths=[10], rows=[["a b c d e f g h i j k l m n o p"]], max_lines=2)
+    assert list(table.render_lines()) == ["| a b c d e  |", "| f g h i... |", "+============+"]